@@ -1,61 +1,153 @@
 #!/usr/bin/env python3
+import argparse
+import os
 import sys
+import threading
 from pathlib import Path
 
-# Add aaa-tools to path if running standalone
 try:
-    from aaa.engine.semantic import SemanticChecker
-except ImportError:
-    import site
-    site.addsitedir(str(Path(__file__).resolve().parents[4] / "aaa-tools"))
-    from aaa.engine.semantic import SemanticChecker
+    from evals.semantic import import_graph, scheduler
+    from evals.semantic.result_cache import DEFAULT_MAX_ENTRIES, CachedChecker, ResultCache
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from evals.semantic import import_graph, scheduler
+    from evals.semantic.result_cache import DEFAULT_MAX_ENTRIES, CachedChecker, ResultCache
+
+# Heuristic: Identify "UI layers" by directory name
+UI_INDICATORS = ["ui", "frontend", "view", "pages", "components"]
+PRUNED_DIRS = {"__pycache__", "node_modules", "site-packages"}
+
+
+def _is_ui_part(name):
+    name = name.lower()
+    return any(indicator in name for indicator in UI_INDICATORS)
+
+
+def _pruned(name):
+    return name.startswith(".") or "venv" in name.lower() or name in PRUNED_DIRS
+
+
+def iter_python_files(root):
+    """Yield ``(path, is_ui)`` for .py files under root, pruning hidden and virtualenv directories while walking.
+
+    A file is UI-layer when one of its path components below root (directory
+    or file name) contains a UI indicator; the flag is carried down the walk.
+    """
+    ui_dirs = {root: False}
+    for current, dirs, files in os.walk(root):
+        current_ui = ui_dirs.pop(current)
+        dirs[:] = sorted(name for name in dirs if not _pruned(name))
+        for name in dirs:
+            ui_dirs[os.path.join(current, name)] = current_ui or _is_ui_part(name)
+        for name in sorted(files):
+            if name.endswith(".py") and not name.startswith("."):
+                yield Path(current) / name, current_ui or _is_ui_part(name)
+
 
 def main():
     """
     Semantic Check: Clean Architecture Violation (Network/DB calls in UI).
     """
-    checker = SemanticChecker()
-    found_violations = False
-    
-    print("🔍 Scanning for Clean Architecture violations...")
-    
-    # Heuristic: Identify "UI layers" by directory name
-    ui_indicators = ["ui", "frontend", "view", "pages", "components"]
-    
-    # In a real workspace, we'd scan multiple repos. 
-    # For this check, we'll scan the current working directory recursively.
-    # We exclude common virtualenvs or hidden folders.
-    
-    for py_file in Path.cwd().rglob("*.py"):
-        if any(part.startswith(".") for part in py_file.parts):
-            continue
-        if "venv" in str(py_file):
-            continue
-            
-        # Determine if file is in a "UI Layer"
-        is_ui = any(indicator in part.lower() for part in py_file.parts for indicator in ui_indicators)
-        
-        if not is_ui:
-            continue
-            
-        content = py_file.read_text(encoding="utf-8", errors="ignore")
-        
-        # Rule: UI should not import database or network directly
-        # Keywords to filter first (Hybrid Strategy)
-        forbidden_keywords = ["sqlalchemy", "psycopg2", "sqlite3", "requests", "boto3", "pymongo"]
-        
-        result = checker.check(
-            content, 
-            "UI layer must not access database or network directly. Use Service Layer instead.", 
-            keywords=forbidden_keywords
-        )
-        
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--root", default=os.getcwd(), help="Directory to scan (default: current directory)")
+    parser.add_argument("--rules", default=str(scheduler.DEFAULT_PACK), help="Semantic rule pack (JSON)")
+    parser.add_argument("--jobs", type=int, default=8, help="Checker batches evaluated concurrently")
+    parser.add_argument("--batch-size", type=int, default=8, help="Files per checker call when the backend batches")
+    parser.add_argument(
+        "--cost-budget", type=float, default=0, help="Stop starting new evaluations once spent (0: no limit)"
+    )
+    parser.add_argument(
+        "--no-import-graph",
+        action="store_true",
+        help="Send every file to the checker instead of pre-classifying imports",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Evaluate every file, ignoring cached outcomes")
+    parser.add_argument("--cache-ttl-days", type=float, default=30, help="Re-evaluate cached outcomes older than this")
+    parser.add_argument("--cache-max-entries", type=int, default=DEFAULT_MAX_ENTRIES)
+    args = parser.parse_args()
+
+    # Add aaa-tools to path if running standalone
+    try:
+        from aaa.engine.semantic import SemanticChecker
+    except ImportError:
+        import site
+        site.addsitedir(str(Path(__file__).resolve().parents[4] / "aaa-tools"))
+        from aaa.engine.semantic import SemanticChecker
+
+    root = os.path.abspath(args.root)
+    pack = scheduler.load_pack(args.rules)
+    local = threading.local()
+    results = None if args.no_cache else ResultCache(
+        ttl_seconds=args.cache_ttl_days * 24 * 3600, max_entries=args.cache_max_entries
+    )
+    version_probe = None if results is None else CachedChecker(SemanticChecker(), results)
+
+    def is_changed(content, rules):
+        if version_probe is None:
+            return True
+        return not all(version_probe.is_cached(content, rule["rule"], rule["keywords"]) for rule in rules)
+
+    def evaluate(requests):
+        # One checker per worker thread; SemanticChecker is not assumed to be thread-safe.
+        if not hasattr(local, "checker"):
+            local.checker = SemanticChecker() if results is None else CachedChecker(SemanticChecker(), results)
+        return scheduler.evaluate_batch(local.checker, requests)
+
+    print("🔍 Scanning for Clean Architecture violations...", flush=True)
+    python_files = [(str(py_file.relative_to(root)), is_ui) for py_file, is_ui in iter_python_files(root)]
+    graph = None
+    if not args.no_import_graph:
+        graph = import_graph.ImportGraph(root)
+        graph.refresh(rel_path for rel_path, _is_ui in python_files)
+
+    files = []
+    direct = []
+    skipped = 0
+    for rel_path, is_ui in python_files:
+        rules = []
+        for rule in scheduler.rules_for(is_ui, pack):
+            if graph is None or not rule["forbidden_imports"]:
+                rules.append(rule)
+                continue
+            # Files that provably never reach a forbidden module skip the checker;
+            # direct imports are violations without asking it.
+            verdict, chain = graph.classify(rel_path, rule["forbidden_imports"])
+            if verdict == import_graph.DIRECT:
+                direct.append((rel_path, rule, chain[-1]))
+            elif verdict == import_graph.AMBIGUOUS:
+                rules.append(rule)
+            else:
+                skipped += 1
+        if rules:
+            content = (Path(root) / rel_path).read_text(encoding="utf-8", errors="ignore")
+            files.append((rel_path, content, rules))
+    items = scheduler.plan(files, pack, is_changed)
+    changed = sum(1 for item in items if item["changed"])
+    print(
+        f"{len(items)} files to evaluate ({changed} changed); import graph: {skipped} clean, {len(direct)} direct",
+        file=sys.stderr,
+        flush=True,
+    )
+    for rel_path, rule, imported in direct:
+        print(f"❌ Violation in {rel_path} [{rule['id']}]: imports {imported} directly (Cost: 0)", flush=True)
+
+    state = {"done": 0, "violations": len(direct), "cache_hits": 0}
+
+    def on_result(item, rule, result):
+        state["cache_hits"] += 1 if getattr(result, "cached", False) else 0
+        if rule is item["rules"][-1]:
+            state["done"] += 1
+            print(f"[{state['done']}/{len(items)}] {item['path']}", file=sys.stderr, flush=True)
         if not result.passed:
-            rel_path = py_file.relative_to(Path.cwd())
-            print(f"❌ Violation in {rel_path}: {result.reason} (Cost: {result.cost})")
-            found_violations = True
+            print(f"❌ Violation in {item['path']} [{rule['id']}]: {result.reason} (Cost: {result.cost})", flush=True)
+            state["violations"] += 1
+
+    summary = scheduler.run(items, evaluate, on_result, args.cost_budget, args.batch_size, args.jobs)
 
-    if found_violations:
+    print(f"Cost: {summary['spent']:g} (cache hits: {state['cache_hits']})")
+    if summary["budget_exhausted"]:
+        print(f"Budget exhausted: {summary['skipped']} files not evaluated")
+    if state["violations"]:
         print("Result: FAIL")
         sys.exit(1)
     else:
@@ -0,0 +1,179 @@
+"""Import-graph index of a Python tree, built from the AST.
+
+Each module records the modules it imports and whether it imports
+dynamically (``__import__`` / ``importlib.import_module``) or failed to
+parse. Entries are keyed by the file's SHA-256 (with an mtime/size
+shortcut), persisted under the aaa-evals cache directory and updated
+incrementally. ``classify`` answers whether a module imports a forbidden
+module directly, may reach one through in-repo modules or dynamic imports
+(ambiguous), or provably never does (clean).
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    from runner import cache
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from runner import cache
+
+INDEX_VERSION = 1
+CLEAN = "clean"
+DIRECT = "direct"
+AMBIGUOUS = "ambiguous"
+
+
+def module_name(rel_path: str) -> str:
+    parts = list(Path(rel_path).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def parse_imports(source: str, module: str, is_package: bool) -> dict[str, Any]:
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return {"imports": [], "dynamic": False, "parsed": False}
+    package = module if is_package else module.rpartition(".")[0]
+    imports = []
+    dynamic = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                anchor = package.split(".") if package else []
+                anchor = anchor[: len(anchor) - (node.level - 1)] if node.level > 1 else anchor
+                base = ".".join(part for part in anchor + ([base] if base else []) if part)
+            if base:
+                imports.append(base)
+            imports.extend(f"{base}.{alias.name}" if base else alias.name for alias in node.names if alias.name != "*")
+        elif isinstance(node, ast.Call):
+            func = node.func
+            name = func.id if isinstance(func, ast.Name) else func.attr if isinstance(func, ast.Attribute) else ""
+            dynamic = dynamic or name in ("__import__", "import_module")
+    return {"imports": sorted(set(imports)), "dynamic": dynamic, "parsed": True}
+
+
+class ImportGraph:
+    def __init__(self, root: str, store_path: str = ""):
+        self.root = os.path.abspath(root)
+        self.store_path = store_path or cache.cache_dir(
+            "semantic", "imports-" + hashlib.sha256(self.root.encode("utf-8")).hexdigest()[:16] + ".json"
+        )
+        self.files: dict[str, dict[str, Any]] = {}
+        self.parsed = 0
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            if payload.get("version") == INDEX_VERSION and payload.get("root") == self.root:
+                self.files = payload["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+        self._modules: dict[str, list[str]] = {}
+
+    def refresh(self, rel_paths: Iterable[str]) -> None:
+        """Bring the index in line with ``rel_paths`` (every .py file of the tree), re-parsing only changed files."""
+        current = {}
+        dirty = False
+        for rel_path in rel_paths:
+            path = os.path.join(self.root, rel_path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature = [stat.st_mtime_ns, stat.st_size]
+            entry = self.files.get(rel_path)
+            if entry is None or entry["sig"] != signature:
+                with open(path, "rb") as handle:
+                    data = handle.read()
+                digest = hashlib.sha256(data).hexdigest()
+                if entry is None or entry["sha256"] != digest:
+                    module = module_name(rel_path)
+                    source = data.decode("utf-8", errors="ignore")
+                    entry = {"sha256": digest, **parse_imports(source, module, rel_path.endswith("__init__.py"))}
+                    self.parsed += 1
+                entry = {**entry, "sig": signature}
+                dirty = True
+            current[rel_path] = entry
+        dirty = dirty or current.keys() != self.files.keys()
+        self.files = current
+        # Register every dotted suffix so src/-style layouts still resolve; over-matching only
+        # makes the walk more conservative.
+        self._modules = {}
+        for rel_path in self.files:
+            parts = module_name(rel_path).split(".")
+            for start in range(len(parts)):
+                self._modules.setdefault(".".join(parts[start:]), []).append(rel_path)
+        if dirty:
+            self.save()
+
+    def save(self) -> None:
+        payload = {"version": INDEX_VERSION, "root": self.root, "files": self.files}
+        tmp_path = f"{self.store_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.store_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_path, self.store_path)
+        except OSError:  # the index is an optimisation; a read-only cache dir is fine
+            pass
+
+    def _in_repo(self, imported: str) -> list[str]:
+        return self._modules.get(imported, [])
+
+    def classify(self, rel_path: str, forbidden: Iterable[str]) -> tuple[str, list[str]]:
+        """``(verdict, chain)`` for ``rel_path``.
+
+        DIRECT with the forbidden import, AMBIGUOUS with the path that may reach one, or CLEAN.
+        """
+        forbidden = set(forbidden)
+
+        def _forbidden(imported: str) -> bool:
+            return imported.split(".")[0] in forbidden
+
+        entry = self.files.get(rel_path)
+        if entry is None or not entry["parsed"] or entry["dynamic"]:
+            return AMBIGUOUS, [rel_path]
+        direct = [imported for imported in entry["imports"] if _forbidden(imported)]
+        for imported in direct:
+            if not self._in_repo(imported):
+                return DIRECT, [rel_path, imported]
+        if direct:
+            # Shadowed by an in-repo module of the same name; let the checker decide.
+            return AMBIGUOUS, [rel_path, direct[0]]
+
+        parents = {rel_path: ""}
+        queue = deque([rel_path])
+        while queue:
+            current = queue.popleft()
+            current_entry = self.files[current]
+            for imported in current_entry["imports"]:
+                for target in self._in_repo(imported):
+                    if target not in parents:
+                        parents[target] = current
+                        queue.append(target)
+            if current == rel_path:
+                continue
+            reason = ""
+            if not current_entry["parsed"] or current_entry["dynamic"]:
+                reason = "dynamic import" if current_entry["parsed"] else "unparsable"
+            else:
+                reason = next((imported for imported in current_entry["imports"] if _forbidden(imported)), "")
+            if reason:
+                chain = [reason]
+                node = current
+                while node:
+                    chain.append(node)
+                    node = parents[node]
+                return AMBIGUOUS, chain[::-1]
+        return CLEAN, []
@@ -0,0 +1,153 @@
+"""Persistent cache of SemanticChecker outcomes.
+
+Outcomes are keyed by (content SHA-256, rule text, keyword list, checker
+version) and stored in SQLite under the aaa-evals cache directory. Entries
+expire after a TTL and, once the entry limit is exceeded, the least recently
+used ones are evicted in a batch. A cache hit reports zero cost, since nothing was evaluated.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterable
+
+try:
+    from runner import cache
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from runner import cache
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 100_000
+EVICT_BATCH = 64
+
+
+def cache_key(content: str, rule: str, keywords: Iterable[str], checker_version: str) -> str:
+    payload = json.dumps(
+        [hashlib.sha256(content.encode("utf-8")).hexdigest(), rule, list(keywords), checker_version],
+        ensure_ascii=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def checker_version(checker: Any) -> str:
+    """Best-effort version of the checker implementation; part of every cache key."""
+    version = getattr(checker, "VERSION", None) or getattr(checker, "version", None)
+    if version is None:
+        package = sys.modules.get(type(checker).__module__.split(".")[0])
+        version = getattr(package, "__version__", "unknown")
+    return f"{type(checker).__module__}.{type(checker).__qualname__}:{version}"
+
+
+class ResultCache:
+    def __init__(
+        self,
+        path: str = "",
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = path or cache.cache_dir("semantic", "results.sqlite")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, passed INTEGER, reason TEXT, cost REAL, created REAL, accessed REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+        self._db.commit()
+        self._count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            row = self._db.execute("SELECT created FROM results WHERE key = ?", (key,)).fetchone()
+        return row is not None and not (self.ttl_seconds and time.time() - row[0] > self.ttl_seconds)
+
+    def get(self, key: str) -> SimpleNamespace | None:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT passed, reason, created FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if self.ttl_seconds and now - row[2] > self.ttl_seconds:
+                self._count -= self._db.execute("DELETE FROM results WHERE key = ?", (key,)).rowcount
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+            self._db.commit()
+        return SimpleNamespace(passed=bool(row[0]), reason=row[1], cost=0, cached=True)
+
+    def put(self, key: str, result: Any) -> None:
+        now = time.time()
+        values = (int(bool(result.passed)), str(result.reason or ""), float(result.cost or 0), now, now)
+        with self._lock:
+            updated = self._db.execute(
+                "UPDATE results SET passed = ?, reason = ?, cost = ?, created = ?, accessed = ? WHERE key = ?",
+                (*values, key),
+            ).rowcount
+            if not updated:
+                self._db.execute("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)", (key, *values))
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        # Only past the cap: recount (other processes share the file), then drop the overflow plus a batch of
+        # headroom, oldest first, so the following inserts do not evict again.
+        self._count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        excess += min(EVICT_BATCH, self.max_entries // 10)
+        self._count -= self._db.execute(
+            "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed LIMIT ?)", (excess,)
+        ).rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class CachedChecker:
+    """``SemanticChecker``-compatible wrapper that consults a ResultCache first."""
+
+    def __init__(self, checker: Any, results: ResultCache):
+        self.checker = checker
+        self.results = results
+        self.version = checker_version(checker)
+
+    def is_cached(self, content: str, rule: str, keywords: Iterable[str] = ()) -> bool:
+        return self.results.contains(cache_key(content, rule, list(keywords or []), self.version))
+
+    def check(self, content: str, rule: str, keywords: Iterable[str] = ()) -> Any:
+        return self.check_batch([(content, rule, keywords)])[0]
+
+    def check_batch(self, requests: list[tuple[str, str, Iterable[str]]]) -> list[Any]:
+        """Answer hits from the cache and send only the misses to the checker, batched when supported."""
+        keys = [cache_key(content, rule, list(keywords or []), self.version) for content, rule, keywords in requests]
+        results = [self.results.get(key) for key in keys]
+        misses = [index for index, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+        pending = [(requests[index][0], requests[index][1], list(requests[index][2] or [])) for index in misses]
+        if hasattr(self.checker, "check_batch"):
+            fresh = list(self.checker.check_batch(pending))
+        else:
+            fresh = [self.checker.check(content, rule, keywords=keywords) for content, rule, keywords in pending]
+        for index, result in zip(misses, fresh):
+            self.results.put(keys[index], result)
+            results[index] = result
+        return results
@@ -0,0 +1,124 @@
+"""Rule packs and a cost-budgeted scheduler for semantic checks.
+
+A rule pack is a JSON file with ``rules`` (``id``, ``applies_to`` = ``ui`` or
+``all``, ``rule`` text, ``keywords``, optional ``forbidden_imports`` decided
+from the import graph before the checker is consulted) and optional ``path_risk`` entries
+(``pattern`` glob, ``weight``). Each file is read once and evaluated against
+every rule that applies to it. Work items are ordered changed files first,
+then by path risk, and dispatched in batches. With a cost budget, batches
+that contain changed files are dispatched one at a time, so the spend is
+checked before each one and overshoots by at most one batch; once it
+reaches the budget only unchanged files (answered from the result cache at
+no cost) are still dispatched and the remaining files are reported as
+skipped.
+"""
+
+import fnmatch
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+DEFAULT_PACK = Path(__file__).resolve().parent / "rules" / "clean_arch.json"
+
+
+def load_pack(path: Any = DEFAULT_PACK) -> dict[str, Any]:
+    pack = json.loads(Path(path).read_text(encoding="utf-8"))
+    pack.setdefault("path_risk", [])
+    for rule in pack["rules"]:
+        rule.setdefault("applies_to", "all")
+        rule.setdefault("keywords", [])
+        rule.setdefault("forbidden_imports", [])
+    return pack
+
+
+def path_risk(rel_path: str, pack: dict[str, Any]) -> float:
+    return sum(entry["weight"] for entry in pack["path_risk"] if fnmatch.fnmatch("/" + rel_path, entry["pattern"]))
+
+
+def rules_for(is_ui: bool, pack: dict[str, Any]) -> list[dict[str, Any]]:
+    return [rule for rule in pack["rules"] if rule["applies_to"] == "all" or (is_ui and rule["applies_to"] == "ui")]
+
+
+def plan(
+    files: Iterable[tuple[str, str, list[dict[str, Any]]]],
+    pack: dict[str, Any],
+    is_changed: Callable[[str, list[dict[str, Any]]], bool],
+) -> list[dict[str, Any]]:
+    """Order ``(rel_path, content, rules)`` work items: changed files first, then riskier paths."""
+    items = [
+        {
+            "path": rel_path,
+            "content": content,
+            "rules": rules,
+            "changed": is_changed(content, rules),
+            "risk": path_risk(rel_path, pack),
+        }
+        for rel_path, content, rules in files
+        if rules
+    ]
+    items.sort(key=lambda item: (not item["changed"], -item["risk"], item["path"]))
+    return items
+
+
+def evaluate_batch(checker: Any, requests: list[tuple[str, str, list[str]]]) -> list[Any]:
+    """One ``check_batch`` call when the checker supports it, otherwise one ``check`` per request."""
+    if hasattr(checker, "check_batch"):
+        return list(checker.check_batch(requests))
+    return [checker.check(content, rule, keywords=keywords) for content, rule, keywords in requests]
+
+
+def run(
+    items: list[dict[str, Any]],
+    evaluate: Callable[[list[tuple[str, str, list[str]]]], list[Any]],
+    on_result: Callable[[dict[str, Any], dict[str, Any], Any], None],
+    cost_budget: float = 0,
+    batch_size: int = 8,
+    jobs: int = 4,
+) -> dict[str, Any]:
+    """Evaluate ``items`` in batches until done or ``cost_budget`` (0: unlimited) is spent."""
+    batches = [items[index : index + max(1, batch_size)] for index in range(0, len(items), max(1, batch_size))]
+    spent = 0.0
+    evaluated = 0
+    pending: dict[Any, list[dict[str, Any]]] = {}
+    metered_in_flight = False
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        queue = iter(batches)
+        held = None
+        while True:
+            while len(pending) < max(1, jobs):
+                batch, held = (held if held is not None else next(queue, None)), None
+                if batch is None:
+                    break
+                metered = bool(cost_budget) and any(item["changed"] for item in batch)
+                if metered and spent >= cost_budget:
+                    # Over budget: only batches answered entirely from the result cache are free.
+                    continue
+                if metered and metered_in_flight:
+                    held = batch  # wait for the in-flight batch's cost before spending more
+                    break
+                metered_in_flight = metered_in_flight or metered
+                requests = [
+                    (item["content"], rule["rule"], rule["keywords"]) for item in batch for rule in item["rules"]
+                ]
+                pending[pool.submit(evaluate, requests)] = batch
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = pending.pop(future)
+                if cost_budget and any(item["changed"] for item in batch):
+                    metered_in_flight = False
+                results = iter(future.result())
+                for item in batch:
+                    for rule in item["rules"]:
+                        result = next(results)
+                        spent += result.cost or 0
+                        on_result(item, rule, result)
+                    evaluated += 1
+    return {
+        "evaluated": evaluated,
+        "skipped": len(items) - evaluated,
+        "spent": spent,
+        "budget_exhausted": evaluated < len(items),
+    }
@@ -0,0 +1,139 @@
+"""Model backends for eval runners.
+
+A backend is a dict ``{"id", "model", "batch_size", "complete"}`` where
+``complete(prompts, params)`` is a coroutine returning one output string per
+prompt. ``create`` builds one from a ``--backend`` spec:
+
+- ``http:URL`` POSTs ``{"model", "prompt", "params"}`` and reads ``output``
+  from the JSON response; with ``batch_size > 1`` it POSTs ``prompts`` and
+  reads ``outputs`` instead.
+- ``cmd:COMMAND`` runs the command once per prompt with the prompt on stdin
+  and takes its stdout as the output.
+- ``stub`` answers from a ``{prompt: output}`` responses file and echoes the
+  prompt otherwise, with a fixed simulated latency, so runs are deterministic.
+
+Failed calls raise RuntimeError; runners report them per case.
+"""
+
+import asyncio
+import json
+import os
+import shlex
+import urllib.request
+from typing import Any
+
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+
+def parse_params(items: list[str]) -> dict[str, Any]:
+    """``["temperature=0", "max_tokens=64"]`` -> dict; values are JSON when they parse, strings otherwise."""
+    params: dict[str, Any] = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise ValueError(f"invalid param {item!r}: expected KEY=VALUE")
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    return params
+
+
+def _post(url: str, payload: dict[str, Any], timeout: float) -> dict[str, Any]:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    token = os.environ.get("AAA_EVALS_BACKEND_TOKEN")
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())
+    except (OSError, ValueError) as exc:
+        raise RuntimeError(f"{url}: {exc}") from exc
+
+
+def _http(url: str, model: str, batch_size: int, timeout: float) -> dict[str, Any]:
+    async def complete(prompts: list[str], params: dict[str, Any]) -> list[str]:
+        if batch_size > 1:
+            payload = {"model": model, "prompts": prompts, "params": params}
+            outputs = (await asyncio.to_thread(_post, url, payload, timeout)).get("outputs")
+            if not isinstance(outputs, list) or len(outputs) != len(prompts):
+                raise RuntimeError(f"{url}: expected {len(prompts)} outputs")
+            return [str(output) for output in outputs]
+        payload = {"model": model, "prompt": prompts[0], "params": params}
+        output = (await asyncio.to_thread(_post, url, payload, timeout)).get("output")
+        if output is None:
+            raise RuntimeError(f"{url}: response has no output")
+        return [str(output)]
+
+    return {"id": f"http:{url}", "model": model, "batch_size": max(1, batch_size), "complete": complete}
+
+
+def _command(command: str, model: str, timeout: float) -> dict[str, Any]:
+    argv = shlex.split(command)
+    if not argv:
+        raise ValueError("cmd backend needs a command")
+    env = {**os.environ, "AAA_EVALS_MODEL": model}
+
+    async def run_one(prompt: str, params: dict[str, Any]) -> str:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={**env, "AAA_EVALS_PARAMS": json.dumps(params, sort_keys=True)},
+            )
+        except OSError as exc:
+            raise RuntimeError(f"{argv[0]}: {exc}") from exc
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(prompt.encode("utf-8")), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise RuntimeError(f"{argv[0]}: timed out after {timeout:g}s") from None
+        if process.returncode != 0:
+            message = stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"{argv[0]}: exit {process.returncode}: {message}")
+        return stdout.decode("utf-8", errors="replace")
+
+    async def complete(prompts: list[str], params: dict[str, Any]) -> list[str]:
+        return [await run_one(prompt, params) for prompt in prompts]
+
+    return {"id": f"cmd:{command}", "model": model, "batch_size": 1, "complete": complete}
+
+
+def _stub(responses_path: str, model: str, batch_size: int, latency_ms: float) -> dict[str, Any]:
+    responses: dict[str, str] = {}
+    if responses_path:
+        with open(responses_path, "r", encoding="utf-8") as handle:
+            responses = json.load(handle)
+
+    async def complete(prompts: list[str], params: dict[str, Any]) -> list[str]:
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000.0)
+        return [responses.get(prompt, prompt) for prompt in prompts]
+
+    return {"id": "stub", "model": model or "stub", "batch_size": max(1, batch_size), "complete": complete}
+
+
+def create(
+    spec: str,
+    model: str = "",
+    batch_size: int = 1,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    stub_responses: str = "",
+    stub_latency_ms: float = 0.0,
+) -> dict[str, Any]:
+    kind, _sep, target = spec.partition(":")
+    if kind == "http" and target:
+        return _http(target, model, batch_size, timeout)
+    if kind == "cmd" and target:
+        return _command(target, model, timeout)
+    if kind == "stub":
+        return _stub(stub_responses, model, batch_size, stub_latency_ms)
+    raise ValueError(f"invalid backend {spec!r}: expected http:URL, cmd:COMMAND or stub")
@@ -0,0 +1,189 @@
+"""Latency and resource budgets recorded next to a check's baseline.
+
+A baseline may declare ``budgets`` (``wall_ms_median``, ``wall_ms_p95``,
+``peak_rss_mb``, ``subprocesses`` and an optional ``tolerance`` fraction).
+Recording stores the measured values and the pass/fail outcome under
+``measured``; comparing fails when the run no longer passes or a metric
+exceeds its budget (or, without a budget, the recorded value) by more than
+the tolerance.
+
+Every measured run is a fresh interpreter (``python -m runner.budgets``)
+with an empty ``$AAA_EVALS_CACHE_DIR``, so neither in-process memoization
+nor persistent caches from an earlier run make the numbers look warm.
+"""
+
+import importlib
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+METRICS = ("wall_ms_median", "wall_ms_p95", "peak_rss_mb", "subprocesses")
+DEFAULT_TOLERANCE = 0.1
+# Absolute slack on wall-time limits so sub-millisecond checks do not fail on timer noise.
+WALL_SLACK_MS = 5.0
+# Popen audits once whether it forks or posix_spawns; os.spawn* and pty go through os.fork/os.forkpty.
+SPAWN_EVENTS = {"subprocess.Popen", "os.system", "os.fork", "os.forkpty"}
+
+_lock = threading.Lock()
+_spawned = 0
+_hook_installed = False
+
+
+def _audit(event: str, _args: Any) -> None:
+    global _spawned
+    if event in SPAWN_EVENTS:
+        with _lock:
+            _spawned += 1
+
+
+def spawn_count() -> int:
+    """Processes spawned by this interpreter since the counter was installed."""
+    global _hook_installed
+    with _lock:
+        if not _hook_installed:
+            # Audit hooks cannot be removed; the hook only bumps a counter.
+            sys.addaudithook(_audit)
+            _hook_installed = True
+        return _spawned
+
+
+def _rss_mb(maxrss: int) -> float:
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KiB elsewhere
+    return round(maxrss * scale / (1024 * 1024), 1)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def _run_fresh(target: str, payload: dict[str, Any], env: dict[str, str]) -> tuple[dict[str, Any], float, float, int]:
+    with tempfile.TemporaryDirectory(prefix="aaa-budgets-") as tmp:
+        report_path = os.path.join(tmp, "report.json")
+        child_env = {
+            **env,
+            "AAA_EVALS_CACHE_DIR": os.path.join(tmp, "cache"),
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH", "")])),
+        }
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "runner.budgets", target, report_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            env=child_env,
+        )
+        with process.stdin:
+            process.stdin.write(json.dumps(payload, ensure_ascii=True).encode("utf-8"))
+        # wait4 rather than Popen.wait: the child's own rusage, not every child this process ever reaped.
+        _pid, status, usage = os.wait4(process.pid, 0)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        process.returncode = os.waitstatus_to_exitcode(status)
+        try:
+            with open(report_path, "r", encoding="utf-8") as handle:
+                report = json.load(handle)
+        except (OSError, ValueError):
+            raise RuntimeError(f"measured run of {target} failed with exit code {process.returncode}") from None
+    return report["output"], elapsed_ms, _rss_mb(usage.ru_maxrss), report["subprocesses"]
+
+
+def measure(
+    target: str, payload: dict[str, Any], repeat: int = 5, env: dict[str, str] | None = None
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Call ``target`` ("module:function") with ``payload`` in ``repeat`` fresh interpreters.
+
+    Returns the last run's output and the measured metrics.
+    """
+    durations = []
+    peaks = []
+    spawned = []
+    output: dict[str, Any] = {}
+    child_env = dict(os.environ if env is None else env)
+    for _ in range(max(1, repeat)):
+        output, elapsed_ms, peak_mb, subprocesses = _run_fresh(target, payload, child_env)
+        durations.append(elapsed_ms)
+        peaks.append(peak_mb)
+        spawned.append(subprocesses)
+    measured = {
+        "wall_ms_median": round(statistics.median(durations), 3),
+        "wall_ms_p95": round(percentile(durations, 0.95), 3),
+        "peak_rss_mb": max(peaks),
+        "subprocesses": max(spawned),
+        "runs": len(durations),
+    }
+    return output, measured
+
+
+def load(path: str) -> dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {}
+
+
+def expects_pass(baseline: dict[str, Any]) -> bool | None:
+    if "pass" in baseline:
+        return bool(baseline["pass"])
+    if "pass_rate" in baseline:
+        return baseline["pass_rate"] >= 1.0
+    measured = baseline.get("measured") or {}
+    return measured.get("pass")
+
+
+def record(path: str, passed: bool, measured: dict[str, Any]) -> dict[str, Any]:
+    """Store the measured values and pass/fail next to the baseline's existing keys."""
+    baseline = load(path)
+    baseline["measured"] = {"pass": passed, **measured}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        handle.write(json.dumps(baseline, ensure_ascii=True) + "\n")
+    os.replace(tmp_path, path)
+    return baseline
+
+
+def compare(
+    baseline: dict[str, Any], passed: bool, measured: dict[str, Any], tolerance: float | None = None
+) -> list[str]:
+    """Regressions of this run against the baseline; empty when within budget."""
+    budgets = baseline.get("budgets") or {}
+    recorded = baseline.get("measured") or {}
+    if tolerance is None:
+        tolerance = budgets.get("tolerance", DEFAULT_TOLERANCE)
+    regressions = []
+    if expects_pass(baseline) and not passed:
+        regressions.append("pass: baseline passes, run failed")
+    for metric in METRICS:
+        limit = budgets.get(metric, recorded.get(metric))
+        value = measured.get(metric)
+        if limit is None or value is None:
+            continue
+        slack = WALL_SLACK_MS if metric.startswith("wall_ms") else 0
+        if value > limit * (1 + tolerance) + slack:
+            source = "budget" if metric in budgets else "recorded"
+            regressions.append(f"{metric}: {value:g} exceeds {source} {limit:g} (+{tolerance:.0%})")
+    return regressions
+
+
+def main() -> int:
+    """Child side of ``measure``: ``python -m runner.budgets TARGET REPORT`` with the JSON payload on stdin."""
+    target, report_path = sys.argv[1:3]
+    payload = json.load(sys.stdin)
+    spawn_count()
+    module_name, _, func_name = target.partition(":")
+    output = getattr(importlib.import_module(module_name), func_name)(payload)
+    with open(report_path, "w", encoding="utf-8") as handle:
+        json.dump({"output": output, "subprocesses": spawn_count()}, handle, ensure_ascii=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
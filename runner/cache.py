@@ -0,0 +1,74 @@
+"""In-process caches for file contents and compiled JSON schema validators.
+
+Entries are keyed by the file's (mtime_ns, size) signature, so edits are
+picked up without explicit invalidation. This matters most in the daemon,
+where the same documents are read for many requests.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+MAX_ENTRIES = 1024
+
+_lock = threading.Lock()
+_entries: "OrderedDict[tuple[str, str], tuple[tuple[int, int], Any]]" = OrderedDict()
+
+
+def _signature(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def memoize_file(kind: str, path: str, build: Callable[[str], Any]) -> Any:
+    """Return ``build(path)``, reusing the previous result while the file is unchanged."""
+    path = os.path.abspath(path)
+    signature = _signature(path)
+    key = (kind, path)
+    with _lock:
+        cached = _entries.get(key)
+        if cached is not None and cached[0] == signature:
+            _entries.move_to_end(key)
+            return cached[1]
+    value = build(path)
+    with _lock:
+        _entries[key] = (signature, value)
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+    return value
+
+
+def _read(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as handle:
+        return handle.read()
+
+
+def read_text(path: Any) -> str:
+    return memoize_file("text", str(path), _read)
+
+
+def _build_validator(path: str) -> Any:
+    from jsonschema import Draft202012Validator
+
+    return Draft202012Validator(json.loads(_read(path)))
+
+
+def compiled_validator(schema_path: Any) -> Any:
+    """Compiled Draft 2020-12 validator for a schema file; raises ImportError without jsonschema."""
+    return memoize_file("validator", str(schema_path), _build_validator)
+
+
+def cache_dir(*parts: str) -> str:
+    """Directory for caches persisted between runs ($AAA_EVALS_CACHE_DIR or the XDG cache home)."""
+    base = os.environ.get("AAA_EVALS_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "aaa-evals"
+    )
+    return os.path.join(base, *parts)
+
+
+def clear() -> None:
+    with _lock:
+        _entries.clear()
@@ -1,42 +1,14 @@
 import json
-import os
-import shlex
-import shutil
 import subprocess
-import sys
 from pathlib import Path
 from typing import Any
 
-
-def _resolve_aaa_tools_command(repo_root: Path) -> tuple[list[str] | None, dict[str, str]]:
-    env = os.environ.copy()
-    override = env.get("AAA_TOOLS_CMD")
-    if override:
-        return shlex.split(override), env
-
-    aaa_cmd = shutil.which("aaa")
-    if aaa_cmd:
-        return [aaa_cmd], env
-
-    tools_root = env.get("AAA_TOOLS_ROOT")
-    if not tools_root:
-        for parent in [repo_root.parent, *repo_root.parents]:
-            candidate = parent / "aaa-tools"
-            if candidate.is_dir():
-                tools_root = str(candidate)
-                break
-
-    if tools_root:
-        pythonpath = env.get("PYTHONPATH")
-        env["PYTHONPATH"] = f"{tools_root}{os.pathsep}{pythonpath}" if pythonpath else tools_root
-        return [sys.executable, "-m", "aaa.cli"], env
-
-    return None, env
+from runner import preflight, tracing
 
 
 def _run_runbook(repo_root: Path, runbook_path: str) -> dict[str, Any]:
-    base_cmd, env = _resolve_aaa_tools_command(repo_root)
-    if base_cmd is None:
+    aaa = preflight.tool("aaa", repo_root)
+    if aaa["argv"] is None:
         return {
             "status": "error",
             "error_code": "TOOL_NOT_AVAILABLE",
@@ -45,21 +17,22 @@ def _run_runbook(repo_root: Path, runbook_path: str) -> dict[str, Any]:
         }
 
     command = [
-        *base_cmd,
+        *aaa["argv"],
         "run",
         "runbook",
         "--runbook-file",
         runbook_path,
         "--json",
     ]
-    result = subprocess.run(
-        command,
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        check=False,
-        env=env,
-    )
+    with tracing.span("aaa run runbook", cat="subprocess", runbook=runbook_path):
+        result = subprocess.run(
+            command,
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
+            env=aaa["env"],
+        )
     stdout = result.stdout.strip()
     if not stdout:
         stderr = result.stderr.strip()
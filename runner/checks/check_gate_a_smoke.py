@@ -3,19 +3,26 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from runner import preflight, tracing
+
 
 def _load_plan(plan_path: Path) -> dict[str, Any]:
     return json.loads(plan_path.read_text(encoding="utf-8"))
 
 
-def _list_tags(repo: str) -> set[str]:
+def _list_tags(git: dict[str, Any], repo: str) -> set[str]:
+    if git["argv"] is None:
+        raise RuntimeError("git not installed")
     url = f"https://github.com/{repo}.git"
-    result = subprocess.run(
-        ["git", "ls-remote", "--tags", url],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    with tracing.span("git ls-remote", cat="subprocess", repo=repo):
+        # The preflight env disables git's credential prompt, which would otherwise hang on a private repo.
+        result = subprocess.run(
+            [*git["argv"], "ls-remote", "--tags", url],
+            capture_output=True,
+            text=True,
+            check=False,
+            env=git["env"],
+        )
     if result.returncode != 0:
         raise RuntimeError(result.stderr.strip() or "git ls-remote failed")
     tags = set()
@@ -61,10 +68,11 @@ def check_gate_a_smoke(case: dict[str, Any], repo_root: Path) -> dict[str, Any]:
             "details": [{"type": "missing_version_tag", "path": str(resolved_plan)}],
         }
 
+    git = preflight.tool("git")
     details: list[dict[str, Any]] = []
     for repo in template_repos:
         try:
-            tags = _list_tags(repo)
+            tags = _list_tags(git, repo)
         except RuntimeError as exc:
             details.append(
                 {
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import bisect
 import fnmatch
 import json
+import posixpath
+import sys
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
+
+try:
+    from runner import walk
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from runner import walk
 
 DEFAULT_EXCLUDES = [
     "**/README.md",
@@ -42,6 +52,27 @@ def _iter_target_dirs(root: Path, patterns: Iterable[str]) -> list[Path]:
     return sorted(dirs)
 
 
+def _target_dirs_from_files(root: Path, files: Iterable[str], patterns: Iterable[str]) -> list[Path]:
+    """Target directories among the parents of ``files`` (repo-relative, e.g. from the git index)."""
+    parents: set[str] = set()
+    for rel_path in files:
+        parent = posixpath.dirname(rel_path)
+        while parent and parent not in parents:
+            parents.add(parent)
+            parent = posixpath.dirname(parent)
+    dirs: set[Path] = set()
+    for pattern in patterns:
+        if not pattern:
+            continue
+        candidate = Path(pattern)
+        if candidate.is_absolute() and not _has_glob(pattern):
+            if candidate.is_dir():
+                dirs.add(candidate)
+            continue
+        dirs.update(root / parent for parent in parents if walk.glob_match(pattern, parent))
+    return sorted(dirs)
+
+
 def _expected_paths(index_path: Path) -> set[str]:
     payload = json.loads(index_path.read_text(encoding="utf-8"))
     expected: set[str] = set()
@@ -62,7 +93,33 @@ def _actual_paths(directory: Path, file_pattern: str, excludes: list[str]) -> se
     return actual
 
 
-def check_orphaned_assets(config: dict[str, Any]) -> dict[str, Any]:
+def _actual_paths_from_files(
+    root: Path, directory: Path, files: list[str], file_pattern: str, excludes: list[str]
+) -> set[str]:
+    """Like ``_actual_paths`` over the sorted repo-relative ``files`` below ``directory``."""
+    actual: set[str] = set()
+    try:
+        prefix = directory.relative_to(root).as_posix() + "/"
+    except ValueError:
+        return actual
+    for rel_path in islice(files, bisect.bisect_left(files, prefix), None):
+        if not rel_path.startswith(prefix):
+            break
+        if not fnmatch.fnmatch(posixpath.basename(rel_path), file_pattern):
+            continue
+        rel = rel_path[len(prefix):]
+        if _match_any(rel, excludes) or _match_any((root / rel_path).as_posix(), excludes):
+            continue
+        actual.add(rel)
+    return actual
+
+
+def iter_orphaned_assets(config: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield orphaned-asset details one directory at a time.
+
+    ``files`` (repo-relative paths, e.g. from the git index) replaces the
+    filesystem walk when given.
+    """
     root = Path(config.get("repo_root", Path.cwd()))
     targets = config.get("target_paths", DEFAULT_TARGETS)
     excludes = config.get("exclude_patterns", DEFAULT_EXCLUDES)
@@ -70,36 +127,42 @@ def check_orphaned_assets(config: dict[str, Any]) -> dict[str, Any]:
     require_index = config.get("require_index", True)
     allow_empty = config.get("allow_empty", False)
 
-    details: list[dict[str, Any]] = []
-    target_dirs = _iter_target_dirs(root, targets)
+    files = config.get("files")
+    if files is None:
+        target_dirs = _iter_target_dirs(root, targets)
+    else:
+        files = sorted(files)
+        target_dirs = _target_dirs_from_files(root, files, targets)
 
     for directory in target_dirs:
         if _match_any(directory.as_posix(), excludes):
             continue
         index_path = directory / "index.json"
         if require_index and not index_path.exists():
-            details.append(
-                {
-                    "type": "missing_index",
-                    "path": str(index_path),
-                    "suggested_fix": "Run `aaa run ops/reindex-all-assets` to update index.json",
-                }
-            )
+            yield {
+                "type": "missing_index",
+                "path": str(index_path),
+                "suggested_fix": "Run `aaa run ops/reindex-all-assets` to update index.json",
+            }
             continue
 
         expected = _expected_paths(index_path) if index_path.exists() else set()
-        actual = _actual_paths(directory, file_pattern, excludes)
+        if files is None:
+            actual = _actual_paths(directory, file_pattern, excludes)
+        else:
+            actual = _actual_paths_from_files(root, directory, files, file_pattern, excludes)
 
         if not actual and not expected and allow_empty:
             continue
 
         for orphan in sorted(actual - expected):
-            details.append(
-                {
-                    "type": "orphaned_asset",
-                    "path": str(directory / orphan),
-                    "suggested_fix": "Run `aaa run ops/reindex-all-assets` to update index.json",
-                }
-            )
+            yield {
+                "type": "orphaned_asset",
+                "path": str(directory / orphan),
+                "suggested_fix": "Run `aaa run ops/reindex-all-assets` to update index.json",
+            }
+
 
+def check_orphaned_assets(config: dict[str, Any]) -> dict[str, Any]:
+    details = list(iter_orphaned_assets(config))
     return {"pass": not details, "details": details}
@@ -1,6 +1,22 @@
+import hashlib
+import json
+import os
+import signal
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+
+from runner import cache, preflight, tracing
+
+DEFAULT_TIMEOUT_SECONDS = 900
+OUTPUT_TAIL_LINES = 200
+# Byte bound on the kept output, so a single huge (or "\r"-only) line cannot grow it.
+OUTPUT_TAIL_BYTES = 64 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+DEFAULT_JOBS = 4
 
 
 def _resolve_script(repo_path: str, script_path: str) -> Path | None:
@@ -18,7 +34,165 @@ def _resolve_script(repo_path: str, script_path: str) -> Path | None:
     return None
 
 
-def check_release_integrity(repo_path: str, tag: str, script_path: str = "") -> tuple[bool, list[str]]:
+def _resolve_tag_commit(tag: str, search_dirs: list[Path]) -> str:
+    """Commit SHA the tag points at, looked up in the script's repo first; "" when unresolved."""
+    git = preflight.tool("git")
+    if git["argv"] is None:
+        return ""
+    for directory in search_dirs:
+        if not directory.is_dir():
+            continue
+        result = subprocess.run(
+            [*git["argv"], "-C", str(directory), "rev-parse", "--verify", "--quiet", f"refs/tags/{tag}^{{commit}}"],
+            capture_output=True,
+            text=True,
+            check=False,
+            env=git["env"],
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    return ""
+
+
+def _expand_tags(spec: str, search_dirs: list[Path]) -> list[str]:
+    """``v1``, ``v1,v2`` or an inclusive ``v1..v3`` range over the version-sorted tags of the script's repo."""
+    if ".." not in spec:
+        return [tag.strip() for tag in spec.split(",") if tag.strip()]
+    start, end = (part.strip() for part in spec.split("..", 1))
+    git = preflight.tool("git")
+    if git["argv"] is None:
+        return []
+    for directory in search_dirs:
+        if not directory.is_dir():
+            continue
+        result = subprocess.run(
+            [*git["argv"], "-C", str(directory), "tag", "--list", "--sort=v:refname"],
+            capture_output=True,
+            text=True,
+            check=False,
+            env=git["env"],
+        )
+        tags = result.stdout.split() if result.returncode == 0 else []
+        if start in tags and end in tags and tags.index(start) <= tags.index(end):
+            return tags[tags.index(start) : tags.index(end) + 1]
+    return []
+
+
+def _cache_path(tag: str, commit: str, script_hash: str) -> str:
+    key = hashlib.sha256(f"{tag}\0{commit}\0{script_hash}".encode("utf-8")).hexdigest()
+    return cache.cache_dir("release-integrity", f"{key}.json")
+
+
+def _is_verified(path: str) -> bool:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle).get("pass") is True
+    except (OSError, ValueError):
+        return False
+
+
+def _record_verified(path: str, tag: str, commit: str, script_hash: str) -> None:
+    payload = {"pass": True, "tag": tag, "commit": commit, "script_sha256": script_hash, "verified_at": time.time()}
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, path)
+    except OSError:  # caching is best effort
+        pass
+
+
+def _run_verify(script: Path, tag: str, timeout: float) -> tuple[int | None, str]:
+    """Run the verify script in a private temp working directory.
+
+    Only the last OUTPUT_TAIL_LINES lines of combined output are kept.
+    Returns ``(None, tail)`` when the script is killed after ``timeout`` seconds.
+    """
+    bash = preflight.tool("bash")
+    if bash["argv"] is None:
+        return 127, "bash not installed"
+    with tempfile.TemporaryDirectory(prefix="release-verify-") as workdir:
+        return _stream([*bash["argv"], str(script.resolve()), tag], workdir, timeout, bash["env"])
+
+
+def _stream(argv: list[str], workdir: str, timeout: float, env: dict[str, str]) -> tuple[int | None, str]:
+    # A new session makes the script the leader of its own process group, so
+    # the timeout also kills the children that keep the output pipe open.
+    process = subprocess.Popen(
+        argv,
+        cwd=workdir,
+        env={**env, "TMPDIR": workdir},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        start_new_session=True,
+    )
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:  # already gone
+            pass
+
+    timer = threading.Timer(timeout, _kill) if timeout and timeout > 0 else None
+    if timer is not None:
+        timer.start()
+    tail = bytearray()
+    truncated = False
+    try:
+        while True:
+            chunk = os.read(process.stdout.fileno(), READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            tail += chunk
+            if len(tail) > OUTPUT_TAIL_BYTES:
+                del tail[: len(tail) - OUTPUT_TAIL_BYTES]
+                truncated = True
+        returncode = process.wait()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        process.stdout.close()
+    lines = tail.decode("utf-8", errors="replace").split("\n")
+    if truncated and len(lines) > 1:
+        lines = lines[1:]  # the first line was cut by the byte bound
+    if lines and lines[-1] == "":
+        lines.pop()
+    return (None if timed_out.is_set() else returncode), "\n".join(lines[-OUTPUT_TAIL_LINES:])
+
+
+def _verify_tag(
+    script: Path, script_hash: str, search_dirs: list[Path], tag: str, force: bool, timeout: float
+) -> tuple[bool, list[str]]:
+    # A verified tag is immutable: skip re-running the script while the tag
+    # commit and the script content are unchanged.
+    commit = _resolve_tag_commit(tag, search_dirs)
+    cache_path = _cache_path(tag, commit, script_hash) if commit else ""
+    if cache_path and not force and _is_verified(cache_path):
+        return True, [f"cached: {tag} verified at {commit[:12]}"]
+
+    with tracing.span("release-verify.sh", cat="subprocess", tag=tag):
+        returncode, output = _run_verify(script, tag, timeout)
+    if returncode is None:
+        return False, [_format_failure_detail(f"timed out after {timeout:g}s\n{output}")]
+    if returncode != 0:
+        return False, [_format_failure_detail(output)]
+
+    if cache_path:
+        _record_verified(cache_path, tag, commit, script_hash)
+    return True, []
+
+
+def check_release_integrity(
+    repo_path: str,
+    tag: str,
+    script_path: str = "",
+    force: bool = False,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    jobs: int = DEFAULT_JOBS,
+) -> tuple[bool, list[str]]:
     if not tag:
         return False, ["release tag missing"]
 
@@ -26,23 +200,24 @@ def check_release_integrity(repo_path: str, tag: str, script_path: str = "") ->
     if script is None:
         return False, ["release verify script missing"]
 
-    result = subprocess.run(
-        ["bash", str(script), tag],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if result.returncode != 0:
-        detail = _format_failure_detail(result)
-        return False, [detail]
+    search_dirs = [script.resolve().parent, Path(repo_path)]
+    tags = _expand_tags(tag, search_dirs)
+    if not tags:
+        return False, [f"release tag range unresolved: {tag}"]
+    script_hash = hashlib.sha256(script.read_bytes()).hexdigest()
+    if len(tags) == 1:
+        return _verify_tag(script, script_hash, search_dirs, tags[0], force, timeout)
 
-    return True, []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs or DEFAULT_JOBS, len(tags)))) as pool:
+        results = list(
+            pool.map(lambda item: _verify_tag(script, script_hash, search_dirs, item, force, timeout), tags)
+        )
+    details = [f"{item}: {detail}" for item, (_ok, item_details) in zip(tags, results) for detail in item_details]
+    return all(ok for ok, _details in results), details
 
 
-def _format_failure_detail(result: Any) -> str:
-    stdout = (result.stdout or "").strip()
-    stderr = (result.stderr or "").strip()
-    combined = "\n".join(item for item in [stdout, stderr] if item)
+def _format_failure_detail(output: str) -> str:
+    combined = output.strip()
     if not combined:
         combined = "release verify failed"
     return f"release verify failed: {combined}"
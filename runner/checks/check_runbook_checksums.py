@@ -1,7 +1,14 @@
 import hashlib
 import json
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    from runner import merkle, walk
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from runner import merkle, walk
 
 
 def _compute_checksum(payload: dict[str, Any]) -> str:
@@ -14,50 +21,89 @@ def _load_runbook(path: Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def check_runbook_checksums(config: dict[str, Any]) -> dict[str, Any]:
+def _check_runbook(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = _load_runbook(path)
+    except json.JSONDecodeError as exc:
+        return {
+            "type": "invalid_runbook_json",
+            "path": str(path),
+            "message": str(exc),
+        }
+
+    metadata = payload.get("metadata", {})
+    expected = metadata.get("checksum", "")
+    if not expected:
+        return {
+            "type": "missing_checksum",
+            "path": str(path),
+        }
+
+    computed_payload = dict(payload)
+    computed_meta = dict(metadata)
+    computed_meta["checksum"] = ""
+    computed_payload["metadata"] = computed_meta
+    actual = _compute_checksum(computed_payload)
+    if actual != expected:
+        return {
+            "type": "checksum_mismatch",
+            "path": str(path),
+            "expected": expected,
+            "actual": actual,
+        }
+    return None
+
+
+def _iter_against_manifest(
+    repo_root: Path, pattern: str, manifest: dict[str, Any], paths: list[str] | None, strict: bool
+) -> Iterator[dict[str, Any]]:
+    # Runbooks were all verified when the manifest was generated; the Merkle diff
+    # only selects which ones need their checksums re-verified. A stale manifest
+    # is not a failure unless ``strict`` asks for it.
+    current = merkle.build(repo_root, pattern, paths=paths, trust_stat=True)
+    for subtree in merkle.diverged(manifest, current):
+        if strict:
+            yield {
+                "type": "subtree_diverged",
+                "path": str(repo_root / subtree["path"]),
+                "changed": subtree["changed"],
+                "added": subtree["added"],
+                "removed": subtree["removed"],
+            }
+        for rel_path in subtree["changed"] + subtree["added"]:
+            detail = _check_runbook(repo_root / rel_path)
+            if detail is not None:
+                yield detail
+
+
+def iter_runbook_checksums(config: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield checksum details one runbook at a time.
+
+    With ``manifest`` set (repo-relative, e.g. ``runbooks/merkle.json``) and
+    present, the catalog is verified against its Merkle manifest instead;
+    ``strict_manifest`` also fails with a ``subtree_diverged`` detail per
+    directory that no longer matches it. ``files`` (repo-relative paths, e.g.
+    from the git index) replaces the glob.
+    """
     repo_root = Path(config.get("repo_root", Path.cwd()))
     pattern = config.get("pattern", "runbooks/**/*.yaml")
-    details: list[dict[str, Any]] = []
+    manifest_path = config.get("manifest", "")
+    files = config.get("files")
+    paths = None if files is None else [rel_path for rel_path in files if walk.glob_match(pattern, rel_path)]
+    manifest = merkle.load(repo_root / manifest_path) if manifest_path else None
+    if manifest is not None and manifest.get("pattern") == pattern:
+        yield from _iter_against_manifest(repo_root, pattern, manifest, paths, bool(config.get("strict_manifest")))
+        return
 
-    for path in sorted(repo_root.glob(pattern)):
+    candidates = repo_root.glob(pattern) if paths is None else (repo_root / rel_path for rel_path in paths)
+    for path in sorted(candidates):
         if not path.is_file():
             continue
-        try:
-            payload = _load_runbook(path)
-        except json.JSONDecodeError as exc:
-            details.append(
-                {
-                    "type": "invalid_runbook_json",
-                    "path": str(path),
-                    "message": str(exc),
-                }
-            )
-            continue
+        detail = _check_runbook(path)
+        if detail is not None:
+            yield detail
 
-        metadata = payload.get("metadata", {})
-        expected = metadata.get("checksum", "")
-        if not expected:
-            details.append(
-                {
-                    "type": "missing_checksum",
-                    "path": str(path),
-                }
-            )
-            continue
-
-        computed_payload = dict(payload)
-        computed_meta = dict(metadata)
-        computed_meta["checksum"] = ""
-        computed_payload["metadata"] = computed_meta
-        actual = _compute_checksum(computed_payload)
-        if actual != expected:
-            details.append(
-                {
-                    "type": "checksum_mismatch",
-                    "path": str(path),
-                    "expected": expected,
-                    "actual": actual,
-                }
-            )
 
+def check_runbook_checksums(config: dict[str, Any]) -> dict[str, Any]:
+    details = list(iter_runbook_checksums(config))
     return {"pass": not details, "details": details}
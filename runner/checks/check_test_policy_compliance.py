@@ -1,7 +1,28 @@
 import os
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from runner import headings
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from runner import headings
+
+APPENDIX_HEADING = "## Test Coverage Appendix"
+MAX_WORKERS = 8
+
+
+def _check_milestone(repo_root: Path, m_id: str) -> str:
+    report_path = repo_root / "internal" / "development" / "milestones" / m_id / "completion_report.md"
+    if not report_path.exists():
+        return f"milestone:{m_id}: missing completion_report.md"
+    if headings.missing(str(report_path), [APPENDIX_HEADING]):
+        return f"milestone:{m_id}: completion_report.md missing '{APPENDIX_HEADING}'"
+    return ""
+
+
 def check_test_policy_compliance(repo_path: str) -> tuple[bool, list[str]]:
     """
     驗證里程碑結項報告是否符合測試覆蓋率政策。
@@ -26,23 +47,10 @@ def check_test_policy_compliance(repo_path: str) -> tuple[bool, list[str]]:
     if not milestones:
         return True, ["no milestones found in index.json"]
     
-    errors = []
-    for m in milestones:
-        if not isinstance(m, dict):
-            continue
-            
-        m_id = m.get("id")
-        status = m.get("status")
-        
-        if status == "completed":
-            report_path = repo_root / "internal" / "development" / "milestones" / m_id / "completion_report.md"
-            
-            if not report_path.exists():
-                errors.append(f"milestone:{m_id}: missing completion_report.md")
-                continue
-            
-            content = report_path.read_text(encoding="utf-8")
-            if "## Test Coverage Appendix" not in content:
-                errors.append(f"milestone:{m_id}: completion_report.md missing '## Test Coverage Appendix'")
-                
+    completed = [
+        m.get("id") for m in milestones if isinstance(m, dict) and m.get("status") == "completed"
+    ]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, max(1, len(completed)))) as pool:
+        errors = [error for error in pool.map(lambda m_id: _check_milestone(repo_root, m_id), completed) if error]
+
     return len(errors) == 0, errors
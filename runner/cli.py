@@ -0,0 +1,77 @@
+"""Command-line arguments shared by ``run_repo_checks.py`` and ``runner/client.py``.
+
+Kept free of check, registry and fan-out imports so the client can parse its
+arguments and reach a running daemon without loading any of them.
+"""
+
+import argparse
+
+from runner import output
+
+FILE_SOURCES = ("walk", "git", "git-untracked")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--check", help="Check to run (see --list-checks); comma-separated with --watch/--repos/--workspace"
+    )
+    parser.add_argument("--list-checks", action="store_true", help="List available checks and exit")
+    parser.add_argument("--repo", help="Target repo path")
+    parser.add_argument("--repos", default="", help="Glob of repo directories to check in parallel")
+    parser.add_argument("--workspace", default="", help="Check every git clone directly under DIR in parallel")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes for --repos/--workspace (default: CPUs)")
+    parser.add_argument("--repo-type", default="")
+    parser.add_argument("--manifest-path", default="")
+    parser.add_argument("--skills-root", default="skills")
+    parser.add_argument("--schema-path", default="prompt.schema.json")
+    parser.add_argument("--prompts-dir", default="prompts")
+    parser.add_argument("--sop-path", default="docs/new-project-sop.md")
+    parser.add_argument("--profile-path", default="profile/README.md")
+    parser.add_argument("--release-tag", default="", help="Tag, comma-separated tags or an inclusive FROM..TO range")
+    parser.add_argument("--release-verify-script", default="")
+    parser.add_argument(
+        "--release-timeout", type=float, default=900, help="Seconds before release-verify.sh is killed (0: no limit)"
+    )
+    parser.add_argument("--release-jobs", type=int, default=4, help="Release tags verified concurrently")
+    parser.add_argument("--force", action="store_true", help="Re-verify release tags even when cached")
+    parser.add_argument("--watch", action="store_true", help="Re-run affected checks when workspace files change")
+    parser.add_argument(
+        "--watch-interval", type=float, default=0.5, help="Polling interval when inotify is unavailable"
+    )
+    parser.add_argument("--trace-out", default="", help="Write Chrome trace-event JSON to FILE")
+    parser.add_argument("--profile-out", default="", help="Dump a cProfile pstats file per check into DIR")
+    parser.add_argument("--since", default="", help="Run only the checks affected by changes since git REF")
+    parser.add_argument("--staged", action="store_true", help="Run only the checks affected by staged changes")
+    parser.add_argument(
+        "--file-source",
+        choices=FILE_SOURCES,
+        default="walk",
+        help="Enumerate files for orphaned_assets/runbook_checksums/prompt from the git index (git-untracked: "
+        "plus untracked, non-ignored files) instead of walking the tree",
+    )
+    parser.add_argument(
+        "--strict-manifest",
+        action="store_true",
+        help="runbook_checksums: fail with subtree_diverged details when runbooks/merkle.json is stale",
+    )
+    parser.add_argument(
+        "--format", choices=("json", "ndjson"), default="json", help="ndjson: stream one record per detail"
+    )
+    parser.add_argument(
+        "--aggregate", action="store_true", help="Report detail counts per type with a sample instead of every detail"
+    )
+    parser.add_argument("--sample-size", type=int, default=output.DEFAULT_SAMPLE_SIZE, help="Details kept per type")
+    parser.add_argument("--spill", default="", help="With --aggregate, write every detail to this NDJSON file")
+    parser.add_argument(
+        "--shard", default="", help="Run shard INDEX/COUNT of the selected checks (or of a case-driven check's cases)"
+    )
+    parser.add_argument("--timings", default="", help="Shard timings file (default: in $AAA_EVALS_CACHE_DIR)")
+    parser.add_argument("--baseline", default="", help="Measure the check against budgets in this baseline JSON")
+    parser.add_argument("--record-baseline", action="store_true", help="Store the measured values in --baseline")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per measurement with --baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=None, help="Allowed regression fraction (default: baseline's)"
+    )
+    parser.set_defaults(changed_files=None)
+    return parser
@@ -0,0 +1,113 @@
+"""Thin client for ``runner.daemon`` that falls back to in-process execution.
+
+Accepts the same arguments as ``run_repo_checks.py`` and prints the same JSON.
+Reaching a running daemon needs only the argument parser and a socket; the
+check runner is imported when no daemon answers, and for the modes the daemon
+does not serve (streaming output, fan-out, watch, change-scoped, sharded and
+baseline runs).
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+try:
+    from runner import cli
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from runner import cli
+
+# Paths resolved against the caller's cwd; the daemon may run elsewhere.
+CWD_RELATIVE_ARGS = ("repo", "manifest_path", "release_verify_script", "spill", "timings")
+LOCAL_ONLY_ARGS = ("list_checks", "trace_out", "profile_out", "baseline", "record_baseline", "repeat", "tolerance")
+# The daemon answers one JSON result per request; these modes always run in-process.
+IN_PROCESS_MODES = ("aggregate", "watch", "repos", "workspace", "since", "staged", "shard", "baseline")
+# Generous next to the checks' own limits (release verification: 900 s per tag), but a hung daemon is noticed.
+REQUEST_TIMEOUT = 3600.0
+
+
+def default_socket_path() -> str:
+    override = os.environ.get("AAA_RUNNER_SOCKET")
+    if override:
+        return override
+    import tempfile
+
+    return os.path.join(tempfile.gettempdir(), f"aaa-evals-runner-{os.getuid()}.sock")
+
+
+def request(payload: dict[str, Any], socket_path: str = "", timeout: float = REQUEST_TIMEOUT) -> dict[str, Any]:
+    """Send one request to a running daemon; raises OSError when none is listening."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(socket_path or default_socket_path())
+        conn.sendall(json.dumps(payload, ensure_ascii=True).encode("utf-8") + b"\n")
+        with conn.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError("daemon closed the connection without a response")
+    return json.loads(line)
+
+
+def in_process_only(args) -> bool:
+    return args.format == "ndjson" or any(getattr(args, name, None) for name in IN_PROCESS_MODES)
+
+
+def run(args, socket_path=""):
+    for name in CWD_RELATIVE_ARGS:
+        value = getattr(args, name, "")
+        if value:
+            setattr(args, name, os.path.abspath(value))
+
+    if not (args.trace_out or args.profile_out):
+        payload = {key: value for key, value in vars(args).items() if key not in LOCAL_ONLY_ARGS}
+        try:
+            return request({"op": "check", **payload}, socket_path, REQUEST_TIMEOUT)
+        except TimeoutError:
+            # Re-running in-process would repeat the wait; the daemon is busy or hung.
+            return {"error": f"daemon did not answer within {REQUEST_TIMEOUT:g}s"}
+        except OSError:
+            pass
+
+    from runner import registry, run_repo_checks, tracing
+
+    if registry.describe(args.check) is None:
+        return {"error": f"unknown check: {args.check}"}
+    tracing.configure(args.trace_out, args.profile_out, process_name="run_repo_checks")
+    try:
+        return run_repo_checks.execute(args)
+    finally:
+        tracing.flush()
+
+
+def main():
+    parser = cli.build_parser()
+    parser.add_argument("--socket", default="", help="Daemon socket path (default: same as runner.daemon)")
+    args = parser.parse_args()
+
+    if args.list_checks:
+        from runner import registry
+
+        print(json.dumps(sorted(registry.available_checks()), ensure_ascii=True))
+        return 0
+    socket_path = args.socket
+    del args.socket
+    if in_process_only(args):
+        from runner import run_repo_checks
+
+        return run_repo_checks.dispatch(parser, args)
+    if not args.check or not args.repo:
+        parser.error("--check and --repo are required")
+
+    output = run(args, socket_path)
+    if "error" in output:
+        print(f"runner error: {output['error']}", file=sys.stderr)
+        return 2
+    print(json.dumps(output, ensure_ascii=True))
+    return 0 if output["pass"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Long-running check server on a local Unix socket.
+
+Run ``python -m runner.daemon`` once per session; ``runner/client.py`` then
+sends newline-delimited JSON check requests to it and receives the same
+result shape as ``run_repo_checks.py``. Check modules, compiled schema
+validators and file contents stay warm between requests.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import signal
+import socketserver
+import sys
+from pathlib import Path
+from typing import Any
+
+try:
+    from runner import checks, preflight, registry, run_repo_checks
+    from runner.client import default_socket_path, request
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from runner import checks, preflight, registry, run_repo_checks
+    from runner.client import default_socket_path, request
+
+
+def handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    op = request.get("op", "check")
+    if op == "ping":
+        return {"ok": True, "pid": os.getpid()}
+    if op == "preflight":
+        return {"tools": preflight.report(repo_root=request.get("repo") or None)}
+    if op != "check":
+        return {"error": f"unknown op: {op}"}
+    payload = {key: value for key, value in request.items() if key != "op"}
+    check = payload.get("check")
+    if not check or not payload.get("repo"):
+        return {"error": "check and repo are required"}
+    if registry.describe(check) is None:
+        return {"error": f"unknown check: {check}"}
+    try:
+        return run_repo_checks.execute_request(payload)
+    except Exception as exc:  # report to the client instead of dropping the connection
+        return {"error": f"{type(exc).__name__}: {exc}"}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as exc:
+                response = {"error": f"invalid JSON request: {exc}"}
+            else:
+                response = handle_request(request)
+            self.wfile.write(json.dumps(response, ensure_ascii=True).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class CheckServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def preload() -> None:
+    for descriptor in registry.available_checks().values():
+        registry.load(descriptor["target"])
+    for module in pkgutil.iter_modules(checks.__path__):
+        importlib.import_module(f"{checks.__name__}.{module.name}")
+    try:
+        import jsonschema  # warm the import for schema checks
+    except ImportError:  # pragma: no cover - optional runtime dependency
+        pass
+    for name in preflight.TOOLS:
+        preflight.tool(name)
+
+
+def serve(socket_path: str) -> None:
+    if os.path.exists(socket_path):
+        try:
+            request({"op": "ping"}, socket_path, timeout=1.0)
+        except OSError:
+            os.unlink(socket_path)
+        else:
+            raise SystemExit(f"daemon already running on {socket_path}")
+    server = CheckServer(socket_path, _RequestHandler)
+    os.chmod(socket_path, 0o600)
+    print(json.dumps({"daemon": "listening", "socket": socket_path, "pid": os.getpid()}), flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--socket",
+        default="",
+        help="Unix socket path (default: $AAA_RUNNER_SOCKET or a per-user temp path)",
+    )
+    args = parser.parse_args()
+
+    preload()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        serve(args.socket or default_socket_path())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Run selected checks across many repos in a process pool and roll the results up."""
+
+import glob
+import os
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any
+
+
+def discover_repos(repos_glob: str = "", workspace: str = "") -> list[str]:
+    """Directories matching ``repos_glob`` plus every git clone directly under ``workspace``."""
+    repos = set()
+    if repos_glob:
+        repos.update(os.path.abspath(path) for path in glob.glob(repos_glob) if os.path.isdir(path))
+    if workspace:
+        for entry in os.scandir(workspace):
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git")):
+                repos.add(os.path.abspath(entry.path))
+    return sorted(repos)
+
+
+def _run_task(payload: dict[str, Any]) -> dict[str, Any]:
+    from runner import run_repo_checks
+
+    try:
+        return run_repo_checks.execute(run_repo_checks.request_args(payload))
+    except Exception as exc:  # one broken repo must not sink the whole report
+        return {
+            "check": payload["check"],
+            "repo": payload["repo"],
+            "pass": False,
+            "error": f"{type(exc).__name__}: {exc}",
+            "details": [],
+        }
+
+
+def _rollup(results: list[dict[str, Any]], key: str, other: str) -> dict[str, dict[str, Any]]:
+    rollup: dict[str, dict[str, Any]] = {}
+    for result in results:
+        entry = rollup.setdefault(result[key], {"passed": 0, "failed": 0, "errors": 0, f"failed_{other}s": []})
+        if "error" in result:
+            entry["errors"] += 1
+        elif result["pass"]:
+            entry["passed"] += 1
+            continue
+        else:
+            entry["failed"] += 1
+        entry[f"failed_{other}s"].append(result[other])
+    return rollup
+
+
+def report(results: list[dict[str, Any]], repos: list[str], checks: list[str]) -> dict[str, Any]:
+    errors = sum(1 for result in results if "error" in result)
+    passed = sum(1 for result in results if result["pass"])
+    return {
+        "pass": passed == len(results),
+        "repos": repos,
+        "checks": checks,
+        "summary": {
+            "total": len(results),
+            "passed": passed,
+            "failed": len(results) - passed - errors,
+            "errors": errors,
+        },
+        "by_repo": _rollup(results, "repo", "check"),
+        "by_check": _rollup(results, "check", "repo"),
+        "results": results,
+    }
+
+
+def run(args: Namespace, repos: list[str], checks: list[str], jobs: int = 0) -> dict[str, Any]:
+    base = {key: value for key, value in vars(args).items() if key not in ("trace_out", "profile_out")}
+    tasks = [{**base, "repo": repo, "check": check} for repo in repos for check in checks]
+    order = {(task["repo"], task["check"]): position for position, task in enumerate(tasks)}
+    results: list[dict[str, Any]] = []
+    if tasks:
+        with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count() or 1, len(tasks))) as pool:
+            futures = [pool.submit(_run_task, task) for task in tasks]
+            for future in as_completed(futures):
+                results.append(future.result())
+    results.sort(key=lambda result: order[(result["repo"], result["check"])])
+    return report(results, repos, checks)
@@ -0,0 +1,102 @@
+"""Enumerate a repo's files from the git index instead of walking the tree.
+
+``git ls-files -z`` lists tracked files (plus untracked files that are not
+ignored with ``untracked=True``), so ``.gitignore`` is honoured and ignored
+build outputs or virtualenvs are never visited. ``changed_files`` lists the
+paths changed since a ref (or staged for commit) the same way. A directory
+that is not inside a git work tree (e.g. a workspace of clones) is handled
+per clone directly beneath it. Paths are POSIX and relative to the given root.
+"""
+
+import os
+import subprocess
+from typing import Callable, Iterable
+
+from runner import preflight, tracing, walk
+
+
+def _git_paths(directory: str, *argv: str) -> list[str] | None:
+    git = preflight.tool("git")
+    if git["argv"] is None:
+        return None
+    try:
+        with tracing.span(f"git {argv[0]}", cat="subprocess", repo=directory):
+            result = subprocess.run(
+                [*git["argv"], "-C", directory, *argv], capture_output=True, check=False, env=git["env"]
+            )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return sorted({path for path in result.stdout.decode("utf-8", errors="surrogateescape").split("\0") if path})
+
+
+def _ls_files(directory: str, untracked: bool) -> list[str] | None:
+    argv = ["ls-files", "-z", "--cached"]
+    if untracked:
+        argv += ["--others", "--exclude-standard"]
+    return _git_paths(directory, *argv)
+
+
+def _diff(directory: str, since: str, staged: bool) -> list[str] | None:
+    if staged:
+        return _git_paths(directory, "diff", "--cached", "--name-only", "--relative", "-z")
+    # Compare the work tree with the merge base, so commits that only landed on REF are not reported.
+    git = preflight.tool("git")
+    if git["argv"] is None:
+        return None
+    try:
+        result = subprocess.run(
+            [*git["argv"], "-C", directory, "merge-base", since, "HEAD"],
+            capture_output=True,
+            text=True,
+            check=False,
+            env=git["env"],
+        )
+    except OSError:
+        return None
+    base = result.stdout.strip() if result.returncode == 0 else since
+    changed = _git_paths(directory, "diff", "--name-only", "--relative", "-z", base, "--")
+    if changed is None:
+        return None
+    untracked = _git_paths(directory, "ls-files", "-z", "--others", "--exclude-standard") or []
+    return sorted(set(changed) | set(untracked))
+
+
+def _per_repo(root: str, collect: Callable[[str], list[str] | None]) -> list[str] | None:
+    root = os.path.abspath(root)
+    files = collect(root)
+    if files is not None:
+        return files
+    if not os.path.isdir(root):
+        return None
+    clones = sorted(
+        entry.name for entry in os.scandir(root) if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git"))
+    )
+    if not clones:
+        return None
+    files = []
+    for name in clones:
+        files.extend(f"{name}/{path}" for path in collect(os.path.join(root, name)) or [])
+    return sorted(files)
+
+
+def list_files(root: str, untracked: bool = False) -> list[str] | None:
+    """Repo-relative paths under ``root`` from the git index; None when no git repo covers it."""
+    return _per_repo(root, lambda directory: _ls_files(directory, untracked))
+
+
+def changed_files(root: str, since: str = "", staged: bool = False) -> list[str] | None:
+    """Paths changed since ``since`` (plus untracked ones), or staged for commit; None without a git repo."""
+    return _per_repo(root, lambda directory: _diff(directory, since, staged))
+
+
+def for_source(root: str, source: str) -> list[str] | None:
+    """Candidate files for a ``--file-source`` value; None means walk the filesystem."""
+    if source not in ("git", "git-untracked"):
+        return None
+    return list_files(root, untracked=source == "git-untracked")
+
+
+def matching(files: Iterable[str], pattern: str) -> list[str]:
+    return [path for path in files if walk.glob_match(pattern, path)]
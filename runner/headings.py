@@ -0,0 +1,46 @@
+"""Streaming Markdown heading scanner.
+
+Files are read line by line in bounded chunks and only heading lines are
+inspected; scanning stops as soon as every required heading has been seen,
+so memory stays constant and large reports are usually read only partially.
+Results are cached by the file's mtime/size signature.
+"""
+
+from typing import Iterable
+
+from runner import cache
+
+MAX_LINE_BYTES = 64 * 1024
+
+
+def _scan(path: str, required: tuple[str, ...]) -> frozenset[str]:
+    remaining = set(required)
+    found = set()
+    at_line_start = True
+    with open(path, "rb") as handle:
+        while remaining:
+            chunk = handle.readline(MAX_LINE_BYTES)
+            if not chunk:
+                break
+            if at_line_start and chunk.lstrip()[:1] == b"#":
+                line = chunk.decode("utf-8", "replace").strip()
+                hits = {heading for heading in remaining if heading in line}
+                found |= hits
+                remaining -= hits
+            at_line_start = chunk.endswith(b"\n")
+    return frozenset(found)
+
+
+def find(path: str, required: Iterable[str]) -> frozenset[str]:
+    """Subset of ``required`` that appears on a heading line of ``path``."""
+    required = tuple(dict.fromkeys(required))
+    if not required:
+        return frozenset()
+    kind = "headings:" + "\x1f".join(required)
+    return cache.memoize_file(kind, path, lambda resolved: _scan(resolved, required))
+
+
+def missing(path: str, required: Iterable[str]) -> list[str]:
+    required = list(required)
+    found = find(path, required)
+    return [heading for heading in required if heading not in found]
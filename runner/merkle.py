@@ -0,0 +1,221 @@
+"""Merkle manifest over the runbook catalog.
+
+Every runbook is a leaf (SHA-256 of its bytes plus its declared metadata
+checksum) and every directory a node hashing its sorted children, up to the
+catalog root (``runbooks``). The manifest is generated next to the catalog
+(``runbooks/merkle.json``) from a catalog whose runbook checksums are all
+valid. Verification compares node hashes top-down and only descends into
+subtrees whose hash changed, reporting which directories diverged and which
+runbooks were changed, added or removed. During verification a leaf hash is
+reused from the stat cache while the runbook's (mtime, ctime, size, inode)
+signature is unchanged; ctime cannot be set back, so restoring mtime after an
+edit still forces a re-hash. Generating a manifest always hashes every file.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import stat
+import sys
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    from runner import cache
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from runner import cache
+
+MANIFEST_VERSION = 1
+STAT_CACHE_VERSION = 1
+DEFAULT_PATTERN = "runbooks/**/*.yaml"
+MANIFEST_NAME = "merkle.json"
+
+
+def catalog_root(pattern: str) -> str:
+    """Directory part of ``pattern`` before the first glob component (``runbooks``)."""
+    parts = []
+    for part in pattern.split("/")[:-1]:
+        if any(char in part for char in "*?["):
+            break
+        parts.append(part)
+    return "/".join(parts)
+
+
+def manifest_path(repo_root: Any, pattern: str = DEFAULT_PATTERN) -> Path:
+    return Path(repo_root) / catalog_root(pattern) / MANIFEST_NAME
+
+
+def _declared_checksum(data: bytes) -> str:
+    try:
+        return str(json.loads(data.decode("utf-8")).get("metadata", {}).get("checksum", ""))
+    except (ValueError, AttributeError):
+        return ""
+
+
+def _stat_cache_path(root: Path) -> str:
+    return cache.cache_dir("merkle", hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16] + ".json")
+
+
+def _load_stat_cache(root: Path) -> dict[str, dict[str, Any]]:
+    try:
+        with open(_stat_cache_path(root), "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if payload.get("version") != STAT_CACHE_VERSION or payload.get("root") != str(root):
+        return {}
+    return payload.get("leaves", {})
+
+
+def _save_stat_cache(root: Path, entries: dict[str, dict[str, Any]]) -> None:
+    store_path = _stat_cache_path(root)
+    tmp_path = f"{store_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(store_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"version": STAT_CACHE_VERSION, "root": str(root), "leaves": entries}, handle, ensure_ascii=True)
+        os.replace(tmp_path, store_path)
+    except OSError:  # the stat cache is an optimisation; a read-only cache dir is fine
+        pass
+
+
+def scan_leaves(
+    repo_root: Any, pattern: str = DEFAULT_PATTERN, paths: Iterable[str] | None = None, trust_stat: bool = False
+) -> dict[str, dict[str, str]]:
+    """``{repo-relative path: {"sha256", "checksum"}}`` for every runbook.
+
+    ``paths`` (repo-relative runbook paths, e.g. from the git index) replaces the glob. With
+    ``trust_stat`` only runbooks whose stat signature changed since the last scan are read and hashed.
+    """
+    root = Path(repo_root).resolve()
+    known = _load_stat_cache(root) if trust_stat else {}
+    entries: dict[str, dict[str, Any]] = {}
+    leaves = {}
+    candidates = root.glob(pattern) if paths is None else (root / rel_path for rel_path in paths)
+    for path in sorted(candidates):
+        try:
+            info = path.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(info.st_mode):
+            continue
+        rel_path = path.relative_to(root).as_posix()
+        signature = [info.st_mtime_ns, info.st_ctime_ns, info.st_size, info.st_ino]
+        entry = known.get(rel_path)
+        if entry is None or entry["sig"] != signature:
+            data = path.read_bytes()
+            entry = {"sig": signature, "sha256": hashlib.sha256(data).hexdigest(), "checksum": _declared_checksum(data)}
+        entries[rel_path] = entry
+        leaves[rel_path] = {"sha256": entry["sha256"], "checksum": entry["checksum"]}
+    if trust_stat and entries != known:
+        _save_stat_cache(root, entries)
+    return leaves
+
+
+def _children(leaves: dict[str, Any], top: str) -> dict[str, dict[str, set[str]]]:
+    """``{directory: {"dirs", "leaves"}}`` for every directory from ``top`` down to the leaves."""
+    children: dict[str, dict[str, set[str]]] = {top: {"dirs": set(), "leaves": set()}}
+    for rel_path in leaves:
+        parent = posixpath.dirname(rel_path)
+        children.setdefault(parent, {"dirs": set(), "leaves": set()})["leaves"].add(rel_path)
+        while parent != top and parent:
+            grandparent = posixpath.dirname(parent)
+            children.setdefault(grandparent, {"dirs": set(), "leaves": set()})["dirs"].add(parent)
+            children.setdefault(parent, {"dirs": set(), "leaves": set()})
+            parent = grandparent
+    return children
+
+
+def node_hashes(leaves: dict[str, dict[str, str]], top: str) -> dict[str, str]:
+    children = _children(leaves, top)
+    nodes: dict[str, str] = {}
+
+    def _hash(directory: str) -> str:
+        node = children[directory]
+        entries = [(posixpath.basename(path), "blob", leaves[path]["sha256"]) for path in node["leaves"]]
+        entries += [(posixpath.basename(path), "tree", _hash(path)) for path in node["dirs"]]
+        payload = "".join(f"{kind} {name} {digest}\n" for name, kind, digest in sorted(entries))
+        nodes[directory] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return nodes[directory]
+
+    _hash(top)
+    return dict(sorted(nodes.items()))
+
+
+def build(
+    repo_root: Any, pattern: str = DEFAULT_PATTERN, paths: Iterable[str] | None = None, trust_stat: bool = False
+) -> dict[str, Any]:
+    top = catalog_root(pattern)
+    leaves = scan_leaves(repo_root, pattern, paths, trust_stat)
+    nodes = node_hashes(leaves, top)
+    return {
+        "version": MANIFEST_VERSION,
+        "pattern": pattern,
+        "root": nodes[top],
+        "nodes": nodes,
+        "leaves": dict(sorted(leaves.items())),
+    }
+
+
+def diverged(manifest: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """Directories whose own runbooks differ, found by descending only into subtrees with a changed hash."""
+    if manifest["root"] == current["root"]:
+        return []
+    top = catalog_root(manifest["pattern"])
+    expected = _children(manifest["leaves"], top)
+    actual = _children(current["leaves"], top)
+    empty: dict[str, set[str]] = {"dirs": set(), "leaves": set()}
+    found = []
+    pending = [top]
+    while pending:
+        directory = pending.pop()
+        if manifest["nodes"].get(directory) == current["nodes"].get(directory):
+            continue
+        before, after = expected.get(directory, empty), actual.get(directory, empty)
+        changed = sorted(
+            path
+            for path in before["leaves"] & after["leaves"]
+            if manifest["leaves"][path]["sha256"] != current["leaves"][path]["sha256"]
+        )
+        added = sorted(after["leaves"] - before["leaves"])
+        removed = sorted(before["leaves"] - after["leaves"])
+        if changed or added or removed:
+            found.append({"path": directory, "changed": changed, "added": added, "removed": removed})
+        pending.extend(sorted(before["dirs"] | after["dirs"], reverse=True))
+    return sorted(found, key=lambda entry: entry["path"])
+
+
+def load(path: Any) -> dict[str, Any] | None:
+    try:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate the Merkle manifest of a runbook catalog")
+    parser.add_argument("--repo", required=True, help="Repo containing the catalog (e.g. aaa-tools)")
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN)
+    parser.add_argument("--out", default="", help="Manifest path (default: <catalog>/merkle.json)")
+    args = parser.parse_args()
+
+    from runner.checks.check_runbook_checksums import iter_runbook_checksums
+
+    invalid = list(iter_runbook_checksums({"repo_root": args.repo, "pattern": args.pattern}))
+    if invalid:
+        print(json.dumps({"pass": False, "details": invalid}, ensure_ascii=True))
+        return 1
+    manifest = build(args.repo, args.pattern)
+    out = Path(args.out) if args.out else manifest_path(args.repo, args.pattern)
+    out.write_text(json.dumps(manifest, ensure_ascii=True, indent=2) + "\n", encoding="utf-8")
+    summary = {"pass": True, "manifest": str(out), "root": manifest["root"], "runbooks": len(manifest["leaves"])}
+    print(json.dumps(summary, ensure_ascii=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
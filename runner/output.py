@@ -0,0 +1,54 @@
+"""Streaming output formats for check details.
+
+``write_ndjson`` emits one ``detail`` record per detail as it is produced and
+a closing ``summary`` record. ``aggregate`` groups details by type with a
+count and a capped sample, spilling every detail to an NDJSON file, so
+memory stays flat however many details a check yields.
+"""
+
+import json
+from typing import Any, Iterable, TextIO
+
+DEFAULT_SAMPLE_SIZE = 5
+
+
+def detail_type(detail: Any) -> str:
+    if isinstance(detail, dict):
+        return str(detail.get("type") or ("case" if "case" in detail else "detail"))
+    return "message"
+
+
+def write_ndjson(
+    head: dict[str, Any], details: Iterable[Any], passed: bool | None, out: TextIO
+) -> dict[str, Any]:
+    count = 0
+    for detail in details:
+        out.write(json.dumps({"type": "detail", **head, "detail": detail}, ensure_ascii=True) + "\n")
+        count += 1
+    summary = {"type": "summary", **head, "pass": count == 0 if passed is None else passed, "count": count}
+    out.write(json.dumps(summary, ensure_ascii=True) + "\n")
+    out.flush()
+    return summary
+
+
+def aggregate(details: Iterable[Any], sample_size: int = DEFAULT_SAMPLE_SIZE, spill_path: str = "") -> dict[str, Any]:
+    """``{"total", "groups": {type: {"count", "sample"}}, "spill"}``; the spill file is only created when needed."""
+    groups: dict[str, dict[str, Any]] = {}
+    total = 0
+    spill = None
+    try:
+        for detail in details:
+            if spill is None and spill_path:
+                spill = open(spill_path, "w", encoding="utf-8")
+            if spill is not None:
+                spill.write(json.dumps(detail, ensure_ascii=True) + "\n")
+            group = groups.setdefault(detail_type(detail), {"count": 0, "sample": []})
+            group["count"] += 1
+            if len(group["sample"]) < sample_size:
+                group["sample"].append(detail)
+            total += 1
+    finally:
+        if spill is not None:
+            spill.close()
+    ordered = dict(sorted(groups.items(), key=lambda item: (-item[1]["count"], item[0])))
+    return {"total": total, "groups": ordered, "spill": spill_path if spill is not None else ""}
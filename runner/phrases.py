@@ -0,0 +1,132 @@
+"""Declarative required-phrase rules evaluated with one Aho-Corasick pass per document.
+
+Rules live in ``runner/rules/required_phrases.json``. Each rule names a
+check, a repo-relative file (``{option}`` placeholders are filled from the
+check's arguments), the phrases that file must contain, and the detail message
+for a missing phrase. Rules marked ``"headings": true`` only match heading
+lines and use the streaming heading scanner instead of reading the file.
+"""
+
+import json
+import os
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+from runner import cache, headings
+
+RULES_PATH = Path(__file__).resolve().parent / "rules" / "required_phrases.json"
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton reporting which of a fixed set of phrases occur in a text."""
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases = tuple(dict.fromkeys(phrase for phrase in phrases if phrase))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for index, phrase in enumerate(self.phrases):
+            state = 0
+            for char in phrase:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (index,)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def scan(self, text: str) -> set[str]:
+        found: set[int] = set()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+                if len(found) == len(self.phrases):
+                    break
+        return {self.phrases[index] for index in found}
+
+
+@lru_cache(maxsize=128)
+def matcher(phrases: tuple[str, ...]) -> PhraseMatcher:
+    return PhraseMatcher(phrases)
+
+
+@lru_cache(maxsize=1)
+def load_rules() -> dict[str, Any]:
+    return json.loads(RULES_PATH.read_text(encoding="utf-8"))
+
+
+def rules_for(check: str) -> list[dict[str, Any]]:
+    return [rule for rule in load_rules()["rules"] if rule["check"] == check]
+
+
+def _phrase_text(phrase: Any) -> str:
+    return phrase["text"] if isinstance(phrase, dict) else phrase
+
+
+def evaluate(check: str, repo_path: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Evaluate every rule of ``check``.
+
+    Returns ``missing_files`` (one "<file> missing" entry per absent target,
+    in which case no phrases are evaluated), ``missing`` (formatted details
+    for absent phrases, in rule order).
+    """
+    options = options or {}
+    rules = rules_for(check)
+    targets: dict[str, str] = {}
+    missing_files: list[str] = []
+    for rule in rules:
+        label = rule["file"].format(**options)
+        path = os.path.join(repo_path, label)
+        if path in targets:
+            continue
+        targets[path] = label
+        if not os.path.isfile(path):
+            missing_files.append(f"{label} missing")
+    if missing_files:
+        return {"missing_files": missing_files, "missing": []}
+
+    by_path: dict[str, list[str]] = {}
+    headings_only: dict[str, bool] = {}
+    for rule in rules:
+        path = os.path.join(repo_path, rule["file"].format(**options))
+        by_path.setdefault(path, []).extend(_phrase_text(phrase) for phrase in rule["phrases"])
+        headings_only[path] = headings_only.get(path, True) and rule.get("headings", False)
+
+    found: dict[str, set[str]] = {}
+    for path, phrases in by_path.items():
+        if not phrases:
+            found[path] = set()
+        elif headings_only[path]:
+            found[path] = set(headings.find(path, phrases))
+        else:
+            found[path] = matcher(tuple(phrases)).scan(cache.read_text(path))
+
+    missing: list[str] = []
+    for rule in rules:
+        path = os.path.join(repo_path, rule["file"].format(**options))
+        for phrase in rule["phrases"]:
+            text = _phrase_text(phrase)
+            if text not in found[path]:
+                template = phrase.get("missing") if isinstance(phrase, dict) else None
+                missing.append((template or rule["missing"]).format(name=rule["name"], phrase=text))
+    return {"missing_files": [], "missing": missing}
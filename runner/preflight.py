@@ -0,0 +1,148 @@
+"""Resolve and version-probe the external tools checks shell out to.
+
+``tool(name)`` locates ``aaa``, ``gh``, ``git`` or ``bash`` and returns
+``{"name", "argv", "env"}``: the argv prefix to run it with (None when it is
+not available) and a prepared environment to pass as ``env=``. Resolutions are
+memoized for ``$AAA_PREFLIGHT_TTL`` seconds (default 300), so a CLI run
+resolves each tool once and the daemon re-resolves after the TTL or when
+``PATH`` or the ``AAA_TOOLS_*`` overrides change. ``version(name)`` spawns
+``--version`` once per resolution (callers racing on the first probe may
+each spawn one; the first result is kept). The returned dicts are shared:
+copy before modifying.
+"""
+
+import argparse
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+TOOLS = ("aaa", "gh", "git", "bash")
+DEFAULT_TTL_SECONDS = 300.0
+PROBE_TIMEOUT_SECONDS = 10.0
+# A change to any of these invalidates the memoized resolutions.
+_ENV_KEYS = ("PATH", "PYTHONPATH", "AAA_TOOLS_CMD", "AAA_TOOLS_ROOT")
+# Checks run unattended: never block on a credential or confirmation prompt.
+_QUIET_ENV = {"git": {"GIT_TERMINAL_PROMPT": "0"}, "gh": {"GH_PROMPT_DISABLED": "1"}}
+
+_lock = threading.Lock()
+_resolved: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+
+
+def ttl_seconds() -> float:
+    try:
+        return float(os.environ.get("AAA_PREFLIGHT_TTL", DEFAULT_TTL_SECONDS))
+    except ValueError:
+        return DEFAULT_TTL_SECONDS
+
+
+def _tools_root(repo_root: Path | None, env: dict[str, str]) -> str:
+    if env.get("AAA_TOOLS_ROOT"):
+        return env["AAA_TOOLS_ROOT"]
+    if repo_root is None:
+        return ""
+    for parent in [repo_root.parent, *repo_root.parents]:
+        candidate = parent / "aaa-tools"
+        if candidate.is_dir():
+            return str(candidate)
+    return ""
+
+
+def _resolve_aaa(repo_root: Path | None, env: dict[str, str]) -> list[str] | None:
+    override = env.get("AAA_TOOLS_CMD")
+    if override:
+        return shlex.split(override)
+    aaa_cmd = shutil.which("aaa", path=env.get("PATH"))
+    if aaa_cmd:
+        return [aaa_cmd]
+    tools_root = _tools_root(repo_root, env)
+    if not tools_root:
+        return None
+    pythonpath = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = f"{tools_root}{os.pathsep}{pythonpath}" if pythonpath else tools_root
+    return [sys.executable, "-m", "aaa.cli"]
+
+
+def _resolve(name: str, repo_root: Path | None) -> dict[str, Any]:
+    env = {**os.environ, **_QUIET_ENV.get(name, {})}
+    if name == "aaa":
+        argv = _resolve_aaa(repo_root, env)
+    else:
+        path = shutil.which(name, path=env.get("PATH"))
+        argv = [path] if path else None
+    return {"name": name, "argv": argv, "env": env}
+
+
+def tool(name: str, repo_root: str | Path | None = None) -> dict[str, Any]:
+    """Memoized resolution of ``name``; ``repo_root`` only matters for locating a sibling aaa-tools checkout."""
+    if name not in TOOLS:
+        raise ValueError(f"unknown tool: {name}")
+    root = Path(repo_root).resolve() if repo_root is not None and name == "aaa" else None
+    key = (name, str(root or ""), tuple(os.environ.get(env_key, "") for env_key in _ENV_KEYS))
+    now = time.monotonic()
+    with _lock:
+        cached = _resolved.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        resolved = _resolve(name, root)
+        _resolved[key] = (now + ttl_seconds(), resolved)
+        return resolved
+
+
+def argv(name: str, repo_root: str | Path | None = None) -> list[str] | None:
+    return tool(name, repo_root)["argv"]
+
+
+def version(name: str, repo_root: str | Path | None = None) -> str:
+    """First line of ``<tool> --version``; "" when the tool is missing or the probe fails."""
+    resolved = tool(name, repo_root)
+    if "version" in resolved:
+        return resolved["version"]
+    # Probe without holding the lock: a slow tool must not stall every other resolution.
+    text = ""
+    if resolved["argv"] is not None:
+        try:
+            result = subprocess.run(
+                [*resolved["argv"], "--version"],
+                capture_output=True,
+                text=True,
+                check=False,
+                env=resolved["env"],
+                timeout=PROBE_TIMEOUT_SECONDS,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            result = None
+        if result is not None and result.returncode == 0:
+            lines = (result.stdout or result.stderr).strip().splitlines()
+            text = lines[0].strip() if lines else ""
+    with _lock:
+        return resolved.setdefault("version", text)
+
+
+def report(names: tuple[str, ...] = TOOLS, repo_root: str | Path | None = None) -> dict[str, dict[str, Any]]:
+    return {name: {"argv": argv(name, repo_root), "version": version(name, repo_root)} for name in names}
+
+
+def clear() -> None:
+    with _lock:
+        _resolved.clear()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Resolve and version-probe the external tools used by checks.")
+    parser.add_argument("--repo", default=".", help="Repo or workspace path (locates a sibling aaa-tools)")
+    parser.add_argument("--tool", action="append", choices=TOOLS, help="Tool to probe (repeatable; default: all)")
+    args = parser.parse_args()
+    tools = report(tuple(args.tool or TOOLS), args.repo)
+    print(json.dumps({"tools": tools}, indent=2, ensure_ascii=True))
+    return 0 if all(entry["argv"] for entry in tools.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Workspace index of version and plan/schema ref occurrences in Markdown docs.
+
+Every ``@vX.Y.Z``, ``plan.v0.1.json?ref=`` and ``plan.schema.json?ref=``
+occurrence is recorded as ``(kind, value, line)`` per file, found with one
+combined tokenizer pass. Entries are keyed by the file's (mtime_ns, size)
+signature and persisted under the cache directory, so later runs only
+re-tokenize files that changed. Drift checks query the index instead of
+re-reading documents. The drift checks refresh every Markdown file under
+the workspace and compare refs across all of them except ``DRIFT_EXCLUDES``
+(changelogs, release notes, test fixtures).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    from runner import cache, walk
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from runner import cache, walk
+
+INDEX_VERSION = 1
+# Release history and test fixtures legitimately cite other versions: never counted as drift.
+DRIFT_EXCLUDES = (
+    "**/CHANGELOG*.md",
+    "**/CHANGES*.md",
+    "**/HISTORY*.md",
+    "**/RELEASE_NOTES*.md",
+    "**/release-notes/**",
+    "**/releases/**",
+    "**/tests/fixtures/**",
+)
+KINDS = ("version", "plan_ref", "schema_ref")
+TOKEN_RE = re.compile(
+    r"(?P<version>@v\d+\.\d+\.\d+)"
+    r"|plan\.v0\.1\.json\?ref=(?P<plan_ref>v\d+\.\d+\.\d+)"
+    r"|plan\.schema\.json\?ref=(?P<schema_ref>v\d+\.\d+\.\d+)"
+)
+
+
+def tokenize(text: str) -> list[list[Any]]:
+    """Return ``[kind, value, line]`` for every ref in ``text``, in document order."""
+    if "@v" not in text and "?ref=" not in text:
+        return []
+    refs = []
+    line = 1
+    position = 0
+    for match in TOKEN_RE.finditer(text):
+        line += text.count("\n", position, match.start())
+        position = match.start()
+        kind = match.lastgroup
+        refs.append([kind, match.group(kind), line])
+    return refs
+
+
+class RefIndex:
+    def __init__(self, root: str, store_path: str = ""):
+        self.root = os.path.abspath(root)
+        self.store_path = store_path or cache.cache_dir(
+            "refindex", hashlib.sha256(self.root.encode("utf-8")).hexdigest()[:16] + ".json"
+        )
+        self.files: dict[str, dict[str, Any]] = {}
+        self.tokenized = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if payload.get("version") == INDEX_VERSION and payload.get("root") == self.root:
+            self.files = payload.get("files", {})
+
+    def save(self) -> None:
+        payload = {"version": INDEX_VERSION, "root": self.root, "files": self.files}
+        tmp_path = f"{self.store_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.store_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, ensure_ascii=True)
+            os.replace(tmp_path, self.store_path)
+        except OSError:  # the index is an optimisation; a read-only cache dir is fine
+            pass
+
+    def _update(self, rel_path: str) -> bool:
+        path = os.path.join(self.root, rel_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return self.files.pop(rel_path, None) is not None
+        signature = [stat.st_mtime_ns, stat.st_size]
+        entry = self.files.get(rel_path)
+        if entry is not None and entry["sig"] == signature:
+            return False
+        # A plain read: a workspace refresh would otherwise fill the shared file cache with every document.
+        with open(path, "r", encoding="utf-8") as handle:
+            text = handle.read()
+        self.files[rel_path] = {"sig": signature, "refs": tokenize(text)}
+        self.tokenized += 1
+        return True
+
+    def refresh(self, paths: Iterable[str] | None = None) -> None:
+        """Re-tokenize changed files; ``paths`` defaults to every Markdown file under the root."""
+        with self._lock:
+            if paths is None:
+                rel_paths = [os.path.relpath(entry.path, self.root) for entry in walk.iter_files(self.root, (".md",))]
+                dirty = any([self._update(rel_path) for rel_path in rel_paths])
+                stale = self.files.keys() - set(rel_paths)
+                for rel_path in stale:
+                    del self.files[rel_path]
+                dirty = dirty or bool(stale)
+            else:
+                dirty = any([self._update(self.relative(path)) for path in paths])
+            if dirty:
+                self.save()
+
+    def relative(self, path: str) -> str:
+        return os.path.relpath(os.path.join(self.root, path), self.root)
+
+    def refs(self, path: str, kind: str = "") -> list[list[Any]]:
+        entry = self.files.get(self.relative(path))
+        if entry is None:
+            return []
+        return [ref for ref in entry["refs"] if not kind or ref[0] == kind]
+
+    def values(self, path: str, kind: str) -> list[str]:
+        return [ref[1] for ref in self.refs(path, kind)]
+
+    def occurrences(self, kind: str, paths: Iterable[str] | None = None) -> dict[str, list[str]]:
+        """Map each distinct value of ``kind`` to its ``path:line`` locations."""
+        rel_paths = sorted(self.files) if paths is None else [self.relative(path) for path in paths]
+        found: dict[str, list[str]] = {}
+        for rel_path in rel_paths:
+            for ref in self.refs(rel_path, kind):
+                found.setdefault(ref[1], []).append(f"{rel_path}:{ref[2]}")
+        return found
+
+
+_indexes: dict[str, RefIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def for_root(root: str) -> RefIndex:
+    """Shared index for ``root``; kept in memory so the daemon and watch mode reuse it."""
+    root = os.path.abspath(root)
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = RefIndex(root)
+        return index
+
+
+def lookup(root: str, paths: Iterable[str] | None = None) -> RefIndex:
+    """Shared index for ``root`` refreshed for ``paths`` (default: every Markdown file under it)."""
+    index = for_root(root)
+    index.refresh(paths)
+    return index
+
+
+def drift_paths(index: RefIndex, excludes: Iterable[str] = DRIFT_EXCLUDES) -> list[str]:
+    """Indexed files whose refs must agree: everything outside the ``excludes`` globs."""
+    excludes = tuple(excludes)
+    return [
+        rel_path for rel_path in sorted(index.files)
+        if not any(walk.glob_match(pattern, rel_path.replace(os.sep, "/")) for pattern in excludes)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report version/ref drift across a workspace")
+    parser.add_argument("--repo", required=True)
+    parser.add_argument("--max-locations", type=int, default=5)
+    args = parser.parse_args()
+
+    index = lookup(args.repo)
+    paths = drift_paths(index)
+    report = {}
+    for kind in KINDS:
+        found = index.occurrences(kind, paths)
+        report[kind] = {value: {"count": len(locations), "sample": locations[: args.max_locations]}
+                        for value, locations in sorted(found.items())}
+    drift = [kind for kind in KINDS if len(report[kind]) > 1]
+    print(json.dumps({"repo": index.root, "files": len(index.files), "drift": drift, "refs": report},
+                     ensure_ascii=False, indent=2))
+    return 1 if drift else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
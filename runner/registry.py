@@ -0,0 +1,228 @@
+"""Check registry: descriptors are resolved lazily so only the selected check is imported."""
+
+import importlib
+import os
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+from runner import walk
+
+ENTRY_POINT_GROUP = "aaa_evals.checks"
+
+PROFILE_README = ".github/profile/README.md"
+NEW_PROJECT_SOP = "aaa-tpl-docs/docs/new-project-sop.md"
+USER_CLI_CONTRACT = "aaa-tpl-docs/docs/contracts/aaa-cli-contract.md"
+
+# Each descriptor names its implementation as "module:function" and the
+# argparse attributes passed to it positionally. Nothing here is imported
+# until the check is actually run. "inputs" are repo-relative globs
+# ("{attr}" is filled from the parsed arguments) naming the files a check
+# reads, so watch mode can map a changed path back to the checks it affects.
+# Checks taking "changed_files" (repo-relative paths, None for a full run)
+# only look at those files in change-scoped runs (--since/--staged).
+# An optional "stream" target yields the details one at a time (the check
+# passes when it yields none) for checks that can produce very many of them.
+BUILTIN_CHECKS: dict[str, dict[str, Any]] = {
+    "readme": {
+        "target": "runner.run_repo_checks:check_readme",
+        "params": ("repo",),
+        "inputs": ("README.md", "CODEOWNERS", ".github/CODEOWNERS"),
+    },
+    "workflow": {
+        "target": "runner.run_repo_checks:check_workflows",
+        "params": ("repo",),
+        "inputs": (".github/workflows/*",),
+    },
+    "skills": {
+        "target": "runner.run_repo_checks:check_skills",
+        "params": ("repo", "skills_root"),
+        "inputs": ("{skills_root}/**", "index.json", "agent.yaml", "agent.py"),
+    },
+    "prompt": {
+        "target": "runner.run_repo_checks:check_prompt_schema",
+        "params": ("repo", "schema_path", "prompts_dir", "file_source", "changed_files"),
+        "inputs": ("{schema_path}", "{prompts_dir}/**/*.json", "index.json", "agent.yaml", "agent.py"),
+    },
+    "member_bootstrap_prereq": {
+        "target": "runner.run_repo_checks:check_member_bootstrap_prereq",
+        "params": ("repo", "sop_path"),
+        "inputs": ("{sop_path}",),
+    },
+    "private_download_sanity": {
+        "target": "runner.run_repo_checks:check_private_download_sanity",
+        "params": ("repo", "sop_path"),
+        "inputs": ("{sop_path}",),
+    },
+    "start_here_sync": {
+        "target": "runner.run_repo_checks:check_start_here_sync",
+        "params": ("repo", "profile_path"),
+        "inputs": ("{profile_path}",),
+    },
+    "skill_structure_v2": {
+        "target": "runner.run_repo_checks:check_skill_structure_v2",
+        "params": ("repo", "skills_root"),
+        "inputs": ("{skills_root}/**/SKILL.md",),
+    },
+    "onboarding_doc_drift": {
+        "target": "runner.run_repo_checks:check_onboarding_doc_drift",
+        "params": ("repo",),
+        "inputs": ("**/*.md",),
+    },
+    "onboarding_command_integrity": {
+        "target": "runner.run_repo_checks:check_onboarding_command_integrity",
+        "params": ("repo",),
+        "inputs": (PROFILE_README, NEW_PROJECT_SOP),
+    },
+    "plan_schema_ref_sync": {
+        "target": "runner.run_repo_checks:check_plan_schema_ref_sync",
+        "params": ("repo",),
+        "inputs": (NEW_PROJECT_SOP,),
+    },
+    "cli_contract_sync": {
+        "target": "runner.run_repo_checks:check_cli_contract_sync",
+        "params": ("repo",),
+        "inputs": ("**/*.md",),
+    },
+    "post_init_audit_required": {
+        "target": "runner.run_repo_checks:check_post_init_audit_required",
+        "params": ("repo",),
+        "inputs": (NEW_PROJECT_SOP, USER_CLI_CONTRACT, "aaa-tools/runbooks/init/POST_INIT_AUDIT.md"),
+    },
+    "runbook_schema_validate": {
+        "target": "runner.run_repo_checks:check_runbook_schema_validate",
+        "params": ("repo", "changed_files"),
+        "inputs": ("aaa-tools/specs/runbook.schema.json", "aaa-tools/runbooks/**/*.yaml"),
+    },
+    "runbook_checksums": {
+        "target": "runner.run_repo_checks:check_runbook_checksums",
+        "stream": "runner.run_repo_checks:iter_runbook_checksums",
+        "params": ("repo", "file_source", "strict_manifest"),
+        "inputs": ("runbooks/**/*.yaml", "runbooks/merkle.json"),
+    },
+    "repo_type_consistency": {
+        "target": "runner.run_repo_checks:check_repo_type_consistency",
+        "params": ("repo", "repo_type"),
+        "inputs": (".aaa/metadata.json",),
+    },
+    "checks_manifest_alignment": {
+        "target": "runner.run_repo_checks:check_checks_manifest_alignment",
+        "params": ("manifest_path",),
+        "inputs": ("{manifest_path}",),
+    },
+    "orphaned_assets": {
+        "target": "runner.run_repo_checks:check_orphaned_assets",
+        "stream": "runner.run_repo_checks:iter_orphaned_assets",
+        "params": ("repo", "file_source"),
+        "inputs": ("**/docs/adrs/**", "**/docs/milestones/**", "**/reports/**"),
+    },
+    "gate_a_smoke": {
+        "target": "runner.run_repo_checks:check_gate_a_smoke",
+        "params": ("repo", "shard", "timings"),
+        "inputs": ("**/evals/cases/gate_a_smoke.jsonl", "**/plan.v0.1.json"),
+    },
+    "agent_safety": {
+        "target": "runner.run_repo_checks:check_agent_safety",
+        "params": ("repo", "shard", "timings"),
+        "inputs": ("**/evals/cases/agent_safety.jsonl", "**/evals/fixtures/runbooks/**"),
+    },
+    "release_integrity_check": {
+        "target": "runner.checks.check_release_integrity:check_release_integrity",
+        "params": ("repo", "release_tag", "release_verify_script", "force", "release_timeout", "release_jobs"),
+        "inputs": (),
+    },
+    "test_policy_compliance": {
+        "target": "runner.checks.check_test_policy_compliance:check_test_policy_compliance",
+        "params": ("repo",),
+        "inputs": ("internal/index.json", "internal/development/milestones/**/completion_report.md"),
+    },
+}
+
+
+def load(target: str) -> Callable[..., Any]:
+    module_name, _, attr = target.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attr)
+
+
+def lazy(target: str) -> Callable[..., Any]:
+    """Return a callable that imports ``module:function`` on first use."""
+    resolved: list[Callable[..., Any]] = []
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        if not resolved:
+            resolved.append(load(target))
+        return resolved[0](*args, **kwargs)
+
+    return call
+
+
+@lru_cache(maxsize=None)
+def available_checks() -> dict[str, dict[str, Any]]:
+    """Built-in checks plus entry-point plugins; plugin code is not imported here."""
+    from importlib import metadata
+
+    checks: dict[str, dict[str, Any]] = {}
+    for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP):
+        checks[entry_point.name] = {
+            "target": entry_point.value,
+            "params": ("repo",),
+            "inputs": (),
+            "plugin": True,
+        }
+    checks.update(BUILTIN_CHECKS)
+    return checks
+
+
+def describe(name: str) -> dict[str, Any] | None:
+    # Entry points are only consulted for names that are not built in, which
+    # keeps importlib.metadata off the startup path of built-in checks.
+    return BUILTIN_CHECKS.get(name) or available_checks().get(name)
+
+
+def run(name: str, args: Any) -> tuple[bool, list[Any]]:
+    descriptor = describe(name)
+    if descriptor is None:
+        raise KeyError(f"unknown check: {name}")
+    func = load(descriptor["target"])
+    result = func(*(getattr(args, param) for param in descriptor["params"]))
+    if isinstance(result, dict):
+        return result["pass"], result["details"]
+    return result
+
+
+def stream(name: str, args: Any) -> tuple[bool | None, Iterable[Any]]:
+    """``(passed, details)`` with lazily produced details; ``passed`` is None when it depends on there being none."""
+    descriptor = describe(name)
+    if descriptor is None:
+        raise KeyError(f"unknown check: {name}")
+    if "stream" not in descriptor:
+        return run(name, args)
+    func = load(descriptor["stream"])
+    return None, func(*(getattr(args, param) for param in descriptor["params"]))
+
+
+def input_patterns(name: str, args: Any) -> list[str]:
+    """Repo-relative POSIX globs for a check's declared inputs."""
+    descriptor = describe(name) or {}
+    repo = os.path.abspath(getattr(args, "repo", "") or ".")
+    patterns = []
+    for template in descriptor.get("inputs", ()):
+        pattern = template.format(**vars(args))
+        if not pattern:
+            continue
+        if os.path.isabs(pattern):
+            pattern = os.path.relpath(pattern, repo)
+        patterns.append(pattern.replace(os.sep, "/"))
+    return patterns
+
+
+def affected_checks(paths: Any, args: Any, names: Any = None) -> list[str]:
+    """Checks (in registry order) whose declared inputs match any changed path."""
+    repo = os.path.abspath(getattr(args, "repo", "") or ".")
+    relative = [os.path.relpath(os.path.abspath(path), repo).replace(os.sep, "/") for path in paths]
+    affected = []
+    for name in names if names is not None else BUILTIN_CHECKS:
+        patterns = input_patterns(name, args)
+        if any(walk.glob_match(pattern, path) for path in relative for pattern in patterns):
+            affected.append(name)
+    return affected
@@ -0,0 +1,216 @@
+"""Persistent cache of model responses shared by the model-backed eval runners.
+
+Responses are keyed by (backend id, model id, prompt, parameters, case id).
+The SQLite index maps each key to the SHA-256 of the response text, and the
+text itself is stored once per digest under ``blobs/``. Entries beyond
+``max_entries`` or ``max_bytes`` of distinct blobs are evicted least
+recently used first; the limits are checked against running totals, so
+a put only touches the index when it has to evict. Cache I/O runs off the
+event loop, and a failed write is counted, not raised. Modes:
+
+- ``off`` (default): no caching; every case is measured against the backend.
+- ``readwrite``: replay hits, call the backend for misses and record them.
+- ``record`` (or ``--refresh``): always call the backend, overwrite entries.
+- ``replay``: never call the backend; a miss fails its batch.
+
+Runners add the shared flags with ``add_arguments`` and route backend calls
+through ``ResponseCache.complete``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from runner import cache
+
+MODES = ("readwrite", "record", "replay", "off")
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_MAX_MB = 512
+DEFAULT_MODE = "off"
+EVICT_BATCH = 64
+
+
+def cache_key(backend_id: str, model: str, prompt: str, params: dict[str, Any], case_id: str) -> str:
+    payload = json.dumps([backend_id, model, prompt, params, case_id], sort_keys=True, ensure_ascii=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: str = "",
+        mode: str = "readwrite",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+    ):
+        if mode not in MODES or mode == "off":
+            raise ValueError(f"invalid response cache mode: {mode}")
+        self.path = path or cache.cache_dir("responses", "index.sqlite")
+        self.blob_dir = os.path.join(os.path.dirname(self.path), "blobs")
+        self.mode = mode
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.write_errors = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, digest TEXT, size INTEGER, accessed REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_digest ON responses (digest)")
+        self._db.commit()
+        # Running totals, counted once here and kept up to date by put/get, so a put stays O(log N).
+        self._count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        self._bytes = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM responses GROUP BY digest)"
+        ).fetchone()[0]
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._db.execute("SELECT digest FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            try:
+                with open(self._blob_path(row[0]), "r", encoding="utf-8") as handle:
+                    text = handle.read()
+            except OSError:  # blob removed behind our back: treat as a miss
+                self._delete(key, row[0])
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        with self._lock:
+            previous = self._db.execute("SELECT digest FROM responses WHERE key = ?", (key,)).fetchone()
+            if previous is not None and previous[0] == digest:
+                self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+                self._db.commit()
+                return
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp_path, path)
+            if previous is not None:
+                self._delete(key, previous[0])
+            if not self._referenced(digest):
+                self._bytes += len(data)
+            self._db.execute("INSERT INTO responses VALUES (?, ?, ?, ?)", (key, digest, len(data), time.time()))
+            self._count += 1
+            self._evict()
+            self._db.commit()
+
+    def _referenced(self, digest: str) -> bool:
+        return self._db.execute("SELECT 1 FROM responses WHERE digest = ? LIMIT 1", (digest,)).fetchone() is not None
+
+    def _delete(self, key: str, digest: str) -> None:
+        # Drop one entry and, once no key references it, its blob and its bytes.
+        size = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+        self._count -= 1
+        if size is not None and not self._referenced(digest):
+            self._bytes -= size[0]
+            try:
+                os.unlink(self._blob_path(digest))
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        # Cheap check against the running totals; only then walk the accessed index, oldest first.
+        while self._count > self.max_entries or self._bytes > self.max_bytes:
+            oldest = self._db.execute(
+                "SELECT key, digest FROM responses ORDER BY accessed LIMIT ?", (EVICT_BATCH,)
+            ).fetchall()
+            if not oldest:
+                return
+            for key, digest in oldest:
+                if self._count <= self.max_entries and self._bytes <= self.max_bytes:
+                    return
+                self._delete(key, digest)
+
+    async def complete(
+        self, backend: dict[str, Any], prompts: list[str], params: dict[str, Any], case_ids: list[str]
+    ) -> tuple[list[str], list[bool]]:
+        """``backend["complete"]`` for the prompts, answering hits from the cache and batching the misses.
+
+        Returns the outputs and, per prompt, whether it was answered from the cache.
+        """
+        keys = [
+            cache_key(backend["id"], backend["model"], prompt, params, str(case_id))
+            for prompt, case_id in zip(prompts, case_ids)
+        ]
+        # File and SQLite I/O runs in a thread so it does not stall the other workers on the event loop.
+        outputs = [None] * len(keys) if self.mode == "record" else await asyncio.to_thread(self._get_many, keys)
+        misses = [index for index, output in enumerate(outputs) if output is None]
+        self.hits += len(keys) - len(misses)
+        self.misses += len(misses)
+        if misses:
+            if self.mode == "replay":
+                raise RuntimeError(f"no recorded response for {', '.join(str(case_ids[index]) for index in misses)}")
+            fresh = await backend["complete"]([prompts[index] for index in misses], params)
+            for index, text in zip(misses, fresh):
+                outputs[index] = text
+            try:
+                await asyncio.to_thread(self._put_many, [(keys[index], outputs[index]) for index in misses])
+            except (OSError, sqlite3.Error):  # a cache that cannot be written must not fail the cases
+                self.write_errors += 1
+        return outputs, [index not in misses for index in range(len(keys))]
+
+    def _get_many(self, keys: list[str]) -> list[str | None]:
+        return [self.get(key) for key in keys]
+
+    def _put_many(self, items: list[tuple[str, str]]) -> None:
+        for key, text in items:
+            self.put(key, text)
+
+    def stats(self) -> dict[str, Any]:
+        return {"mode": self.mode, "hits": self.hits, "misses": self.misses, "write_errors": self.write_errors}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache-mode",
+        choices=MODES,
+        default=os.environ.get("AAA_EVALS_RESPONSE_CACHE", DEFAULT_MODE),
+        help=f"Response cache mode (default: $AAA_EVALS_RESPONSE_CACHE or {DEFAULT_MODE})",
+    )
+    parser.add_argument("--refresh", action="store_true", help="Re-call the backend and overwrite cached responses")
+    parser.add_argument("--response-cache", default="", help="Cache index path (default: under the aaa-evals cache)")
+    parser.add_argument("--cache-max-entries", type=int, default=DEFAULT_MAX_ENTRIES)
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_MB, help="Size limit of stored responses")
+
+
+def from_args(args: argparse.Namespace) -> ResponseCache | None:
+    """Cache configured by the ``add_arguments`` flags; None when caching is off."""
+    if args.refresh and args.cache_mode == "replay":
+        raise ValueError("--refresh cannot be combined with --cache-mode replay")
+    mode = "record" if args.refresh else args.cache_mode
+    if mode == "off":
+        return None
+    return ResponseCache(args.response_cache, mode, args.cache_max_entries, int(args.cache_max_mb * 1024 * 1024))
@@ -1,30 +1,41 @@
 import argparse
 import json
-import shutil
 import subprocess
 import sys
+from pathlib import Path
 
+try:
+    from runner import preflight
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from runner import preflight
 
-def run(cmd):
-    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+def run(cmd, env=None):
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env)
     return result.returncode, result.stdout.strip(), result.stderr.strip()
 
 
 def gh_auth_ok():
-    if not shutil.which("gh"):
+    gh = preflight.tool("gh")
+    if gh["argv"] is None:
         return False, "gh not installed"
-    code, out, err = run(["gh", "auth", "status"])
+    code, out, err = run([*gh["argv"], "auth", "status"], gh["env"])
     if code != 0:
         return False, err or "gh auth status failed"
     return True, ""
 
 
 def git_identity_ok():
-    code, name, _ = run(["git", "config", "--global", "user.name"])
-    code2, email, _ = run(["git", "config", "--global", "user.email"])
-    if code != 0 or not name:
+    git = preflight.tool("git")
+    if git["argv"] is None:
+        return False, "git not installed"
+    # One spawn for both keys; exits 1 when neither is set.
+    _code, out, _ = run([*git["argv"], "config", "--global", "--get-regexp", r"^user\.(name|email)$"], git["env"])
+    identity = dict(line.partition(" ")[::2] for line in out.splitlines())
+    if not identity.get("user.name", "").strip():
         return False, "git user.name missing"
-    if code2 != 0 or not email:
+    if not identity.get("user.email", "").strip():
         return False, "git user.email missing"
     return True, ""
 
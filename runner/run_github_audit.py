@@ -1,10 +1,18 @@
+import argparse
 import base64
 import json
 import os
 import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from runner import preflight, tracing
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from runner import preflight, tracing
+
 
 ORG = "ai-asset-architecture"
 REQUIRED_README_SECTIONS = [
@@ -19,19 +27,27 @@ WORKFLOW_REQUIRED_REPOS = {"aaa-tpl-docs", "aaa-tpl-service", "aaa-tpl-frontend"
 
 
 def run(cmd):
-    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    tool = preflight.tool(cmd[0])
+    if tool["argv"] is None:
+        return 127, "", f"{cmd[0]} not installed"
+    with tracing.span(" ".join(cmd[:2]), cat="subprocess"):
+        result = subprocess.run(
+            [*tool["argv"], *cmd[1:]], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=tool["env"]
+        )
     return result.returncode, result.stdout.strip(), result.stderr.strip()
 
 
 def gh_api(path):
-    code, out, err = run(["gh", "api", path])
+    with tracing.span(path, cat="github"):
+        code, out, err = run(["gh", "api", path])
     if code != 0:
         return None, err
     return json.loads(out), None
 
 
 def gh_api_jq(path, jq):
-    code, out, err = run(["gh", "api", path, "--jq", jq])
+    with tracing.span(path, cat="github", jq=jq):
+        code, out, err = run(["gh", "api", path, "--jq", jq])
     if code != 0:
         return None, err
     return out, None
@@ -131,7 +147,25 @@ def check_tags():
     return any(tag.get("name") == "v0.1.0" for tag in tags)
 
 
+def _audit_step(name, repo, func, *args):
+    with tracing.span(name, cat="check", repo=repo), tracing.profile(name):
+        return func(*args)
+
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trace-out", default="", help="Write Chrome trace-event JSON to FILE")
+    parser.add_argument("--profile-out", default="", help="Dump a cProfile pstats file per check into DIR")
+    args = parser.parse_args()
+
+    tracing.configure(args.trace_out, args.profile_out, process_name="run_github_audit")
+    try:
+        audit()
+    finally:
+        tracing.flush()
+
+
+def audit():
     repos_data, err = gh_api(f"orgs/{ORG}/repos?per_page=200")
     if err or repos_data is None:
         raise SystemExit(f"failed to list repos: {err}")
@@ -140,11 +174,14 @@ def main():
     results = {}
     for repo in repos:
         default_branch = next((r["default_branch"] for r in repos_data if r["name"] == repo), "main")
-        readme_text = get_readme(repo)
-        readme_missing = check_readme_sections(readme_text)
-        codeowners_ok = check_codeowners(repo)
-        workflow_status, workflow_missing = check_workflow_pins(repo)
-        protection = check_branch_protection(repo, default_branch)
+        with tracing.span(repo, cat="repo"):
+            readme_text = _audit_step("readme", repo, get_readme, repo)
+            readme_missing = check_readme_sections(readme_text)
+            codeowners_ok = _audit_step("codeowners", repo, check_codeowners, repo)
+            workflow_status, workflow_missing = _audit_step("workflow_pins", repo, check_workflow_pins, repo)
+            protection = _audit_step(
+                "branch_protection", repo, check_branch_protection, repo, default_branch
+            )
         results[repo] = {
             "readme_missing": readme_missing,
             "codeowners": codeowners_ok,
@@ -3,72 +3,50 @@ import json
 import os
 import re
 import sys
+import time
 from pathlib import Path
 
 try:
-    from runner.checks.check_agent_safety import check_agent_safety as check_agent_safety_impl
-    from runner.checks.check_gate_a_smoke import check_gate_a_smoke as check_gate_a_smoke_impl
-    from runner.checks.check_orphaned_assets import check_orphaned_assets as check_orphaned_assets_impl
-    from runner.checks.check_runbook_checksums import check_runbook_checksums as check_runbook_checksums_impl
-    from runner.checks.check_release_integrity import (
-        check_release_integrity as check_release_integrity_impl,
-    )
-    from runner.checks.check_repo_type_consistency import (
-        check_repo_type_consistency as check_repo_type_consistency_impl,
-    )
-    from runner.checks.check_checks_manifest_alignment import (
-        check_checks_manifest_alignment as check_checks_manifest_alignment_impl,
-    )
-    from runner.checks.check_test_policy_compliance import (
-        check_test_policy_compliance as check_test_policy_compliance_impl,
-    )
+    from runner import cache, gitfiles, output, phrases, registry, tracing
+    from runner.cli import build_parser
 except ModuleNotFoundError:  # pragma: no cover - allow script execution
-    repo_root = Path(__file__).resolve().parents[1]
-    sys.path.insert(0, str(repo_root))
-    from runner.checks.check_agent_safety import check_agent_safety as check_agent_safety_impl
-    from runner.checks.check_gate_a_smoke import check_gate_a_smoke as check_gate_a_smoke_impl
-    from runner.checks.check_orphaned_assets import check_orphaned_assets as check_orphaned_assets_impl
-    from runner.checks.check_runbook_checksums import check_runbook_checksums as check_runbook_checksums_impl
-    from runner.checks.check_release_integrity import (
-        check_release_integrity as check_release_integrity_impl,
-    )
-    from runner.checks.check_repo_type_consistency import (
-        check_repo_type_consistency as check_repo_type_consistency_impl,
-    )
-    from runner.checks.check_checks_manifest_alignment import (
-        check_checks_manifest_alignment as check_checks_manifest_alignment_impl,
-    )
-    from runner.checks.check_test_policy_compliance import (
-        check_test_policy_compliance as check_test_policy_compliance_impl,
-    )
-
-try:
-    from jsonschema import Draft202012Validator
-except ImportError:  # pragma: no cover - optional runtime dependency
-    Draft202012Validator = None
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from runner import cache, gitfiles, output, phrases, registry, tracing
+    from runner.cli import build_parser
+
+check_agent_safety_impl = registry.lazy("runner.checks.check_agent_safety:check_agent_safety")
+check_gate_a_smoke_impl = registry.lazy("runner.checks.check_gate_a_smoke:check_gate_a_smoke")
+check_orphaned_assets_impl = registry.lazy("runner.checks.check_orphaned_assets:check_orphaned_assets")
+iter_orphaned_assets_impl = registry.lazy("runner.checks.check_orphaned_assets:iter_orphaned_assets")
+check_runbook_checksums_impl = registry.lazy(
+    "runner.checks.check_runbook_checksums:check_runbook_checksums"
+)
+iter_runbook_checksums_impl = registry.lazy("runner.checks.check_runbook_checksums:iter_runbook_checksums")
+check_repo_type_consistency_impl = registry.lazy(
+    "runner.checks.check_repo_type_consistency:check_repo_type_consistency"
+)
+check_checks_manifest_alignment_impl = registry.lazy(
+    "runner.checks.check_checks_manifest_alignment:check_checks_manifest_alignment"
+)
 
 
-REQUIRED_SECTIONS = [
-    "## Purpose / Scope",
-    "## Ownership / CODEOWNERS",
-    "## Versioning / Release",
-    "## How to Consume / Use",
-    "## Contribution / Promotion Rules",
-]
+def read_file(path):
+    return cache.read_text(path)
 
 
-def read_file(path):
-    with open(path, "r", encoding="utf-8") as handle:
-        return handle.read()
+def _phrase_check(check, repo_path, **options):
+    result = phrases.evaluate(check, repo_path, options)
+    if result["missing_files"]:
+        return False, result["missing_files"]
+    return len(result["missing"]) == 0, result["missing"]
 
 
 def check_readme(repo_path):
-    readme_path = os.path.join(repo_path, "README.md")
-    if not os.path.isfile(readme_path):
-        return False, ["README.md missing"]
+    result = phrases.evaluate("readme", repo_path)
+    if result["missing_files"]:
+        return False, result["missing_files"]
 
-    content = read_file(readme_path)
-    missing = [section for section in REQUIRED_SECTIONS if section not in content]
+    missing = result["missing"]
 
     codeowners_root = os.path.join(repo_path, "CODEOWNERS")
     codeowners_dot = os.path.join(repo_path, ".github", "CODEOWNERS")
@@ -78,42 +56,12 @@ def check_readme(repo_path):
     return len(missing) == 0, missing
 
 
-def _find_missing(content, required):
-    return [item for item in required if item not in content]
-
-
 def check_member_bootstrap_prereq(repo_path, sop_path):
-    sop_file = os.path.join(repo_path, sop_path)
-    if not os.path.isfile(sop_file):
-        return False, [f"{sop_path} missing"]
-
-    content = read_file(sop_file)
-    required = [
-        "gh auth setup-git",
-        "pip install \"git+https://github.com/ai-asset-architecture/aaa-tools.git@",
-        "aaa init validate-plan",
-        "模式 A",
-        "模式 B",
-    ]
-    missing = _find_missing(content, required)
-    return len(missing) == 0, missing
+    return _phrase_check("member_bootstrap_prereq", repo_path, sop_path=sop_path)
 
 
 def check_private_download_sanity(repo_path, sop_path):
-    sop_file = os.path.join(repo_path, sop_path)
-    if not os.path.isfile(sop_file):
-        return False, [f"{sop_path} missing"]
-
-    content = read_file(sop_file)
-    required = [
-        "gh api -H \"Accept: application/vnd.github.v3.raw\"",
-        "/tmp/aaa_plan_resolved.json",
-        "/tmp/aaa_plan_schema.json",
-        "json.load",
-        "grep -n \"{{\"",
-    ]
-    missing = _find_missing(content, required)
-    return len(missing) == 0, missing
+    return _phrase_check("private_download_sanity", repo_path, sop_path=sop_path)
 
 
 DOC_DRIFT_FILES = [
@@ -122,87 +70,62 @@ DOC_DRIFT_FILES = [
     "aaa-tpl-docs/PROJECT_PLAYBOOK.md",
 ]
 
-VERSION_RE = re.compile(r"@v\d+\.\d+\.\d+")
-PLAN_REF_RE = re.compile(r"plan\.v0\.1\.json\?ref=(v\d+\.\d+\.\d+)")
-SCHEMA_REF_RE = re.compile(r"plan\.schema\.json\?ref=(v\d+\.\d+\.\d+)")
-
-
-def _extract_versions(text):
-    versions = set(VERSION_RE.findall(text))
-    plan_refs = set(PLAN_REF_RE.findall(text))
-    schema_refs = set(SCHEMA_REF_RE.findall(text))
-    return versions, plan_refs, schema_refs
+DRIFT_SAMPLE = 5  # locations listed per drifting value
+
+PROFILE_README = registry.PROFILE_README
+NEW_PROJECT_SOP = registry.NEW_PROJECT_SOP
+USER_CLI_CONTRACT = registry.USER_CLI_CONTRACT
+CLI_CONTRACT_FILES = {
+    "profile": PROFILE_README,
+    "sop": NEW_PROJECT_SOP,
+    "user contract": USER_CLI_CONTRACT,
+}
+
+
+def _ref_drift(index, kind, paths, label):
+    """Details for ``kind`` values that disagree across ``paths``: the values, then where each occurs."""
+    found = index.occurrences(kind, paths)
+    values = sorted(found)
+    if len({value.replace("@", "") for value in values}) <= 1:
+        return []
+    return [f"{label} mismatch: {values}"] + [
+        f"{value}: {', '.join(found[value][:DRIFT_SAMPLE])}" for value in values
+    ]
 
 
 def check_onboarding_doc_drift(repo_path):
-    missing = []
-    versions = set()
-    plan_refs = set()
-    schema_refs = set()
-
-    for rel_path in DOC_DRIFT_FILES:
-        abs_path = Path(repo_path) / rel_path
-        if not abs_path.is_file():
-            missing.append(f"missing: {rel_path}")
-            continue
-        content = abs_path.read_text(encoding="utf-8")
-
-        if "{{AAA_VERSION}}" in content or "@<tag>" in content:
-            content = content.replace("{{AAA_VERSION}}", "").replace("@<tag>", "")
-
-        v, p, s = _extract_versions(content)
-        versions.update(v)
-        plan_refs.update(p)
-        schema_refs.update(s)
+    from runner import refindex
 
+    missing = [f"missing: {rel_path}" for rel_path in DOC_DRIFT_FILES if not (Path(repo_path) / rel_path).is_file()]
     if missing:
         return False, missing
 
-    if len({v.replace("@", "") for v in versions}) > 1:
-        return False, [f"version mismatch: {sorted(versions)}"]
-
-    if len(plan_refs) > 1:
-        return False, [f"plan ref mismatch: {sorted(plan_refs)}"]
-
-    if len(schema_refs) > 1:
-        return False, [f"schema ref mismatch: {sorted(schema_refs)}"]
+    # Every workspace doc takes part, so drift outside the onboarding docs is reported too.
+    index = refindex.lookup(repo_path)
+    paths = refindex.drift_paths(index)
+    for kind, label in (("version", "version"), ("plan_ref", "plan ref"), ("schema_ref", "schema ref")):
+        details = _ref_drift(index, kind, paths, label)
+        if details:
+            return False, details
 
     return True, []
 
 
-COMMAND_REQUIRED = [
-    "gh auth setup-git",
-    "python3 -m pip install \"git+https://github.com/ai-asset-architecture/aaa-tools.git@",
-    "plan.v0.1.json?ref=",
-]
-
-
 def check_onboarding_command_integrity(repo_path):
-    profile_path = Path(repo_path) / ".github/profile/README.md"
-    sop_path = Path(repo_path) / "aaa-tpl-docs/docs/new-project-sop.md"
-
-    if not profile_path.is_file():
-        return False, [".github/profile/README.md missing"]
-    if not sop_path.is_file():
-        return False, ["aaa-tpl-docs/docs/new-project-sop.md missing"]
-
-    profile = profile_path.read_text(encoding="utf-8")
-    sop = sop_path.read_text(encoding="utf-8")
+    from runner import refindex
 
-    missing = []
-    for required in COMMAND_REQUIRED:
-        if required not in profile:
-            missing.append(f"profile missing: {required}")
-        if required not in sop:
-            missing.append(f"sop missing: {required}")
-
-    profile_versions = VERSION_RE.findall(profile)
-    sop_versions = VERSION_RE.findall(sop)
-    profile_plan_refs = PLAN_REF_RE.findall(profile)
-    sop_plan_refs = PLAN_REF_RE.findall(sop)
+    result = phrases.evaluate("onboarding_command_integrity", repo_path)
+    if result["missing_files"]:
+        return False, result["missing_files"]
 
+    missing = result["missing"]
+    index = refindex.lookup(repo_path, [PROFILE_README, NEW_PROJECT_SOP])
+    profile_versions = index.values(PROFILE_README, "version")
+    sop_versions = index.values(NEW_PROJECT_SOP, "version")
     if profile_versions != sop_versions:
         missing.append(f"version mismatch: profile={profile_versions} sop={sop_versions}")
+    profile_plan_refs = index.values(PROFILE_README, "plan_ref")
+    sop_plan_refs = index.values(NEW_PROJECT_SOP, "plan_ref")
     if profile_plan_refs != sop_plan_refs:
         missing.append(f"plan ref mismatch: profile={profile_plan_refs} sop={sop_plan_refs}")
 
@@ -210,13 +133,14 @@ def check_onboarding_command_integrity(repo_path):
 
 
 def check_plan_schema_ref_sync(repo_path):
-    sop_path = Path(repo_path) / "aaa-tpl-docs/docs/new-project-sop.md"
-    if not sop_path.is_file():
-        return False, ["aaa-tpl-docs/docs/new-project-sop.md missing"]
+    from runner import refindex
+
+    if not (Path(repo_path) / NEW_PROJECT_SOP).is_file():
+        return False, [f"{NEW_PROJECT_SOP} missing"]
 
-    content = sop_path.read_text(encoding="utf-8")
-    plan_refs = PLAN_REF_RE.findall(content)
-    schema_refs = SCHEMA_REF_RE.findall(content)
+    index = refindex.lookup(repo_path, [NEW_PROJECT_SOP])
+    plan_refs = index.values(NEW_PROJECT_SOP, "plan_ref")
+    schema_refs = index.values(NEW_PROJECT_SOP, "schema_ref")
 
     if not plan_refs or not schema_refs:
         return False, ["plan/schema ref missing"]
@@ -228,71 +152,23 @@ def check_plan_schema_ref_sync(repo_path):
 
 
 def check_cli_contract_sync(repo_path):
-    missing = []
-    profile_path = Path(repo_path) / ".github/profile/README.md"
-    sop_path = Path(repo_path) / "aaa-tpl-docs/docs/new-project-sop.md"
-    user_contract_path = Path(repo_path) / "aaa-tpl-docs/docs/contracts/aaa-cli-contract.md"
-    cli_contract_path = Path(repo_path) / "aaa-tools/specs/CLI_CONTRACT.md"
-    runbook_path = Path(repo_path) / "aaa-tools/runbooks/init/AGENT_BOOTSTRAP.md"
-
-    required_files = [
-        (profile_path, ".github/profile/README.md"),
-        (sop_path, "aaa-tpl-docs/docs/new-project-sop.md"),
-        (user_contract_path, "aaa-tpl-docs/docs/contracts/aaa-cli-contract.md"),
-        (cli_contract_path, "aaa-tools/specs/CLI_CONTRACT.md"),
-        (runbook_path, "aaa-tools/runbooks/init/AGENT_BOOTSTRAP.md"),
-    ]
-    for path, label in required_files:
-        if not path.is_file():
-            missing.append(f"{label} missing")
-    if missing:
-        return False, missing
+    from runner import refindex
 
-    profile = profile_path.read_text(encoding="utf-8")
-    sop = sop_path.read_text(encoding="utf-8")
-    user_contract = user_contract_path.read_text(encoding="utf-8")
-    cli_contract = cli_contract_path.read_text(encoding="utf-8")
+    result = phrases.evaluate("cli_contract_sync", repo_path)
+    if result["missing_files"]:
+        return False, result["missing_files"]
 
-    required_common = [
-        "gh auth setup-git",
-        "python3 -m pip install \"git+https://github.com/ai-asset-architecture/aaa-tools.git@",
-        "plan.v0.1.json?ref=",
-    ]
-    for required in required_common:
-        if required not in profile:
-            missing.append(f"profile missing: {required}")
-        if required not in sop:
-            missing.append(f"sop missing: {required}")
-
-    required_contract_steps = [
-        "aaa init validate-plan",
-        "aaa init repo-checks",
-        "plan.schema.json?ref=",
-        "aaa-tools/runbooks/init/AGENT_BOOTSTRAP.md",
-    ]
-    for required in required_contract_steps:
-        if required not in sop:
-            missing.append(f"sop missing: {required}")
-        if required not in user_contract:
-            missing.append(f"user contract missing: {required}")
-
-    if "post-init audit" not in cli_contract:
-        missing.append("cli contract missing: post-init audit requirement")
-
-    versions = set()
-    for label, content in [("profile", profile), ("sop", sop), ("user contract", user_contract)]:
-        matches = VERSION_RE.findall(content)
-        if not matches:
+    missing = result["missing"]
+    index = refindex.lookup(repo_path)
+    for label, rel_path in CLI_CONTRACT_FILES.items():
+        if not index.values(rel_path, "version"):
             missing.append(f"{label} missing version tag")
-            continue
-        versions.update(matches)
-    if len({v.replace("@", "") for v in versions}) > 1:
-        missing.append(f"version mismatch: {sorted(versions)}")
+    missing.extend(_ref_drift(index, "version", refindex.drift_paths(index), "version"))
 
-    sop_plan_refs = PLAN_REF_RE.findall(sop)
-    sop_schema_refs = SCHEMA_REF_RE.findall(sop)
-    contract_plan_refs = PLAN_REF_RE.findall(user_contract)
-    contract_schema_refs = SCHEMA_REF_RE.findall(user_contract)
+    sop_plan_refs = index.values(NEW_PROJECT_SOP, "plan_ref")
+    sop_schema_refs = index.values(NEW_PROJECT_SOP, "schema_ref")
+    contract_plan_refs = index.values(USER_CLI_CONTRACT, "plan_ref")
+    contract_schema_refs = index.values(USER_CLI_CONTRACT, "schema_ref")
 
     if not sop_plan_refs or not sop_schema_refs:
         missing.append("sop missing plan/schema refs")
@@ -317,14 +193,15 @@ def check_cli_contract_sync(repo_path):
 
 
 def check_post_init_audit_required(repo_path):
-    missing = []
-    sop_path = Path(repo_path) / "aaa-tpl-docs/docs/new-project-sop.md"
-    user_contract_path = Path(repo_path) / "aaa-tpl-docs/docs/contracts/aaa-cli-contract.md"
-    runbook_path = Path(repo_path) / "aaa-tools/runbooks/init/POST_INIT_AUDIT.md"
+    return _phrase_check("post_init_audit_required", repo_path)
+
+
+RUNBOOK_SCHEMA = "aaa-tools/specs/runbook.schema.json"
+RUNBOOK_PATTERN = "aaa-tools/runbooks/**/*.yaml"
 
 
-def check_runbook_schema_validate(repo_path):
-    schema_path = Path(repo_path) / "aaa-tools/specs/runbook.schema.json"
+def check_runbook_schema_validate(repo_path, changed_files=None):
+    schema_path = Path(repo_path) / RUNBOOK_SCHEMA
     runbooks_root = Path(repo_path) / "aaa-tools/runbooks"
 
     if not schema_path.is_file():
@@ -333,20 +210,23 @@ def check_runbook_schema_validate(repo_path):
         return False, ["aaa-tools/runbooks missing"]
 
     try:
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        validator = cache.compiled_validator(schema_path)
     except json.JSONDecodeError as exc:
         return False, [f"schema invalid JSON: {exc}"]
-
-    try:
-        from jsonschema import Draft202012Validator
     except ImportError:
         return False, ["jsonschema not available"]
 
-    validator = Draft202012Validator(schema)
+    if changed_files is not None and RUNBOOK_SCHEMA not in changed_files:
+        # Scoped run: only the changed runbooks need validating while the schema is unchanged.
+        runbooks = [Path(repo_path) / path for path in gitfiles.matching(changed_files, RUNBOOK_PATTERN)]
+        runbooks = [path for path in runbooks if path.is_file()]
+    else:
+        runbooks = runbooks_root.rglob("*.yaml")
+
     failures = []
-    for path in runbooks_root.rglob("*.yaml"):
+    for path in runbooks:
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = json.loads(read_file(path))
         except json.JSONDecodeError as exc:
             failures.append(f"{path.relative_to(Path(repo_path))}: invalid JSON: {exc}")
             continue
@@ -358,7 +238,12 @@ def check_runbook_schema_validate(repo_path):
     return len(failures) == 0, failures
 
 
-def check_orphaned_assets(repo_path):
+def _with_files(config, repo_path, file_source):
+    files = gitfiles.for_source(repo_path, file_source)
+    return config if files is None else {**config, "files": files}
+
+
+def _orphaned_assets_config(repo_path, file_source="walk"):
     config = {
         "repo_root": repo_path,
         "target_paths": ["**/docs/adrs", "**/docs/milestones", "**/reports"],
@@ -375,28 +260,40 @@ def check_orphaned_assets(repo_path):
         "file_pattern": "*.md",
         "require_index": True,
     }
-    result = check_orphaned_assets_impl(config)
+    return _with_files(config, repo_path, file_source)
+
+
+def check_orphaned_assets(repo_path, file_source="walk"):
+    result = check_orphaned_assets_impl(_orphaned_assets_config(repo_path, file_source))
     return result["pass"], result["details"]
 
 
-def check_runbook_checksums(repo_path):
-    config = {"repo_root": repo_path, "pattern": "runbooks/**/*.yaml"}
-    result = check_runbook_checksums_impl(config)
+def iter_orphaned_assets(repo_path, file_source="walk"):
+    return iter_orphaned_assets_impl(_orphaned_assets_config(repo_path, file_source))
+
+
+def _runbook_checksums_config(repo_path, file_source="walk", strict_manifest=False):
+    config = {
+        "repo_root": repo_path,
+        "pattern": "runbooks/**/*.yaml",
+        "manifest": "runbooks/merkle.json",
+        "strict_manifest": strict_manifest,
+    }
+    return _with_files(config, repo_path, file_source)
+
+
+def check_runbook_checksums(repo_path, file_source="walk", strict_manifest=False):
+    result = check_runbook_checksums_impl(_runbook_checksums_config(repo_path, file_source, strict_manifest))
     return result["pass"], result["details"]
 
 
-def check_gate_a_smoke(repo_path):
-    repo_root = Path(repo_path)
-    cases_path = repo_root / "evals" / "cases" / "gate_a_smoke.jsonl"
-    if not cases_path.is_file():
-        nested = repo_root / "aaa-evals" / "evals" / "cases" / "gate_a_smoke.jsonl"
-        if nested.is_file():
-            cases_path = nested
-            repo_root = repo_root / "aaa-evals"
-        else:
-            return False, ["gate_a_smoke cases missing"]
+def iter_runbook_checksums(repo_path, file_source="walk", strict_manifest=False):
+    return iter_runbook_checksums_impl(_runbook_checksums_config(repo_path, file_source, strict_manifest))
 
-    failures = []
+
+def _run_cases(name, cases_path, repo_root, impl, shard_spec="", timings_path=""):
+    """Run every JSONL case (only this shard's with ``shard_spec``) and collect failures."""
+    items = []
     with cases_path.open("r", encoding="utf-8") as handle:
         for idx, line in enumerate(handle, start=1):
             line = line.strip()
@@ -405,16 +302,47 @@ def check_gate_a_smoke(repo_path):
             try:
                 case = json.loads(line)
             except json.JSONDecodeError as exc:
-                failures.append(f"case {idx}: invalid JSON: {exc}")
+                items.append((f"{name}:line-{idx}", idx, exc))
                 continue
-            result = check_gate_a_smoke_impl(case, repo_root)
-            if not result.get("pass"):
-                failures.append({"case": case.get("id", f"line-{idx}"), "details": result.get("details")})
+            items.append((f"{name}:{case.get('id', f'line-{idx}')}", idx, case))
+    if shard_spec:
+        from runner import shard
+
+        keys = [key for key, _idx, _case in items]
+        selected = set(shard.select(keys, shard_spec, shard.load_timings(timings_path)))
+        items = [item for item in items if item[0] in selected]
+
+    failures = []
+    for key, idx, case in items:
+        if isinstance(case, json.JSONDecodeError):
+            failures.append(f"case {idx}: invalid JSON: {case}")
+            continue
+        start = time.perf_counter()
+        with tracing.span(str(case.get("id", f"line-{idx}")), cat="case"):
+            result = impl(case, repo_root)
+        if shard_spec:
+            shard.observe(key, (time.perf_counter() - start) * 1000)
+        if not result.get("pass"):
+            failures.append({"case": case.get("id", f"line-{idx}"), "details": result.get("details")})
 
     return len(failures) == 0, failures
 
 
-def check_agent_safety(repo_path):
+def check_gate_a_smoke(repo_path, shard_spec="", timings_path=""):
+    repo_root = Path(repo_path)
+    cases_path = repo_root / "evals" / "cases" / "gate_a_smoke.jsonl"
+    if not cases_path.is_file():
+        nested = repo_root / "aaa-evals" / "evals" / "cases" / "gate_a_smoke.jsonl"
+        if nested.is_file():
+            cases_path = nested
+            repo_root = repo_root / "aaa-evals"
+        else:
+            return False, ["gate_a_smoke cases missing"]
+
+    return _run_cases("gate_a_smoke", cases_path, repo_root, check_gate_a_smoke_impl, shard_spec, timings_path)
+
+
+def check_agent_safety(repo_path, shard_spec="", timings_path=""):
     repo_root = Path(repo_path)
     cases_path = repo_root / "evals" / "cases" / "agent_safety.jsonl"
     if not cases_path.is_file():
@@ -432,77 +360,19 @@ def check_agent_safety(repo_path):
             if not cases_path.is_file():
                 return False, ["agent safety cases missing"]
 
-    failures = []
-    with cases_path.open("r", encoding="utf-8") as handle:
-        for idx, line in enumerate(handle, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                case = json.loads(line)
-            except json.JSONDecodeError as exc:
-                failures.append(f"case {idx}: invalid JSON: {exc}")
-                continue
-            result = check_agent_safety_impl(case, repo_root)
-            if not result.get("pass"):
-                failures.append({"case": case.get("id", f"line-{idx}"), "details": result.get("details")})
+    return _run_cases("agent_safety", cases_path, repo_root, check_agent_safety_impl, shard_spec, timings_path)
 
-    return len(failures) == 0, failures
-
-
-    required_files = [
-        (sop_path, "aaa-tpl-docs/docs/new-project-sop.md"),
-        (user_contract_path, "aaa-tpl-docs/docs/contracts/aaa-cli-contract.md"),
-        (runbook_path, "aaa-tools/runbooks/init/POST_INIT_AUDIT.md"),
-    ]
-    for path, label in required_files:
-        if not path.is_file():
-            missing.append(f"{label} missing")
-    if missing:
-        return False, missing
-
-    sop = sop_path.read_text(encoding="utf-8")
-    user_contract = user_contract_path.read_text(encoding="utf-8")
-    runbook = runbook_path.read_text(encoding="utf-8")
-
-    required_doc_refs = [
-        "aaa init repo-checks",
-        "aaa-tools/runbooks/init/POST_INIT_AUDIT.md",
-    ]
-    for required in required_doc_refs:
-        if required not in sop:
-            missing.append(f"sop missing: {required}")
-        if required not in user_contract:
-            missing.append(f"user contract missing: {required}")
-
-    required_runbook = [
-        "aaa init repo-checks",
-        "--suite governance",
-    ]
-    for required in required_runbook:
-        if required not in runbook:
-            missing.append(f"runbook missing: {required}")
 
-    return len(missing) == 0, missing
+def check_start_here_sync(repo_path, profile_path):
+    return _phrase_check("start_here_sync", repo_path, profile_path=profile_path)
 
 
-def check_start_here_sync(repo_path, profile_path):
-    profile_file = os.path.join(repo_path, profile_path)
-    if not os.path.isfile(profile_file):
-        return False, [f"{profile_path} missing"]
-
-    content = read_file(profile_file)
-    required = [
-        "gh auth setup-git",
-        "gh api -H \"Accept: application/vnd.github.v3.raw\"",
-        "pip install \"git+https://github.com/ai-asset-architecture/aaa-tools.git@",
-        "aaa-tpl-docs/blob/main/docs/new-project-sop.md",
-    ]
-    missing = _find_missing(content, required)
-    return len(missing) == 0, missing
+AAA_ACTIONS_WORKFLOW_RE = re.compile(r"ai-asset-architecture/aaa-actions/.github/workflows/[^@\s]+@v")
 
 
 def check_workflows(repo_path):
+    from runner import workflows
+
     workflows_dir = os.path.join(repo_path, ".github", "workflows")
     if not os.path.isdir(workflows_dir):
         return True, ["no workflows to check"]
@@ -519,10 +389,9 @@ def check_workflows(repo_path):
         return True, ["no workflow files found"]
 
     missing = []
-    uses_pattern = re.compile(r"uses:\s*ai-asset-architecture/aaa-actions/.github/workflows/[^@\s]+@v")
     for workflow in yaml_files:
-        content = read_file(workflow)
-        if not uses_pattern.search(content):
+        refs = workflows.uses_refs(workflows.load(workflow))
+        if not any(AAA_ACTIONS_WORKFLOW_RE.match(ref) for ref in refs):
             missing.append(os.path.relpath(workflow, repo_path))
 
     return len(missing) == 0, missing
@@ -533,7 +402,7 @@ def _load_repo_type(repo_path: str) -> str:
     if not index_path.is_file():
         return ""
     try:
-        payload = json.loads(index_path.read_text(encoding="utf-8"))
+        payload = json.loads(read_file(index_path))
     except json.JSONDecodeError:
         return ""
     if not isinstance(payload, dict):
@@ -555,6 +424,8 @@ def is_agent_repo(repo_path):
 
 
 def check_skills(repo_path, skills_root):
+    from runner import skillindex
+
     if not is_agent_repo(repo_path):
         return True, ["skipped: non-agent repo"]
 
@@ -562,59 +433,47 @@ def check_skills(repo_path, skills_root):
     if not os.path.isdir(root):
         return False, [f"{skills_root} missing"]
 
-    buckets = ["common", "codex", "agent"]
+    index = skillindex.scan(root)
     missing = []
-    for bucket in buckets:
-        bucket_path = os.path.join(root, bucket)
-        if not os.path.isdir(bucket_path):
+    for bucket in skillindex.SKILL_BUCKETS:
+        if bucket in index["missing_buckets"]:
             missing.append(f"{skills_root}/{bucket} missing")
             continue
-        for skill in os.listdir(bucket_path):
-            skill_path = os.path.join(bucket_path, skill)
-            if not os.path.isdir(skill_path):
-                continue
-            if skill.startswith("."):
-                continue
-            if not os.path.isfile(os.path.join(skill_path, "SKILL.md")):
-                missing.append(f"{skills_root}/{bucket}/{skill}/SKILL.md missing")
+        for skill in index["skills"]:
+            if skill["bucket"] == bucket and skill["skill_md"] is None:
+                missing.append(f"{skills_root}/{bucket}/{skill['name']}/SKILL.md missing")
 
     return len(missing) == 0, missing
 
 
+SKILL_REQUIRED_SECTIONS = [
+    "## Routing Logic",
+    "## Execution Steps",
+    "## Fallback",
+    "## Inputs / Outputs",
+    "## Execution Test",
+    "## Limitations",
+]
+
+
 def check_skill_structure_v2(repo_path, skills_root):
+    from runner import skillindex
+
     root = os.path.join(repo_path, skills_root)
     if not os.path.isdir(root):
         return False, [f"{skills_root} missing"]
 
-    required_sections = [
-        "## Routing Logic",
-        "## Execution Steps",
-        "## Fallback",
-        "## Inputs / Outputs",
-        "## Execution Test",
-        "## Limitations",
-    ]
     missing = []
-    bucket = "common"
-    bucket_path = os.path.join(root, bucket)
-    if os.path.isdir(bucket_path):
-        for skill in os.listdir(bucket_path):
-            if skill.startswith(".") or not skill.startswith("aaa-"):
-                continue
-            skill_path = os.path.join(bucket_path, skill, "SKILL.md")
-            if not os.path.isfile(skill_path):
-                continue
-            content = read_file(skill_path)
-            absent = [section for section in required_sections if section not in content]
-            if absent:
-                missing.append(f"{skills_root}/{bucket}/{skill}: missing {', '.join(absent)}")
+    for skill in skillindex.scan(root, tuple(SKILL_REQUIRED_SECTIONS))["skills"]:
+        if skill["missing_sections"]:
+            absent = ", ".join(skill["missing_sections"])
+            missing.append(f"{skills_root}/{skill['bucket']}/{skill['name']}: missing {absent}")
 
     return len(missing) == 0, missing
 
 
 def load_schema(schema_path):
-    with open(schema_path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return json.loads(read_file(schema_path))
 
 
 def fallback_validate_prompt(schema, prompt_obj):
@@ -636,7 +495,24 @@ def fallback_validate_prompt(schema, prompt_obj):
     return True, []
 
 
-def check_prompt_schema(repo_path, schema_path, prompts_dir):
+def _prompt_files(repo_path, prompts_dir, file_source):
+    files = gitfiles.for_source(repo_path, file_source)
+    if files is not None:
+        prefix = os.path.relpath(os.path.join(repo_path, prompts_dir), repo_path).replace(os.sep, "/") + "/"
+        return [
+            os.path.join(repo_path, *path.split("/"))
+            for path in files
+            if path.startswith(prefix) and path.endswith(".json")
+        ]
+    return [
+        os.path.join(root, name)
+        for root, _dirs, names in os.walk(os.path.join(repo_path, prompts_dir))
+        for name in names
+        if name.endswith(".json")
+    ]
+
+
+def check_prompt_schema(repo_path, schema_path, prompts_dir, file_source="walk", changed_files=None):
     if not is_agent_repo(repo_path):
         return True, ["skipped: non-agent repo"]
 
@@ -649,136 +525,245 @@ def check_prompt_schema(repo_path, schema_path, prompts_dir):
         return False, [f"{prompts_dir} missing"]
 
     schema = load_schema(schema_file)
-    validator = Draft202012Validator(schema) if Draft202012Validator else None
+    try:
+        validator = cache.compiled_validator(schema_file)
+    except ImportError:  # pragma: no cover - optional runtime dependency
+        validator = None
+    prompt_files = _prompt_files(repo_path, prompts_dir, file_source)
+    if changed_files is not None and os.path.relpath(schema_file, repo_path).replace(os.sep, "/") not in changed_files:
+        # Scoped run: only the changed prompts need validating while the schema is unchanged.
+        changed = {os.path.join(repo_path, *path.split("/")) for path in changed_files}
+        prompt_files = [path for path in prompt_files if path in changed]
+
     failures = []
-    for root, _dirs, files in os.walk(prompts_root):
-        for name in files:
-            if not name.endswith(".json"):
-                continue
-            path = os.path.join(root, name)
-            try:
-                payload = json.loads(read_file(path))
-            except json.JSONDecodeError as exc:
-                failures.append(f"{os.path.relpath(path, repo_path)} invalid JSON: {exc}")
-                continue
-            if validator is None:
-                ok, issues = fallback_validate_prompt(schema, payload)
-                if not ok:
-                    failures.append(f"{os.path.relpath(path, repo_path)}: {', '.join(issues)}")
-                continue
-            errors = sorted(validator.iter_errors(payload), key=lambda err: err.path)
-            if errors:
-                detail = "; ".join(err.message for err in errors)
-                failures.append(f"{os.path.relpath(path, repo_path)}: {detail}")
+    for path in prompt_files:
+        try:
+            payload = json.loads(read_file(path))
+        except json.JSONDecodeError as exc:
+            failures.append(f"{os.path.relpath(path, repo_path)} invalid JSON: {exc}")
+            continue
+        except FileNotFoundError:  # tracked in the index but deleted from the work tree
+            continue
+        if validator is None:
+            ok, issues = fallback_validate_prompt(schema, payload)
+            if not ok:
+                failures.append(f"{os.path.relpath(path, repo_path)}: {', '.join(issues)}")
+            continue
+        errors = sorted(validator.iter_errors(payload), key=lambda err: err.path)
+        if errors:
+            detail = "; ".join(err.message for err in errors)
+            failures.append(f"{os.path.relpath(path, repo_path)}: {detail}")
 
     return len(failures) == 0, failures
 
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument(
-        "--check",
-        required=True,
-        choices=[
-            "readme",
-            "workflow",
-            "skills",
-            "prompt",
-            "member_bootstrap_prereq",
-            "private_download_sanity",
-            "start_here_sync",
-            "skill_structure_v2",
-            "onboarding_doc_drift",
-            "onboarding_command_integrity",
-            "plan_schema_ref_sync",
-            "cli_contract_sync",
-            "post_init_audit_required",
-            "runbook_schema_validate",
-            "runbook_checksums",
-            "repo_type_consistency",
-            "checks_manifest_alignment",
-            "orphaned_assets",
-            "gate_a_smoke",
-            "agent_safety",
-            "release_integrity_check",
-            "test_policy_compliance",
-        ],
-    )
-    parser.add_argument("--repo", required=True, help="Target repo path")
-    parser.add_argument("--repo-type", default="")
-    parser.add_argument("--manifest-path", default="")
-    parser.add_argument("--skills-root", default="skills")
-    parser.add_argument("--schema-path", default="prompt.schema.json")
-    parser.add_argument("--prompts-dir", default="prompts")
-    parser.add_argument("--sop-path", default="docs/new-project-sop.md")
-    parser.add_argument("--profile-path", default="profile/README.md")
-    parser.add_argument("--release-tag", default="")
-    parser.add_argument("--release-verify-script", default="")
-    args = parser.parse_args()
-
-    if args.check == "readme":
-        passed, details = check_readme(args.repo)
-    elif args.check == "workflow":
-        passed, details = check_workflows(args.repo)
-    elif args.check == "skills":
-        passed, details = check_skills(args.repo, args.skills_root)
-    elif args.check == "prompt":
-        passed, details = check_prompt_schema(args.repo, args.schema_path, args.prompts_dir)
-    elif args.check == "member_bootstrap_prereq":
-        passed, details = check_member_bootstrap_prereq(args.repo, args.sop_path)
-    elif args.check == "private_download_sanity":
-        passed, details = check_private_download_sanity(args.repo, args.sop_path)
-    elif args.check == "onboarding_doc_drift":
-        passed, details = check_onboarding_doc_drift(args.repo)
-    elif args.check == "onboarding_command_integrity":
-        passed, details = check_onboarding_command_integrity(args.repo)
-    elif args.check == "plan_schema_ref_sync":
-        passed, details = check_plan_schema_ref_sync(args.repo)
-    elif args.check == "cli_contract_sync":
-        passed, details = check_cli_contract_sync(args.repo)
-    elif args.check == "post_init_audit_required":
-        passed, details = check_post_init_audit_required(args.repo)
-    elif args.check == "runbook_schema_validate":
-        passed, details = check_runbook_schema_validate(args.repo)
-    elif args.check == "runbook_checksums":
-        passed, details = check_runbook_checksums(args.repo)
-    elif args.check == "repo_type_consistency":
-        config = {"repo_root": args.repo, "expected_repo_type": args.repo_type}
-        payload = check_repo_type_consistency_impl(config)
-        passed, details = payload["pass"], payload["details"]
-    elif args.check == "checks_manifest_alignment":
-        config = {"manifest_path": args.manifest_path}
-        payload = check_checks_manifest_alignment_impl(config)
-        passed, details = payload["pass"], payload["details"]
-    elif args.check == "orphaned_assets":
-        passed, details = check_orphaned_assets(args.repo)
-    elif args.check == "gate_a_smoke":
-        passed, details = check_gate_a_smoke(args.repo)
-    elif args.check == "agent_safety":
-        passed, details = check_agent_safety(args.repo)
-    elif args.check == "test_policy_compliance":
-        passed, details = check_test_policy_compliance_impl(args.repo)
-    elif args.check == "release_integrity_check":
-        passed, details = check_release_integrity_impl(
-            args.repo,
-            args.release_tag,
-            args.release_verify_script,
-        )
-    else:
-        if args.check == "skill_structure_v2":
-            passed, details = check_skill_structure_v2(args.repo, args.skills_root)
-        else:
-            passed, details = check_start_here_sync(args.repo, args.profile_path)
+def check_repo_type_consistency(repo_path, repo_type):
+    config = {"repo_root": repo_path, "expected_repo_type": repo_type}
+    payload = check_repo_type_consistency_impl(config)
+    return payload["pass"], payload["details"]
+
 
-    output = {
+def check_checks_manifest_alignment(manifest_path):
+    config = {"manifest_path": manifest_path}
+    payload = check_checks_manifest_alignment_impl(config)
+    return payload["pass"], payload["details"]
+
+
+def run_check(args):
+    return registry.run(args.check, args)
+
+
+def request_args(request):
+    """Namespace for a JSON check request, filled with the CLI defaults."""
+    args = build_parser().parse_args([])
+    for key, value in request.items():
+        setattr(args, key.replace("-", "_"), value)
+    return args
+
+
+def execute_request(request):
+    return execute(request_args(request))
+
+
+def execute(args):
+    with tracing.span(args.check, cat="check", repo=args.repo), tracing.profile(args.check):
+        passed, details = run_check(args)
+    return {
         "check": args.check,
         "repo": os.path.abspath(args.repo),
         "pass": passed,
         "details": details,
     }
-    print(json.dumps(output, ensure_ascii=True))
-    return 0 if passed else 1
+
+
+def main():
+    parser = build_parser()
+    return dispatch(parser, parser.parse_args())
+
+
+def dispatch(parser, args):
+    """Run whichever mode ``args`` selects; ``parser`` reports usage errors."""
+    if args.list_checks:
+        print(json.dumps(sorted(registry.available_checks()), ensure_ascii=True))
+        return 0
+    if args.watch:
+        if not args.repo:
+            parser.error("--repo is required")
+        selected = args.check.split(",") if args.check else None
+        for name in selected or []:
+            if registry.describe(name) is None:
+                parser.error(f"unknown check: {name} (see --list-checks)")
+        from runner import watch
+
+        try:
+            watch.watch(args, selected, execute)
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if args.repos or args.workspace:
+        if not args.check:
+            parser.error("--check is required")
+        selected = args.check.split(",")
+        for name in selected:
+            if registry.describe(name) is None:
+                parser.error(f"unknown check: {name} (see --list-checks)")
+        from runner import fanout
+
+        repos = fanout.discover_repos(args.repos, args.workspace)
+        if not repos:
+            parser.error("no repos matched --repos/--workspace")
+        tracing.configure(args.trace_out, process_name="run_repo_checks")
+        try:
+            with tracing.span("fanout", cat="run", repos=len(repos), checks=len(selected)):
+                report = fanout.run(args, repos, selected, args.jobs)
+        finally:
+            tracing.flush()
+        print(json.dumps(report, ensure_ascii=True))
+        return 0 if report["pass"] else 1
+    if args.shard:
+        return run_shard(parser, args)
+    if args.since or args.staged:
+        return run_changed(parser, args)
+    if not args.check or not args.repo:
+        parser.error("--check and --repo are required")
+    if registry.describe(args.check) is None:
+        parser.error(f"unknown check: {args.check} (see --list-checks)")
+
+    tracing.configure(args.trace_out, args.profile_out, process_name="run_repo_checks")
+    try:
+        if args.baseline:
+            return run_baseline(args)
+        if args.format == "ndjson" or args.aggregate:
+            return run_streaming(args)
+        result = execute(args)
+    finally:
+        tracing.flush()
+
+    print(json.dumps(result, ensure_ascii=True))
+    return 0 if result["pass"] else 1
+
+
+def run_streaming(args):
+    head = {"check": args.check, "repo": os.path.abspath(args.repo)}
+    with tracing.span(args.check, cat="check", repo=args.repo), tracing.profile(args.check):
+        passed, details = registry.stream(args.check, args)
+        if not args.aggregate:
+            summary = output.write_ndjson(head, details, passed, sys.stdout)
+            return 0 if summary["pass"] else 1
+        import tempfile
+
+        spill_path = args.spill or os.path.join(tempfile.gettempdir(), f"aaa-evals-{args.check}-{os.getpid()}.ndjson")
+        summary = output.aggregate(details, args.sample_size, spill_path)
+    result = {**head, "pass": summary["total"] == 0 if passed is None else passed, "summary": summary}
+    if args.format == "ndjson":
+        result = {"type": "summary", **result}
+    print(json.dumps(result, ensure_ascii=True))
+    return 0 if result["pass"] else 1
+
+
+def run_changed(parser, args):
+    from runner import fanout
+
+    if not args.repo:
+        parser.error("--repo is required")
+    selected = args.check.split(",") if args.check else None
+    for name in selected or []:
+        if registry.describe(name) is None:
+            parser.error(f"unknown check: {name} (see --list-checks)")
+    repo = os.path.abspath(args.repo)
+    changed = gitfiles.changed_files(repo, args.since, args.staged)
+    if changed is None:
+        parser.error(f"cannot diff {repo} against {args.since or 'the index'}: not a git repo or unknown ref")
+    names = registry.affected_checks([os.path.join(repo, path) for path in changed], args, selected)
+
+    tracing.configure(args.trace_out, args.profile_out, process_name="run_repo_checks")
+    try:
+        # Checks that accept changed_files only look at the changed paths.
+        results = [
+            execute(argparse.Namespace(**{**vars(args), "check": name, "changed_files": changed})) for name in names
+        ]
+    finally:
+        tracing.flush()
+    report = {**fanout.report(results, [repo], names), "changed": changed}
+    print(json.dumps(report, ensure_ascii=True))
+    return 0 if report["pass"] else 1
+
+
+def run_shard(parser, args):
+    from runner import fanout, shard
+
+    if not args.check or not args.repo:
+        parser.error("--check and --repo are required")
+    selected = args.check.split(",")
+    for name in selected:
+        if registry.describe(name) is None:
+            parser.error(f"unknown check: {name} (see --list-checks)")
+    try:
+        shard.parse(args.shard)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    shard.reset()
+    tracing.configure(args.trace_out, args.profile_out, process_name="run_repo_checks")
+    try:
+        if len(selected) == 1 and "shard" in registry.describe(selected[0])["params"]:
+            # Case-driven checks split their own cases across shards.
+            report = execute(args)
+        else:
+            names = shard.select(selected, args.shard, shard.load_timings(args.timings))
+            results = []
+            for name in names:
+                start = time.perf_counter()
+                results.append(execute(argparse.Namespace(**{**vars(args), "check": name, "shard": ""})))
+                shard.observe(name, (time.perf_counter() - start) * 1000)
+            report = fanout.report(results, [os.path.abspath(args.repo)], names)
+    finally:
+        tracing.flush()
+
+    # Timings are folded back by the merge step; updating them here would change the plan of later shards.
+    print(json.dumps({**report, "shard": args.shard, "timings": shard.observed()}, ensure_ascii=True))
+    return 0 if report["pass"] else 1
+
+
+def run_baseline(args):
+    from runner import budgets
+
+    # Measured in fresh interpreters: the same check request, minus the options that only steer this process.
+    local_only = ("baseline", "record_baseline", "repeat", "tolerance", "trace_out", "profile_out", "list_checks")
+    request = {key: value for key, value in vars(args).items() if key not in local_only}
+    request["repo"] = os.path.abspath(args.repo)
+    result, measured = budgets.measure("runner.run_repo_checks:execute_request", request, args.repeat)
+    result["measured"] = measured
+    if args.record_baseline:
+        budgets.record(args.baseline, result["pass"], measured)
+        print(json.dumps(result, ensure_ascii=True))
+        return 0 if result["pass"] else 1
+    result["regressions"] = budgets.compare(budgets.load(args.baseline), result["pass"], measured, args.tolerance)
+    print(json.dumps(result, ensure_ascii=True))
+    return 1 if result["regressions"] else 0
 
 
 if __name__ == "__main__":
+    # Registry targets name this module; reuse the running copy instead of re-importing it.
+    sys.modules.setdefault("runner.run_repo_checks", sys.modules[__name__])
     sys.exit(main())
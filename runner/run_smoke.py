@@ -1,9 +1,235 @@
+"""Smoke eval runner: send each case's prompt to a model backend and score the output.
+
+Cases are JSONL (``{"id", "prompt", "expected"}``; ``expected`` may be a list
+of accepted outputs and ``match`` overrides ``--match`` per case). They are
+streamed through a bounded queue to ``--concurrency`` asyncio workers; a
+worker groups up to the backend's batch size of queued cases into one call.
+The report has the pass rate, nearest-rank p50/p95/p99 latency per case (a
+batched case is charged its batch's latency) and throughput in cases per
+second. The run passes when the pass rate reaches ``--min-pass-rate``
+(default: the suite baseline's ``pass_rate``). With the shared response
+cache (``runner/response_cache.py``) enabled, cases answered from it are
+counted as ``cached`` and left out of the latency and throughput figures.
+"""
+
+import argparse
+import asyncio
 import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+try:
+    from runner import backends, budgets, response_cache
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from runner import backends, budgets, response_cache
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CASES = REPO_ROOT / "evals" / "cases" / "smoke_cases.jsonl"
+DEFAULT_BASELINE = REPO_ROOT / "evals" / "baselines" / "smoke.baseline.json"
+DEFAULT_STUB_RESPONSES = REPO_ROOT / "evals" / "cases" / "smoke_stub_responses.json"
+MATCH_MODES = ("exact", "contains", "regex")
+DEFAULT_CONCURRENCY = 8
+
+
+def iter_cases(path: str | Path) -> Iterator[dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                case = json.loads(line)
+            except json.JSONDecodeError as exc:
+                # Reported as a failing case instead of aborting the run.
+                yield {"id": f"line-{line_number}", "invalid": f"invalid JSON: {exc}"}
+                continue
+            if not isinstance(case, dict):
+                yield {"id": f"line-{line_number}", "invalid": "invalid case: expected a JSON object"}
+                continue
+            case.setdefault("id", f"line-{line_number}")
+            yield case
+
+
+def score(case: dict[str, Any], output: str, match: str = "exact") -> bool:
+    mode = case.get("match", match)
+    expected = case.get("expected", "")
+    for candidate in expected if isinstance(expected, list) else [expected]:
+        candidate = str(candidate)
+        if mode == "contains" and candidate in output:
+            return True
+        if mode == "regex" and re.search(candidate, output):
+            return True
+        if mode == "exact" and candidate.strip() == output.strip():
+            return True
+    return False
+
+
+async def _produce(cases: Iterable[dict[str, Any]], queue: asyncio.Queue, workers: int) -> None:
+    for case in cases:
+        await queue.put(case)
+    for _ in range(workers):
+        await queue.put(None)
+
+
+async def _worker(
+    queue: asyncio.Queue,
+    backend: dict[str, Any],
+    params: dict[str, Any],
+    match: str,
+    stats: dict[str, Any],
+    responses: response_cache.ResponseCache | None,
+) -> None:
+    done = False
+    while not done:
+        case = await queue.get()
+        if case is None:
+            return
+        batch = [case]
+        while len(batch) < backend["batch_size"]:
+            try:
+                queued = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if queued is None:  # this worker's sentinel: finish the batch, then stop
+                done = True
+                break
+            batch.append(queued)
+        for item in [item for item in batch if "invalid" in item]:
+            stats["total"] += 1
+            stats["failures"].append({"id": item["id"], "error": item["invalid"]})
+        batch = [item for item in batch if "invalid" not in item]
+        if not batch:
+            continue
+        prompts = [str(item.get("prompt", "")) for item in batch]
+        start = time.perf_counter()
+        try:
+            if responses is None:
+                outputs, cached = await backend["complete"](prompts, params), [False] * len(batch)
+            else:
+                outputs, cached = await responses.complete(backend, prompts, params, [item["id"] for item in batch])
+            error = ""
+        except RuntimeError as exc:
+            outputs, cached, error = [], [False] * len(batch), str(exc)
+        latency_ms = (time.perf_counter() - start) * 1000.0
+        for index, item in enumerate(batch):
+            stats["total"] += 1
+            if cached[index]:
+                stats["cached"] += 1
+            else:
+                stats["latencies"].append(latency_ms)
+            case_error, passed = error, False
+            if not case_error:
+                try:
+                    passed = score(item, outputs[index], match)
+                except re.error as exc:
+                    case_error = f"invalid regex: {exc}"
+            if case_error:
+                stats["failures"].append({"id": item["id"], "error": case_error})
+            elif passed:
+                stats["passed"] += 1
+            else:
+                stats["failures"].append({"id": item["id"], "expected": item.get("expected"), "actual": outputs[index]})
+
+
+async def run(
+    cases: Iterable[dict[str, Any]],
+    backend: dict[str, Any],
+    params: dict[str, Any] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    match: str = "exact",
+    responses: response_cache.ResponseCache | None = None,
+) -> dict[str, Any]:
+    """Evaluate ``cases`` and return pass/latency/throughput stats (without the pass verdict)."""
+    workers = max(1, concurrency)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * backend["batch_size"])
+    stats: dict[str, Any] = {"total": 0, "passed": 0, "cached": 0, "latencies": [], "failures": []}
+    start = time.perf_counter()
+    await asyncio.gather(
+        _produce(cases, queue, workers),
+        *(_worker(queue, backend, params or {}, match, stats, responses) for _ in range(workers)),
+    )
+    elapsed = time.perf_counter() - start
+    latencies = stats["latencies"]
+    total = stats["total"]
+    # Only cases the backend answered are timed: cache hits would report the cache, not the agent.
+    return {
+        "backend": backend["id"],
+        "model": backend["model"],
+        "total": total,
+        "passed": stats["passed"],
+        "cached": stats["cached"],
+        "pass_rate": round(stats["passed"] / total, 4) if total else 0.0,
+        "latency_ms": {
+            name: round(budgets.percentile(latencies, fraction), 3) if latencies else None
+            for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+        },
+        "throughput_per_s": round(len(latencies) / elapsed, 3) if latencies and elapsed > 0 else None,
+        "failures": sorted(stats["failures"], key=lambda failure: str(failure["id"])),
+    }
+
+
+def baseline_pass_rate(path: str | Path) -> float:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return float(json.load(handle).get("pass_rate", 1.0))
+    except (OSError, ValueError):
+        return 1.0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run the smoke eval suite against a model backend")
+    parser.add_argument("--suite", default="smoke")
+    parser.add_argument("--cases", default=str(DEFAULT_CASES), help="JSONL cases with prompt and expected")
+    parser.add_argument(
+        "--backend",
+        default=os.environ.get("AAA_EVALS_BACKEND", "stub"),
+        help="http:URL, cmd:COMMAND or stub (default: $AAA_EVALS_BACKEND or stub)",
+    )
+    parser.add_argument("--model", default=os.environ.get("AAA_EVALS_MODEL", ""), help="Model id sent to the backend")
+    parser.add_argument("--param", action="append", default=[], help="Backend parameter KEY=VALUE (repeatable)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Concurrent backend calls")
+    parser.add_argument("--batch-size", type=int, default=1, help="Cases per call for backends that batch")
+    parser.add_argument("--timeout", type=float, default=backends.DEFAULT_TIMEOUT_SECONDS, help="Per-call timeout")
+    parser.add_argument("--match", choices=MATCH_MODES, default="exact", help="Default scoring mode")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline with the required pass_rate")
+    parser.add_argument("--min-pass-rate", type=float, default=None, help="Override the baseline pass_rate")
+    parser.add_argument(
+        "--stub-responses", default=str(DEFAULT_STUB_RESPONSES), help="JSON {prompt: output} for the stub backend"
+    )
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0, help="Simulated latency of the stub backend")
+    response_cache.add_arguments(parser)
+    return parser
+
 
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+    try:
+        backend = backends.create(
+            args.backend, args.model, args.batch_size, args.timeout, args.stub_responses, args.stub_latency_ms
+        )
+        params = backends.parse_params(args.param)
+        responses = response_cache.from_args(args)
+    except (OSError, ValueError, sqlite3.Error) as exc:
+        parser.error(str(exc))
 
-def main():
-    print(json.dumps({"suite": "smoke", "pass": True, "pass_rate": 1.0}))
+    try:
+        result = asyncio.run(run(iter_cases(args.cases), backend, params, args.concurrency, args.match, responses))
+    finally:
+        if responses is not None:
+            responses.close()
+    if responses is not None:
+        result["cache"] = responses.stats()
+    min_pass_rate = args.min_pass_rate if args.min_pass_rate is not None else baseline_pass_rate(args.baseline)
+    passed = result["total"] > 0 and result["pass_rate"] >= min_pass_rate
+    print(json.dumps({"suite": args.suite, "pass": passed, "min_pass_rate": min_pass_rate, **result}))
+    return 0 if passed else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
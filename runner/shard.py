@@ -0,0 +1,150 @@
+"""Duration-aware sharding of checks and cases across CI nodes.
+
+``--shard INDEX/COUNT`` (1-based) selects the work items of one shard. Items
+are packed longest-processing-time first: sorted by their historical
+duration (from a persisted timings file; unknown items get the mean of the
+known ones) and each assigned to the currently lightest shard, so every
+node ends up with roughly total/COUNT of the work. The assignment depends
+only on the item keys and the timings, so every node computes the same
+plan. ``merge`` combines shard outputs into one result and folds their
+observed timings back into the timings file.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    from runner import cache, fanout
+except ModuleNotFoundError:  # pragma: no cover - allow script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from runner import cache, fanout
+
+_lock = threading.Lock()
+_observed: dict[str, float] = {}
+
+
+def parse(spec: str) -> tuple[int, int]:
+    """``"2/4"`` -> ``(2, 4)``; raises ValueError unless 1 <= INDEX <= COUNT."""
+    index, sep, count = spec.partition("/")
+    if not sep or not index.strip().isdigit() or not count.strip().isdigit():
+        raise ValueError(f"invalid shard {spec!r}: expected INDEX/COUNT")
+    index_value, count_value = int(index), int(count)
+    if not 1 <= index_value <= count_value:
+        raise ValueError(f"invalid shard {spec!r}: INDEX must be between 1 and COUNT")
+    return index_value, count_value
+
+
+def timings_path(path: str = "") -> str:
+    return path or cache.cache_dir("shard-timings.json")
+
+
+def load_timings(path: str = "") -> dict[str, float]:
+    try:
+        with open(timings_path(path), "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return {key: float(value) for key, value in payload.get("timings", {}).items()}
+
+
+def save_timings(path: str, timings: dict[str, float]) -> None:
+    """Merge ``timings`` (milliseconds per item key) into the timings file."""
+    if not timings:
+        return
+    path = timings_path(path)
+    merged = {**load_timings(path), **{key: round(value, 3) for key, value in timings.items()}}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"timings": dict(sorted(merged.items()))}, handle, ensure_ascii=True)
+        os.replace(tmp_path, path)
+    except OSError:  # timings only improve the next plan
+        pass
+
+
+def observe(key: str, duration_ms: float) -> None:
+    with _lock:
+        _observed[key] = duration_ms
+
+
+def reset() -> None:
+    with _lock:
+        _observed.clear()
+
+
+def observed() -> dict[str, float]:
+    with _lock:
+        return dict(_observed)
+
+
+def assign(keys: Iterable[str], count: int, timings: dict[str, float]) -> list[list[str]]:
+    """LPT bin packing of ``keys`` into ``count`` shards; each shard keeps the input order."""
+    keys = list(dict.fromkeys(keys))
+    known = [timings[key] for key in keys if key in timings]
+    default = sum(known) / len(known) if known else 1.0
+    position = {key: index for index, key in enumerate(keys)}
+    loads = [0.0] * count
+    shards: list[list[str]] = [[] for _ in range(count)]
+    for key in sorted(keys, key=lambda item: (-timings.get(item, default), item)):
+        target = min(range(count), key=lambda index: (loads[index], index))
+        loads[target] += timings.get(key, default)
+        shards[target].append(key)
+    return [sorted(shard, key=position.__getitem__) for shard in shards]
+
+
+def select(keys: Iterable[str], spec: str, timings: dict[str, float]) -> list[str]:
+    index, count = parse(spec)
+    return assign(keys, count, timings)[index - 1]
+
+
+def _detail_key(detail: Any) -> str:
+    return json.dumps(detail, sort_keys=True, ensure_ascii=True)
+
+
+def merge(outputs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine shard outputs (single-check or multi-check reports) into one deterministic result."""
+    results: dict[tuple[str, str], dict[str, Any]] = {}
+    timings: dict[str, float] = {}
+    for output in sorted(outputs, key=lambda item: parse(item["shard"]) if item.get("shard") else (0, 0)):
+        timings.update(output.get("timings", {}))
+        for result in output.get("results", [output] if "check" in output else []):
+            key = (result["repo"], result["check"])
+            merged = results.setdefault(
+                key, {"check": result["check"], "repo": result["repo"], "pass": True, "details": []}
+            )
+            merged["pass"] = merged["pass"] and result["pass"]
+            merged["details"].extend(result.get("details", []))
+            if "error" in result:
+                merged["error"] = result["error"]
+    for merged in results.values():
+        merged["details"].sort(key=_detail_key)
+    ordered = [results[key] for key in sorted(results)]
+    if len(ordered) == 1 and all("results" not in output for output in outputs):
+        return {**ordered[0], "timings": dict(sorted(timings.items()))}
+    repos = sorted({result["repo"] for result in ordered})
+    checks = sorted({result["check"] for result in ordered})
+    return {**fanout.report(ordered, repos, checks), "timings": dict(sorted(timings.items()))}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Merge run_repo_checks --shard outputs")
+    parser.add_argument("outputs", nargs="+", help="JSON output files of the individual shards")
+    parser.add_argument("--timings-out", default="", help="Also merge observed timings into this timings file")
+    args = parser.parse_args()
+
+    outputs = [json.loads(Path(path).read_text(encoding="utf-8")) for path in args.outputs]
+    merged = merge(outputs)
+    if args.timings_out:
+        save_timings(args.timings_out, merged["timings"])
+    print(json.dumps(merged, ensure_ascii=True))
+    return 0 if merged["pass"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
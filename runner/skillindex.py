@@ -0,0 +1,46 @@
+"""Index of skills under ``skills/{common,codex,agent}`` and their SKILL.md sections.
+
+Skill directories are listed once and their SKILL.md files are scanned in
+parallel with the streaming heading scanner (cached by mtime/size), so
+presence and required-section checks share one pass over the tree.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from runner import headings
+
+SKILL_BUCKETS = ("common", "codex", "agent")
+MAX_WORKERS = 16
+
+
+def _skill_entry(bucket: str, bucket_path: str, name: str, sections: tuple[str, ...]) -> dict[str, Any] | None:
+    skill_path = os.path.join(bucket_path, name)
+    if not os.path.isdir(skill_path):
+        return None
+    skill_md = os.path.join(skill_path, "SKILL.md")
+    entry: dict[str, Any] = {"bucket": bucket, "name": name, "skill_md": None, "missing_sections": None}
+    if os.path.isfile(skill_md):
+        entry["skill_md"] = skill_md
+        if sections and name.startswith("aaa-"):
+            entry["missing_sections"] = headings.missing(skill_md, sections)
+    return entry
+
+
+def scan(root: str, sections: tuple[str, ...] = ()) -> dict[str, Any]:
+    """List every skill of every bucket; ``aaa-*`` skills also report which ``sections`` are missing."""
+    missing_buckets = []
+    jobs = []
+    for bucket in SKILL_BUCKETS:
+        bucket_path = os.path.join(root, bucket)
+        if not os.path.isdir(bucket_path):
+            missing_buckets.append(bucket)
+            continue
+        for name in sorted(os.listdir(bucket_path)):
+            if not name.startswith("."):
+                jobs.append((bucket, bucket_path, name, sections))
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, max(1, len(jobs)))) as pool:
+        entries = list(pool.map(lambda job: _skill_entry(*job), jobs))
+    return {"missing_buckets": missing_buckets, "skills": [entry for entry in entries if entry is not None]}
@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from runner import budgets
+
+PROBE = """
+import os, subprocess, sys
+from runner import cache
+
+
+def run(payload):
+    memoized = len(cache._entries)
+    cache.read_text(payload["path"])
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    cache_dir = cache.cache_dir()
+    cached = sorted(os.listdir(cache_dir)) if os.path.isdir(cache_dir) else []
+    return {"pass": True, "memoized": memoized, "cached": cached}
+"""
+
+
+class TestBudgets(unittest.TestCase):
+    def test_measure_runs_cold_and_counts_spawned_processes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "budget_probe.py").write_text(PROBE, encoding="utf-8")
+            env = {**os.environ, "PYTHONPATH": tmp, "AAA_EVALS_CACHE_DIR": os.path.join(tmp, "warm")}
+            os.makedirs(os.path.join(tmp, "warm"))
+            Path(tmp, "warm", "marker").write_text("x", encoding="utf-8")
+
+            output, measured = budgets.measure("budget_probe:run", {"path": __file__}, repeat=3, env=env)
+
+        # Each run starts with nothing memoized and an empty persistent cache directory.
+        self.assertEqual(output, {"pass": True, "memoized": 0, "cached": []})
+        self.assertEqual(measured["runs"], 3)
+        self.assertEqual(measured["subprocesses"], 1)
+        self.assertGreater(measured["peak_rss_mb"], 0)
+        self.assertLessEqual(measured["wall_ms_median"], measured["wall_ms_p95"])
+
+    def test_measure_reports_a_failed_run(self):
+        with self.assertRaisesRegex(RuntimeError, "failed with exit code 1"):
+            budgets.measure("runner.no_such_module:run", {}, repeat=1)
+
+    def test_record_keeps_existing_baseline_keys(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "readme.baseline.json"
+            path.write_text(json.dumps({"suite": "readme", "pass_rate": 1.0}), encoding="utf-8")
+            budgets.record(str(path), True, {"wall_ms_median": 2.0, "subprocesses": 0})
+            baseline = json.loads(path.read_text(encoding="utf-8"))
+
+        self.assertEqual(baseline["suite"], "readme")
+        self.assertEqual(baseline["measured"], {"pass": True, "wall_ms_median": 2.0, "subprocesses": 0})
+
+    def test_compare_reports_budget_and_recorded_regressions(self):
+        baseline = {
+            "pass_rate": 1.0,
+            "budgets": {"subprocesses": 2, "tolerance": 0.5},
+            "measured": {"wall_ms_p95": 100.0, "peak_rss_mb": 40.0},
+        }
+        within = {"wall_ms_p95": 104.0, "peak_rss_mb": 60.0, "subprocesses": 3}
+        beyond = {"wall_ms_p95": 400.0, "peak_rss_mb": 61.0, "subprocesses": 4}
+
+        self.assertEqual(budgets.compare(baseline, True, within), [])
+        regressions = budgets.compare(baseline, False, beyond)
+        self.assertEqual(
+            [item.split(":")[0] for item in regressions], ["pass", "wall_ms_p95", "peak_rss_mb", "subprocesses"]
+        )
+        self.assertIn("exceeds budget 2", regressions[-1])
+        self.assertEqual(budgets.compare(baseline, True, within, tolerance=0), [
+            "peak_rss_mb: 60 exceeds recorded 40 (+0%)",
+            "subprocesses: 3 exceeds budget 2 (+0%)",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from runner import cache
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_read_text_reuses_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "doc.md"
+            path.write_text("one", encoding="utf-8")
+            builds = []
+
+            def _build(p):
+                builds.append(p)
+                return Path(p).read_text(encoding="utf-8")
+
+            self.assertEqual(cache.memoize_file("text", str(path), _build), "one")
+            self.assertEqual(cache.memoize_file("text", str(path), _build), "one")
+            self.assertEqual(len(builds), 1)
+
+            path.write_text("two!", encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(cache.memoize_file("text", str(path), _build), "two!")
+            self.assertEqual(len(builds), 2)
+
+    def test_compiled_validator_is_shared(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            schema = Path(tmp) / "schema.json"
+            schema.write_text(json.dumps({"type": "object", "required": ["id"]}), encoding="utf-8")
+            try:
+                first = cache.compiled_validator(schema)
+            except ImportError:
+                self.skipTest("jsonschema not available")
+            self.assertIs(first, cache.compiled_validator(schema))
+            self.assertFalse(first.is_valid({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import io
+import json
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import gitfiles, run_repo_checks
+
+SCHEMA = {"type": "object", "required": ["metadata", "steps"]}
+
+
+def _git(repo: Path, *argv: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *argv], check=True, capture_output=True)
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestChangeScoped(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        (self.repo / "aaa-tools" / "specs").mkdir(parents=True)
+        (self.repo / "aaa-tools" / "specs" / "runbook.schema.json").write_text(json.dumps(SCHEMA), encoding="utf-8")
+        self.runbooks = self.repo / "aaa-tools" / "runbooks"
+        self.runbooks.mkdir()
+        # Already broken on the base commit; scoped runs must not report it.
+        (self.runbooks / "legacy.yaml").write_text(json.dumps({"metadata": {}}), encoding="utf-8")
+        (self.runbooks / "deploy.yaml").write_text(json.dumps({"metadata": {}, "steps": []}), encoding="utf-8")
+        (self.repo / "README.md").write_text("# Repo\n", encoding="utf-8")
+        _git(self.repo, "init", "-q")
+        _git(self.repo, "add", "-A")
+        _git(self.repo, "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "base")
+
+    def _run(self, *argv):
+        with patch("sys.argv", ["run_repo_checks.py", "--repo", str(self.repo), *argv]), \
+                patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            code = run_repo_checks.main()
+        return code, json.loads(stdout.getvalue())
+
+    def test_since_runs_affected_checks_on_changed_files_only(self):
+        (self.runbooks / "deploy.yaml").write_text(json.dumps({"steps": []}), encoding="utf-8")
+        (self.runbooks / "rollback.yaml").write_text(json.dumps({"metadata": {}, "steps": []}), encoding="utf-8")
+
+        code, report = self._run("--since", "HEAD")
+
+        self.assertEqual(code, 1)
+        self.assertEqual(report["changed"], ["aaa-tools/runbooks/deploy.yaml", "aaa-tools/runbooks/rollback.yaml"])
+        self.assertEqual(report["checks"], ["runbook_schema_validate"])
+        details = report["results"][0]["details"]
+        self.assertEqual(len(details), 1)
+        self.assertTrue(details[0].startswith("aaa-tools/runbooks/deploy.yaml:"))
+
+    def test_schema_change_validates_every_runbook(self):
+        (self.repo / "aaa-tools" / "specs" / "runbook.schema.json").write_text(
+            json.dumps({**SCHEMA, "title": "runbook"}), encoding="utf-8"
+        )
+        _code, report = self._run("--since", "HEAD", "--check", "runbook_schema_validate,readme")
+        self.assertEqual(report["checks"], ["runbook_schema_validate"])
+        self.assertTrue(report["results"][0]["details"][0].startswith("aaa-tools/runbooks/legacy.yaml:"))
+
+    def test_staged_uses_the_index(self):
+        (self.repo / "README.md").write_text("# Repo\n\nMore.\n", encoding="utf-8")
+        (self.runbooks / "deploy.yaml").write_text("{}", encoding="utf-8")
+        _git(self.repo, "add", "README.md")
+
+        self.assertEqual(gitfiles.changed_files(str(self.repo), staged=True), ["README.md"])
+        _code, report = self._run("--staged")
+        # Any Markdown edit can introduce ref drift, so the workspace-wide drift checks run too.
+        self.assertEqual(report["checks"], ["readme", "onboarding_doc_drift", "cli_contract_sync"])
+
+
+if __name__ == "__main__":
+    unittest.main()
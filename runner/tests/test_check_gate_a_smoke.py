@@ -4,6 +4,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from runner import preflight
 from runner.checks.check_gate_a_smoke import check_gate_a_smoke
 
 
@@ -34,7 +35,7 @@ class TestCheckGateASmoke(unittest.TestCase):
             plan_path = Path(tmp) / "plan.json"
             _write_plan(plan_path, "v0.1.0")
 
-            def _fake_run(cmd, capture_output, text, check):
+            def _fake_run(cmd, capture_output, text, check, env):
                 repo = cmd[-1]
                 stdout = ""
                 if repo.endswith("org/ok.git"):
@@ -57,7 +58,7 @@ class TestCheckGateASmoke(unittest.TestCase):
             plan_path = Path(tmp) / "plan.json"
             _write_plan(plan_path, "v0.1.0")
 
-            def _fake_run(cmd, capture_output, text, check):
+            def _fake_run(cmd, capture_output, text, check, env):
                 return type(
                     "Result",
                     (),
@@ -75,6 +76,23 @@ class TestCheckGateASmoke(unittest.TestCase):
             self.assertTrue(result["pass"])
             self.assertEqual(result["details"], [])
 
+    def test_tag_query_uses_the_resolved_git(self):
+        calls = []
+
+        def _fake_run(cmd, **kwargs):
+            calls.append((cmd, kwargs["env"]))
+            return type("Result", (), {"returncode": 0, "stdout": "abc\trefs/tags/v0.1.0\n", "stderr": ""})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            plan_path = Path(tmp) / "plan.json"
+            _write_plan(plan_path, "v0.1.0")
+            with patch("runner.checks.check_gate_a_smoke.subprocess.run", side_effect=_fake_run):
+                result = check_gate_a_smoke({"plan_path": str(plan_path), "template_repos": ["org/ok"]}, Path(tmp))
+
+        self.assertTrue(result["pass"])
+        self.assertEqual(calls[0][0][:1], preflight.argv("git"))
+        self.assertEqual(calls[0][1]["GIT_TERMINAL_PROMPT"], "0")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,25 @@
+import os
+import subprocess
+import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from runner.checks import check_release_integrity as release_integrity
 from runner.checks.check_release_integrity import check_release_integrity
 
 
 class ReleaseIntegrityTests(unittest.TestCase):
+    def setUp(self):
+        self._cache = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {"AAA_EVALS_CACHE_DIR": self._cache.name})
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+        self._cache.cleanup()
+
     def test_missing_tag_fails(self):
         ok, details = check_release_integrity("/tmp", "")
         self.assertFalse(ok)
@@ -19,37 +33,123 @@ class ReleaseIntegrityTests(unittest.TestCase):
     def test_script_failure_reports_output(self):
         repo_root = Path(__file__).resolve().parent
         script_path = repo_root / "release-verify.sh"
-        script_path.write_text("#!/usr/bin/env bash\nexit 1\n", encoding="utf-8")
+        script_path.write_text("#!/usr/bin/env bash\necho out\necho err >&2\nexit 2\n", encoding="utf-8")
         try:
-            with patch("runner.checks.check_release_integrity.subprocess.run") as mock_run:
-                mock_run.return_value = type(
-                    "Result",
-                    (),
-                    {"returncode": 2, "stdout": "out", "stderr": "err"},
-                )()
-                ok, details = check_release_integrity(str(repo_root), "v1.0.0", str(script_path))
-                self.assertFalse(ok)
-                self.assertTrue(any("release verify failed" in item for item in details))
+            ok, details = check_release_integrity(str(repo_root), "v1.0.0", str(script_path))
+            self.assertFalse(ok)
+            self.assertEqual(details, ["release verify failed: out\nerr"])
         finally:
             script_path.unlink(missing_ok=True)
 
     def test_success_passes(self):
         repo_root = Path(__file__).resolve().parent
         script_path = repo_root / "release-verify.sh"
-        script_path.write_text("#!/usr/bin/env bash\nexit 0\n", encoding="utf-8")
+        script_path.write_text("#!/usr/bin/env bash\necho ok\nexit 0\n", encoding="utf-8")
         try:
-            with patch("runner.checks.check_release_integrity.subprocess.run") as mock_run:
-                mock_run.return_value = type(
-                    "Result",
-                    (),
-                    {"returncode": 0, "stdout": "ok", "stderr": ""},
-                )()
-                ok, details = check_release_integrity(str(repo_root), "v1.0.0", str(script_path))
-                self.assertTrue(ok)
-                self.assertEqual(details, [])
+            ok, details = check_release_integrity(str(repo_root), "v1.0.0", str(script_path))
+            self.assertTrue(ok)
+            self.assertEqual(details, [])
         finally:
             script_path.unlink(missing_ok=True)
 
+    def test_output_is_kept_in_a_bounded_tail(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            script_path = Path(tmp) / "release-verify.sh"
+            script_path.write_text("for i in $(seq 1 5000); do echo line-$i; done\nexit 1\n", encoding="utf-8")
+            ok, details = check_release_integrity(tmp, "v1.0.0", str(script_path))
+        self.assertFalse(ok)
+        lines = details[0].split("\n")
+        self.assertEqual(len(lines), release_integrity.OUTPUT_TAIL_LINES)
+        self.assertTrue(lines[-1].endswith("line-5000"))
+
+    def test_timeout_kills_the_script(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            script_path = Path(tmp) / "release-verify.sh"
+            script_path.write_text("echo started\nexec sleep 30\n", encoding="utf-8")
+            ok, details = check_release_integrity(tmp, "v1.0.0", str(script_path), timeout=0.3)
+        self.assertFalse(ok)
+        self.assertIn("timed out after 0.3s", details[0])
+
+    def test_timeout_kills_children_holding_the_output_pipe(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            script_path = Path(tmp) / "release-verify.sh"
+            script_path.write_text("echo started\nsleep 20\necho done\n", encoding="utf-8")
+            started = time.monotonic()
+            ok, details = check_release_integrity(tmp, "v1.0.0", str(script_path), timeout=0.3)
+            elapsed = time.monotonic() - started
+        self.assertFalse(ok)
+        self.assertLess(elapsed, 5)
+        self.assertEqual(details, ["release verify failed: timed out after 0.3s\nstarted"])
+
+    def test_tail_is_bounded_in_bytes_for_a_single_huge_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            script_path = Path(tmp) / "release-verify.sh"
+            script_path.write_text(
+                "head -c 5000000 /dev/zero | tr '\\0' 'x'\nprintf 'last\\r'\nexit 1\n", encoding="utf-8"
+            )
+            ok, details = check_release_integrity(tmp, "v1.0.0", str(script_path))
+        self.assertFalse(ok)
+        self.assertLessEqual(len(details[0]), release_integrity.OUTPUT_TAIL_BYTES + 100)
+        self.assertTrue(details[0].endswith("xlast"))
+
+    def test_verified_tag_is_cached_until_script_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            git = ["git", "-C", tmp, "-c", "user.name=t", "-c", "user.email=t@example.com"]
+            subprocess.run(git + ["init", "-q"], check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "init"], check=True)
+            subprocess.run(git + ["tag", "v1.0.0"], check=True)
+            script_path = repo / "release-verify.sh"
+            script_path.write_text("echo verified\n", encoding="utf-8")
+            calls = []
+            original = release_integrity._run_verify
+
+            def _counting(script, tag, timeout):
+                calls.append(tag)
+                return original(script, tag, timeout)
+
+            with patch.object(release_integrity, "_run_verify", _counting):
+                self.assertEqual(check_release_integrity(tmp, "v1.0.0", str(script_path)), (True, []))
+                ok, details = check_release_integrity(tmp, "v1.0.0", str(script_path))
+                self.assertTrue(ok)
+                self.assertTrue(details[0].startswith("cached: v1.0.0"))
+                check_release_integrity(tmp, "v1.0.0", str(script_path), force=True)
+                script_path.write_text("echo verified-v2\n", encoding="utf-8")
+                check_release_integrity(tmp, "v1.0.0", str(script_path))
+            self.assertEqual(len(calls), 3)
+
+    def test_tag_list_runs_concurrently_in_isolated_dirs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            script_path = Path(tmp) / "release-verify.sh"
+            script_path.write_text(
+                'sleep 0.4\n[ "$(ls -A)" = "" ] || exit 3\ntouch marker\n[ "$1" != v1.1.0 ] || exit 1\n',
+                encoding="utf-8",
+            )
+            started = time.monotonic()
+            ok, details = check_release_integrity(tmp, "v1.0.0,v1.1.0,v1.2.0", str(script_path), jobs=3)
+            elapsed = time.monotonic() - started
+        self.assertFalse(ok)
+        self.assertEqual(details, ["v1.1.0: release verify failed: release verify failed"])
+        self.assertLess(elapsed, 1.0)
+
+    def test_tag_range_expands_over_version_sorted_tags(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            git = ["git", "-C", tmp, "-c", "user.name=t", "-c", "user.email=t@example.com"]
+            subprocess.run(git + ["init", "-q"], check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "init"], check=True)
+            for tag in ("v1.2.0", "v1.10.0", "v1.9.0", "v2.0.0"):
+                subprocess.run(git + ["tag", tag], check=True)
+            script_path = Path(tmp) / "release-verify.sh"
+            script_path.write_text('echo "$1"\nexit 1\n', encoding="utf-8")
+            ok, details = check_release_integrity(tmp, "v1.9.0..v1.10.0", str(script_path))
+            self.assertFalse(ok)
+            self.assertEqual(
+                details,
+                ["v1.9.0: release verify failed: v1.9.0", "v1.10.0: release verify failed: v1.10.0"],
+            )
+            ok, details = check_release_integrity(tmp, "v9.0.0..v9.1.0", str(script_path))
+            self.assertEqual(details, ["release tag range unresolved: v9.0.0..v9.1.0"])
+
 
 if __name__ == "__main__":
     unittest.main()
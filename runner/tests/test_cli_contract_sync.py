@@ -1,7 +1,9 @@
+import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
@@ -9,6 +11,15 @@ from run_repo_checks import check_cli_contract_sync
 
 
 class TestCliContractSync(unittest.TestCase):
+    def setUp(self):
+        self._cache = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {"AAA_EVALS_CACHE_DIR": self._cache.name})
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+        self._cache.cleanup()
+
     def _write_common_files(self, root: Path):
         (root / ".github" / "profile").mkdir(parents=True)
         (root / "aaa-tpl-docs" / "docs" / "contracts").mkdir(parents=True)
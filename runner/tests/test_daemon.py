@@ -0,0 +1,100 @@
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import client, daemon, phrases, run_repo_checks
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _write_readme_repo(root: Path) -> None:
+    sections = "\n".join(phrases.rules_for("readme")[0]["phrases"])
+    (root / "README.md").write_text(sections, encoding="utf-8")
+    (root / "CODEOWNERS").write_text("* @aaa/qa\n", encoding="utf-8")
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.socket_path = str(self.root / "runner.sock")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _start_server(self):
+        server = daemon.CheckServer(self.socket_path, daemon._RequestHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+    def test_daemon_returns_same_shape_as_in_process(self):
+        _write_readme_repo(self.root)
+        self._start_server()
+
+        self.assertTrue(daemon.request({"op": "ping"}, self.socket_path)["ok"])
+        response = daemon.request({"op": "check", "check": "readme", "repo": str(self.root)}, self.socket_path)
+        expected = run_repo_checks.execute(run_repo_checks.request_args({"check": "readme", "repo": str(self.root)}))
+        self.assertEqual(response, expected)
+        self.assertTrue(response["pass"])
+
+    def test_daemon_reports_errors_without_dropping_connection(self):
+        self._start_server()
+        response = daemon.request({"op": "check", "check": "no_such_check", "repo": "."}, self.socket_path)
+        self.assertIn("unknown check", response["error"])
+
+    def test_client_falls_back_when_no_daemon(self):
+        _write_readme_repo(self.root)
+        args = run_repo_checks.request_args({"check": "readme", "repo": os.path.relpath(self.root)})
+        output = client.run(args, str(self.root / "missing.sock"))
+        self.assertEqual(output["repo"], str(self.root.resolve()))
+        self.assertTrue(output["pass"])
+
+        args = run_repo_checks.request_args({"check": "no_such_check", "repo": str(self.root)})
+        self.assertEqual(client.run(args, str(self.root / "missing.sock")), {"error": "unknown check: no_such_check"})
+
+    def test_client_runs_streaming_modes_in_process(self):
+        _write_readme_repo(self.root)
+        argv = ["client.py", "--check", "readme", "--repo", str(self.root), "--format", "ndjson",
+                "--socket", str(self.root / "missing.sock")]
+        with patch("sys.argv", argv), patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            code = client.main()
+        self.assertEqual(code, 0)
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(records[-1]["type"], "summary")
+        self.assertTrue(records[-1]["pass"])
+
+    def test_client_gives_up_on_a_daemon_that_does_not_answer(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+            listener.bind(self.socket_path)
+            listener.listen(1)
+            args = run_repo_checks.request_args({"check": "readme", "repo": str(self.root)})
+            with patch.object(client, "REQUEST_TIMEOUT", 0.2):
+                output = client.run(args, self.socket_path)
+        self.assertEqual(output, {"error": "daemon did not answer within 0.2s"})
+
+    def test_client_fast_path_does_not_import_the_runner(self):
+        script = (
+            "import json, sys\n"
+            "from runner import client\n"
+            "client.cli.build_parser().parse_args(['--check', 'readme', '--repo', '.'])\n"
+            "print(json.dumps(sorted(m for m in sys.modules if m.startswith('runner.'))))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(json.loads(result.stdout), ["runner.cli", "runner.client", "runner.output"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from runner import fanout, phrases
+from runner.run_repo_checks import build_parser
+
+
+class TestFanout(unittest.TestCase):
+    def test_discovers_git_clones_and_glob_matches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "ws" / "repo-a" / ".git").mkdir(parents=True)
+            (root / "ws" / "notes").mkdir()
+            (root / "extra" / "repo-b").mkdir(parents=True)
+            repos = fanout.discover_repos(str(root / "extra" / "*"), str(root / "ws"))
+            self.assertEqual(repos, [str(root / "extra" / "repo-b"), str(root / "ws" / "repo-a")])
+
+    def test_runs_checks_across_repos_with_rollups(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            good = Path(tmp) / "good"
+            bad = Path(tmp) / "bad"
+            bad.mkdir()
+            good.mkdir()
+            (good / "README.md").write_text(
+                "\n".join(phrases.rules_for("readme")[0]["phrases"]) + "\n", encoding="utf-8"
+            )
+            (good / "CODEOWNERS").write_text("* @owners\n", encoding="utf-8")
+            args = build_parser().parse_args([])
+            output = fanout.run(args, [str(bad), str(good)], ["post_init_audit_required", "readme"], jobs=2)
+
+        self.assertFalse(output["pass"])
+        self.assertEqual(output["summary"]["total"], 4)
+        self.assertEqual([(r["repo"], r["check"]) for r in output["results"]][:2],
+                         [(str(bad), "post_init_audit_required"), (str(bad), "readme")])
+        self.assertEqual(output["summary"]["passed"], 1)
+        self.assertEqual(output["by_check"]["readme"]["failed_repos"], [str(bad)])
+        self.assertEqual(output["by_repo"][str(good)]["failed_checks"], ["post_init_audit_required"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import gitfiles, run_repo_checks
+
+
+def _git(repo: Path, *argv: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *argv], check=True, capture_output=True)
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestGitFiles(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.workspace = Path(tmp.name)
+        self.repo = self.workspace / "aaa-docs"
+        adrs = self.repo / "docs" / "adrs"
+        adrs.mkdir(parents=True)
+        (adrs / "index.json").write_text(json.dumps({"files": [{"path": "001.md"}]}), encoding="utf-8")
+        (adrs / "001.md").write_text("# ADR\n", encoding="utf-8")
+        (self.repo / ".gitignore").write_text("build/\n", encoding="utf-8")
+        _git(self.repo, "init", "-q")
+        _git(self.repo, "add", "-A")
+        # Ignored output and an untracked draft next to the tracked ADR.
+        junk = self.repo / "build" / "docs" / "adrs"
+        junk.mkdir(parents=True)
+        (junk / "generated.md").write_text("# Generated\n", encoding="utf-8")
+        (adrs / "002-draft.md").write_text("# Draft\n", encoding="utf-8")
+
+    def test_lists_index_and_optionally_untracked_files(self):
+        self.assertEqual(gitfiles.list_files(str(self.repo)),
+                         [".gitignore", "docs/adrs/001.md", "docs/adrs/index.json"])
+        untracked = gitfiles.list_files(str(self.repo), untracked=True)
+        self.assertIn("docs/adrs/002-draft.md", untracked)
+        self.assertNotIn("build/docs/adrs/generated.md", untracked)
+        # A workspace that is not a repo is enumerated per clone.
+        self.assertEqual(gitfiles.list_files(str(self.workspace))[0], "aaa-docs/.gitignore")
+        self.assertIsNone(gitfiles.for_source(str(self.repo), "walk"))
+
+    def test_matching_spans_directories_only_with_double_star(self):
+        files = ["runbooks/a.yaml", "runbooks/security/b.yaml", "docs/runbooks/c.yaml"]
+        self.assertEqual(gitfiles.matching(files, "runbooks/*.yaml"), ["runbooks/a.yaml"])
+        self.assertEqual(gitfiles.matching(files, "runbooks/**/*.yaml"), files[:2])
+        self.assertEqual(gitfiles.matching(files, "**/runbooks/*.yaml"), ["runbooks/a.yaml", "docs/runbooks/c.yaml"])
+
+    def test_orphaned_assets_respects_gitignore(self):
+        walk_pass, walk_details = run_repo_checks.check_orphaned_assets(str(self.repo))
+        git_pass, git_details = run_repo_checks.check_orphaned_assets(str(self.repo), "git")
+        _, untracked_details = run_repo_checks.check_orphaned_assets(str(self.workspace), "git-untracked")
+
+        self.assertFalse(walk_pass)
+        self.assertEqual({detail["type"] for detail in walk_details}, {"orphaned_asset", "missing_index"})
+        self.assertTrue(git_pass, git_details)
+        self.assertEqual([Path(detail["path"]).name for detail in untracked_details], ["002-draft.md"])
+
+    def test_git_source_does_not_walk_the_tree(self):
+        with patch("os.walk", side_effect=AssertionError("walked")), \
+                patch("pathlib.Path.glob", side_effect=AssertionError("globbed")), \
+                patch.dict(os.environ, {"AAA_EVALS_CACHE_DIR": str(self.workspace / "cache")}):
+            self.assertEqual(run_repo_checks.check_runbook_checksums(str(self.repo), "git"), (True, []))
+            self.assertTrue(run_repo_checks.check_orphaned_assets(str(self.repo), "git")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import cache, headings
+
+
+class _CountingHandle:
+    def __init__(self, handle, calls):
+        self._handle = handle
+        self._calls = calls
+
+    def readline(self, size=-1):
+        self._calls.append(size)
+        return self._handle.readline(size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._handle.close()
+
+
+class TestHeadingScanner(unittest.TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_only_heading_lines_match(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "report.md"
+            path.write_text("# Title\nbody ## Fallback\n  ## Limitations  \n", encoding="utf-8")
+            self.assertEqual(
+                headings.missing(str(path), ["## Fallback", "## Limitations"]),
+                ["## Fallback"],
+            )
+
+    def test_stops_reading_once_all_headings_are_found(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "report.md"
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("## Test Coverage Appendix\n")
+                handle.write(("x" * 200 + "\n") * 5000)
+            calls = []
+            original = open
+
+            def _counting_open(*args, **kwargs):
+                return _CountingHandle(original(*args, **kwargs), calls)
+
+            with patch.object(headings, "open", _counting_open, create=True):
+                self.assertEqual(headings.missing(str(path), ["## Test Coverage Appendix"]), [])
+            self.assertEqual(len(calls), 1)
+
+    def test_oversized_lines_are_read_in_bounded_chunks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "dump.md"
+            path.write_text("x" * (headings.MAX_LINE_BYTES * 3) + "## Not a heading\n## Appendix\n", encoding="utf-8")
+            self.assertEqual(headings.missing(str(path), ["## Not a heading", "## Appendix"]), ["## Not a heading"])
+
+
+if __name__ == "__main__":
+    unittest.main()
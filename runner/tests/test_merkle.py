@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import merkle
+from runner.checks.check_runbook_checksums import check_runbook_checksums
+
+
+def _write_runbook(path: Path, runbook_id: str, valid: bool = True) -> None:
+    payload = {"metadata": {"id": runbook_id, "version": "1.0.0", "checksum": ""}, "steps": []}
+    normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    payload["metadata"]["checksum"] = f"sha256:{digest if valid else '0'}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+class TestMerkle(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name) / "aaa-tools"
+        env = patch.dict(os.environ, {"AAA_EVALS_CACHE_DIR": str(Path(tmp.name) / "cache")})
+        env.start()
+        self.addCleanup(env.stop)
+        for rel_path in ("ops/deploy.yaml", "ops/rollback.yaml", "init/bootstrap.yaml", "init/sub/extra.yaml"):
+            _write_runbook(self.root / "runbooks" / rel_path, rel_path)
+        self.manifest = merkle.build(self.root)
+        merkle.manifest_path(self.root).write_text(json.dumps(self.manifest), encoding="utf-8")
+
+    def _check(self, strict=False):
+        return check_runbook_checksums({
+            "repo_root": str(self.root),
+            "pattern": merkle.DEFAULT_PATTERN,
+            "manifest": "runbooks/merkle.json",
+            "strict_manifest": strict,
+        })
+
+    def test_manifest_has_leaf_per_runbook_and_node_per_directory(self):
+        self.assertEqual(sorted(self.manifest["leaves"]), [
+            "runbooks/init/bootstrap.yaml", "runbooks/init/sub/extra.yaml",
+            "runbooks/ops/deploy.yaml", "runbooks/ops/rollback.yaml",
+        ])
+        self.assertEqual(sorted(self.manifest["nodes"]),
+                         ["runbooks", "runbooks/init", "runbooks/init/sub", "runbooks/ops"])
+        self.assertEqual(self.manifest["root"], self.manifest["nodes"]["runbooks"])
+        self.assertTrue(self.manifest["leaves"]["runbooks/ops/deploy.yaml"]["checksum"].startswith("sha256:"))
+
+    def test_unchanged_catalog_passes_without_reparsing_runbooks(self):
+        with patch("runner.checks.check_runbook_checksums._load_runbook", side_effect=AssertionError("parsed")):
+            result = self._check()
+        self.assertEqual(result, {"pass": True, "details": []})
+
+    def test_tampering_with_restored_size_and_mtime_is_detected(self):
+        self._check()  # a prior run must not let later runs trust file metadata
+        path = self.root / "runbooks" / "ops" / "deploy.yaml"
+        stat = path.stat()
+        original = path.read_text(encoding="utf-8")
+        tampered = original.replace('"steps": []', '"steps": {}')
+        self.assertEqual(len(tampered), len(original))
+        path.write_text(tampered, encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        result = self._check()
+
+        self.assertFalse(result["pass"])
+        self.assertEqual([detail["type"] for detail in result["details"]], ["checksum_mismatch"])
+
+    def test_valid_edit_passes_and_strict_reports_the_stale_manifest(self):
+        _write_runbook(self.root / "runbooks" / "ops" / "deploy.yaml", "ops/deploy-v2")
+
+        self.assertEqual(self._check(), {"pass": True, "details": []})
+        result = self._check(strict=True)
+        self.assertFalse(result["pass"])
+        self.assertEqual([detail["type"] for detail in result["details"]], ["subtree_diverged"])
+        self.assertEqual(result["details"][0]["changed"], ["runbooks/ops/deploy.yaml"])
+
+    def test_only_changed_runbooks_are_hashed_on_later_runs(self):
+        self._check()
+        _write_runbook(self.root / "runbooks" / "ops" / "deploy.yaml", "ops/deploy-v2")
+        read = []
+        original = Path.read_bytes
+
+        def read_bytes(path):
+            read.append(path.name)
+            return original(path)
+
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=read_bytes):
+            result = self._check()
+        self.assertTrue(result["pass"], result["details"])
+        self.assertEqual(read, ["deploy.yaml"])
+
+    def test_reports_only_diverged_subtrees(self):
+        _write_runbook(self.root / "runbooks" / "init" / "sub" / "extra.yaml", "tampered", valid=False)
+        (self.root / "runbooks" / "ops" / "rollback.yaml").unlink()
+        _write_runbook(self.root / "runbooks" / "ops" / "scale.yaml", "ops/scale")
+
+        result = self._check(strict=True)
+
+        self.assertFalse(result["pass"])
+        diverged = [detail for detail in result["details"] if detail["type"] == "subtree_diverged"]
+        self.assertEqual([Path(detail["path"]).relative_to(self.root).as_posix() for detail in diverged],
+                         ["runbooks/init/sub", "runbooks/ops"])
+        self.assertEqual(diverged[0]["changed"], ["runbooks/init/sub/extra.yaml"])
+        self.assertEqual(diverged[1]["added"], ["runbooks/ops/scale.yaml"])
+        self.assertEqual(diverged[1]["removed"], ["runbooks/ops/rollback.yaml"])
+        mismatches = [detail for detail in result["details"] if detail["type"] == "checksum_mismatch"]
+        self.assertEqual([Path(detail["path"]).name for detail in mismatches], ["extra.yaml"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
+import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
@@ -9,6 +11,15 @@ from run_repo_checks import check_onboarding_doc_drift
 
 
 class TestOnboardingDocDrift(unittest.TestCase):
+    def setUp(self):
+        self._cache = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {"AAA_EVALS_CACHE_DIR": self._cache.name})
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+        self._cache.cleanup()
+
     def test_detects_version_mismatch(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
@@ -54,6 +65,41 @@ class TestOnboardingDocDrift(unittest.TestCase):
             self.assertTrue(ok)
             self.assertEqual(details, [])
 
+    def _write_aligned_docs(self, root: Path):
+        (root / ".github" / "profile").mkdir(parents=True)
+        (root / "aaa-tpl-docs" / "docs").mkdir(parents=True)
+        content = "python3 -m pip install \"git+https://github.com/ai-asset-architecture/aaa-tools.git@v0.2.0\"\n"
+        (root / ".github" / "profile" / "README.md").write_text(content, encoding="utf-8")
+        (root / "aaa-tpl-docs" / "docs" / "new-project-sop.md").write_text(content, encoding="utf-8")
+        (root / "aaa-tpl-docs" / "PROJECT_PLAYBOOK.md").write_text(content, encoding="utf-8")
+
+    def test_detects_drift_in_other_workspace_docs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._write_aligned_docs(root)
+            (root / "aaa-tpl-service").mkdir()
+            (root / "aaa-tpl-service" / "README.md").write_text(
+                "pip install \"git+https://github.com/ai-asset-architecture/aaa-tools.git@v0.1.0\"\n",
+                encoding="utf-8",
+            )
+
+            ok, details = check_onboarding_doc_drift(str(root))
+            self.assertFalse(ok)
+            self.assertIn("version mismatch: ['@v0.1.0', '@v0.2.0']", details)
+            self.assertIn("@v0.1.0: aaa-tpl-service/README.md:1", details)
+
+    def test_release_history_is_not_drift(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._write_aligned_docs(root)
+            (root / "aaa-tools" / "docs" / "release-notes").mkdir(parents=True)
+            old_install = "pip install \"git+https://github.com/ai-asset-architecture/aaa-tools.git@v0.1.0\"\n"
+            (root / "aaa-tools" / "CHANGELOG.md").write_text(old_install, encoding="utf-8")
+            (root / "aaa-tools" / "docs" / "release-notes" / "v0.1.0.md").write_text(old_install, encoding="utf-8")
+
+            ok, details = check_onboarding_doc_drift(str(root))
+            self.assertTrue(ok, details)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import output, run_repo_checks
+
+
+def _orphans(count):
+    for index in range(count):
+        yield {"type": "orphaned_asset", "path": f"docs/adrs/{index}.md"}
+    yield {"type": "missing_index", "path": "reports/index.json"}
+    yield "README.md missing"
+
+
+class TestOutput(unittest.TestCase):
+    def test_aggregate_counts_types_and_spills_every_detail(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            spill_path = str(Path(tmp) / "details.ndjson")
+            summary = output.aggregate(_orphans(1000), sample_size=2, spill_path=spill_path)
+            spilled = Path(spill_path).read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(summary["total"], 1002)
+        self.assertEqual(list(summary["groups"]), ["orphaned_asset", "message", "missing_index"])
+        self.assertEqual(summary["groups"]["orphaned_asset"]["count"], 1000)
+        self.assertEqual([item["path"] for item in summary["groups"]["orphaned_asset"]["sample"]],
+                         ["docs/adrs/0.md", "docs/adrs/1.md"])
+        self.assertEqual(len(spilled), 1002)
+        self.assertEqual(json.loads(spilled[-1]), "README.md missing")
+
+    def test_aggregate_without_details_creates_no_spill(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            spill_path = Path(tmp) / "details.ndjson"
+            summary = output.aggregate(iter(()), spill_path=str(spill_path))
+            self.assertFalse(spill_path.exists())
+        self.assertEqual(summary, {"total": 0, "groups": {}, "spill": ""})
+
+    def test_ndjson_streams_check_details(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            adrs = Path(tmp) / "docs" / "adrs"
+            adrs.mkdir(parents=True)
+            (adrs / "index.json").write_text(json.dumps({"files": [{"path": "001.md"}]}), encoding="utf-8")
+            for name in ("001.md", "002.md", "003.md"):
+                (adrs / name).write_text("# ADR\n", encoding="utf-8")
+            argv = ["run_repo_checks.py", "--check", "orphaned_assets", "--repo", tmp, "--format", "ndjson"]
+            with patch("sys.argv", argv), patch("sys.stdout", new_callable=io.StringIO) as stdout:
+                code = run_repo_checks.main()
+            records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+        self.assertEqual(code, 1)
+        self.assertEqual([record["type"] for record in records], ["detail", "detail", "summary"])
+        self.assertEqual([Path(record["detail"]["path"]).name for record in records[:2]], ["002.md", "003.md"])
+        self.assertEqual(records[-1]["count"], 2)
+        self.assertFalse(records[-1]["pass"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import cache, phrases
+
+
+class TestPhraseMatcher(unittest.TestCase):
+    def test_reports_overlapping_and_nested_phrases(self):
+        matcher = phrases.PhraseMatcher(["he", "she", "his", "hers", "absent"])
+        self.assertEqual(matcher.scan("ushers"), {"he", "she", "hers"})
+
+    def test_matches_plain_substring_semantics(self):
+        required = ["gh auth setup-git", "plan.v0.1.json?ref=", "模式 A", 'grep -n "{{"']
+        text = 'gh auth setup-git\n模式 A\ngrep -n "{{" plan.json\n'
+        self.assertEqual(phrases.PhraseMatcher(required).scan(text), {item for item in required if item in text})
+
+
+class TestEvaluate(unittest.TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_missing_target_files_short_circuit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = phrases.evaluate("post_init_audit_required", tmp)
+            self.assertEqual(len(result["missing_files"]), 3)
+            self.assertEqual(result["missing"], [])
+
+    def test_each_document_is_scanned_once_for_all_its_rules(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for rel in [
+                ".github/profile/README.md",
+                "aaa-tpl-docs/docs/new-project-sop.md",
+                "aaa-tpl-docs/docs/contracts/aaa-cli-contract.md",
+                "aaa-tools/specs/CLI_CONTRACT.md",
+                "aaa-tools/runbooks/init/AGENT_BOOTSTRAP.md",
+            ]:
+                (root / rel).parent.mkdir(parents=True, exist_ok=True)
+                (root / rel).write_text("gh auth setup-git\n@v0.2.0\n", encoding="utf-8")
+
+            scans = []
+            original = phrases.PhraseMatcher.scan
+
+            def _counting_scan(self, text):
+                scans.append(text)
+                return original(self, text)
+
+            with patch.object(phrases.PhraseMatcher, "scan", _counting_scan):
+                result = phrases.evaluate("cli_contract_sync", tmp)
+            self.assertEqual(len(scans), 4)
+            self.assertIn("sop missing: aaa init repo-checks", result["missing"])
+            self.assertNotIn("sop missing: gh auth setup-git", result["missing"])
+
+    def test_options_fill_file_templates(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sop = Path(tmp) / "custom" / "sop.md"
+            sop.parent.mkdir()
+            sop.write_text("gh auth setup-git\naaa init validate-plan\n", encoding="utf-8")
+            result = phrases.evaluate("member_bootstrap_prereq", tmp, {"sop_path": "custom/sop.md"})
+            self.assertEqual(result["missing_files"], [])
+            self.assertIn("模式 A", result["missing"])
+            self.assertNotIn("gh auth setup-git", result["missing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
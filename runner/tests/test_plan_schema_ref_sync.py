@@ -1,7 +1,9 @@
+import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
@@ -9,6 +11,15 @@ from run_repo_checks import check_plan_schema_ref_sync
 
 
 class TestPlanSchemaRefSync(unittest.TestCase):
+    def setUp(self):
+        self._cache = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {"AAA_EVALS_CACHE_DIR": self._cache.name})
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+        self._cache.cleanup()
+
     def test_detects_mismatched_refs(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
@@ -0,0 +1,88 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import gitfiles, preflight
+from runner.checks.check_agent_safety import check_agent_safety
+
+
+class TestPreflight(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.workspace = Path(tmp.name)
+        preflight.clear()
+        self.addCleanup(preflight.clear)
+
+    def test_resolves_once_until_environment_or_ttl_changes(self):
+        with patch("runner.preflight.shutil.which", wraps=shutil.which) as which:
+            first = preflight.tool("git")
+            self.assertIs(preflight.tool("git"), first)
+            self.assertEqual(which.call_count, 1)
+            with patch.dict(os.environ, {"PATH": os.environ.get("PATH", "") + os.pathsep + str(self.workspace)}):
+                self.assertIsNot(preflight.tool("git"), first)
+            with patch.dict(os.environ, {"AAA_PREFLIGHT_TTL": "0"}):
+                preflight.clear()
+                self.assertIsNot(preflight.tool("git"), preflight.tool("git"))
+        self.assertEqual(first["env"]["GIT_TERMINAL_PROMPT"], "0")
+
+    def test_aaa_falls_back_to_sibling_tools_checkout(self):
+        (self.workspace / "aaa-tools").mkdir()
+        repo = self.workspace / "aaa-evals"
+        repo.mkdir()
+        env = {key: value for key, value in os.environ.items() if key not in ("AAA_TOOLS_CMD", "AAA_TOOLS_ROOT")}
+        with patch.dict(os.environ, env, clear=True), patch("runner.preflight.shutil.which", return_value=None):
+            aaa = preflight.tool("aaa", repo)
+            self.assertEqual(aaa["argv"], [sys.executable, "-m", "aaa.cli"])
+            self.assertTrue(aaa["env"]["PYTHONPATH"].startswith(str(self.workspace / "aaa-tools")))
+            self.assertIsNone(preflight.argv("aaa", self.workspace))
+
+    def test_cases_share_one_resolution_and_one_version_probe(self):
+        runbook = self.workspace / "runbook.yaml"
+        runbook.write_text("{}", encoding="utf-8")
+        case = {"runbook": str(runbook), "expected": {"status": "error", "error_code": "EMPTY_OUTPUT"}}
+        with patch.dict(os.environ, {"AAA_TOOLS_CMD": "true"}), \
+                patch("runner.preflight._resolve", wraps=preflight._resolve) as resolve:
+            for _ in range(3):
+                self.assertTrue(check_agent_safety(case, self.workspace)["pass"])
+            self.assertEqual(resolve.call_count, 1)
+            with patch("runner.preflight.subprocess.run", wraps=preflight.subprocess.run) as run:
+                preflight.version("aaa", self.workspace)
+                preflight.version("aaa", self.workspace)
+            self.assertEqual(run.call_count, 1)
+
+    def test_version_probe_runs_outside_the_lock(self):
+        locked = []
+
+        def probe(*_args, **_kwargs):
+            locked.append(preflight._lock.locked())
+            preflight.tool("bash")  # another resolution would deadlock if the probe held the lock
+            return preflight.subprocess.CompletedProcess([], 0, "git version 2.0\n", "")
+
+        with patch("runner.preflight.subprocess.run", side_effect=probe):
+            self.assertEqual(preflight.version("git"), "git version 2.0")
+        self.assertEqual(locked, [False])
+
+    def test_git_file_listing_uses_the_resolved_git(self):
+        with patch("runner.preflight.shutil.which", return_value=None):
+            self.assertIsNone(gitfiles.list_files(str(self.workspace)))
+        preflight.clear()
+        with patch("runner.gitfiles.subprocess.run", wraps=gitfiles.subprocess.run) as run:
+            gitfiles.list_files(str(self.workspace))
+        self.assertEqual(run.call_args_list[0].args[0][:1], preflight.argv("git"))
+        self.assertEqual(run.call_args_list[0].kwargs["env"]["GIT_TERMINAL_PROMPT"], "0")
+
+    def test_missing_tool_is_reported_not_raised(self):
+        with patch("runner.preflight.shutil.which", return_value=None):
+            self.assertIsNone(preflight.argv("bash"))
+            self.assertEqual(preflight.version("bash"), "")
+        with self.assertRaises(ValueError):
+            preflight.tool("make")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import cache, refindex
+
+
+class TestTokenize(unittest.TestCase):
+    def test_single_pass_finds_all_kinds_with_lines(self):
+        text = (
+            "pip install aaa-tools.git@v0.2.0\n"
+            "\n"
+            "plan.v0.1.json?ref=v0.2.0 plan.schema.json?ref=v0.1.0\n"
+        )
+        self.assertEqual(
+            refindex.tokenize(text),
+            [["version", "@v0.2.0", 1], ["plan_ref", "v0.2.0", 3], ["schema_ref", "v0.1.0", 3]],
+        )
+
+    def test_text_without_refs_is_skipped(self):
+        self.assertEqual(refindex.tokenize("no refs here\n"), [])
+
+
+class TestRefIndex(unittest.TestCase):
+    def setUp(self):
+        cache.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name) / "workspace"
+        self.root.mkdir()
+        self.store = str(Path(self._tmp.name) / "index.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_only_changed_files_are_retokenized_across_runs(self):
+        (self.root / "a.md").write_text("@v0.1.0\n", encoding="utf-8")
+        (self.root / "b.md").write_text("plan.v0.1.json?ref=v0.1.0\n", encoding="utf-8")
+        (self.root / "node_modules").mkdir()
+        (self.root / "node_modules" / "c.md").write_text("@v9.9.9\n", encoding="utf-8")
+
+        first = refindex.RefIndex(str(self.root), self.store)
+        first.refresh()
+        self.assertEqual(first.tokenized, 2)
+        self.assertEqual(json.loads(Path(self.store).read_text(encoding="utf-8"))["root"], first.root)
+
+        (self.root / "a.md").write_text("@v0.2.0 again\n", encoding="utf-8")
+        second = refindex.RefIndex(str(self.root), self.store)
+        second.refresh()
+        self.assertEqual(second.tokenized, 1)
+        self.assertEqual(second.occurrences("version"), {"@v0.2.0": ["a.md:1"]})
+        self.assertEqual(second.values("b.md", "plan_ref"), ["v0.1.0"])
+        self.assertEqual(len(cache._entries), 0)  # a workspace refresh does not fill the shared file cache
+
+    def test_deleted_files_leave_the_index(self):
+        (self.root / "a.md").write_text("@v0.1.0\n", encoding="utf-8")
+        index = refindex.RefIndex(str(self.root), self.store)
+        index.refresh()
+        os.remove(self.root / "a.md")
+        index.refresh(["a.md"])
+        self.assertEqual(index.occurrences("version"), {})
+
+    def test_drift_checks_share_the_per_root_index(self):
+        with patch.dict(os.environ, {"AAA_EVALS_CACHE_DIR": self._tmp.name}):
+            index = refindex.for_root(str(self.root))
+            self.assertIs(refindex.for_root(str(self.root) + "/"), index)
+            self.assertTrue(index.store_path.startswith(self._tmp.name))
+
+
+if __name__ == "__main__":
+    unittest.main()
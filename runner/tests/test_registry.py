@@ -0,0 +1,84 @@
+import json
+import subprocess
+import sys
+import unittest
+from argparse import Namespace
+from importlib import metadata
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import registry
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestRegistry(unittest.TestCase):
+    def tearDown(self):
+        registry.available_checks.cache_clear()
+
+    def test_listing_does_not_import_check_code(self):
+        script = (
+            "import json, sys\n"
+            "from runner import registry\n"
+            "names = sorted(registry.available_checks())\n"
+            "loaded = sorted(m for m in sys.modules if m.startswith('runner.checks') or m == 'jsonschema')\n"
+            "print(json.dumps({'names': names, 'loaded': loaded}))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        payload = json.loads(result.stdout)
+        self.assertIn("readme", payload["names"])
+        self.assertIn("release_integrity_check", payload["names"])
+        self.assertEqual(payload["loaded"], [])
+
+    def test_cli_import_leaves_mode_modules_unloaded(self):
+        script = (
+            "import json, sys\n"
+            "from runner import run_repo_checks\n"
+            "modes = ('budgets', 'fanout', 'refindex', 'shard', 'skillindex', 'watch', 'workflows')\n"
+            "print(json.dumps(sorted(m for m in modes if 'runner.' + m in sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(json.loads(result.stdout), [])
+
+    def test_entry_point_plugins_are_listed_and_run(self):
+        plugin = metadata.EntryPoint(
+            name="plugin_check",
+            value="runner.checks.check_test_policy_compliance:check_test_policy_compliance",
+            group=registry.ENTRY_POINT_GROUP,
+        )
+        with patch.object(metadata, "entry_points", return_value=[plugin]):
+            registry.available_checks.cache_clear()
+            self.assertIn("plugin_check", registry.available_checks())
+            passed, details = registry.run("plugin_check", Namespace(repo=str(REPO_ROOT)))
+        self.assertTrue(passed, details)
+
+    def test_builtin_names_win_over_plugins(self):
+        plugin = metadata.EntryPoint(name="readme", value="thirdparty:check", group=registry.ENTRY_POINT_GROUP)
+        with patch.object(metadata, "entry_points", return_value=[plugin]):
+            registry.available_checks.cache_clear()
+            self.assertEqual(registry.describe("readme"), registry.BUILTIN_CHECKS["readme"])
+
+    def test_lazy_defers_import_until_called(self):
+        calls = []
+        with patch.object(registry, "load", side_effect=lambda target: calls.append(target) or len):
+            func = registry.lazy("builtins:len")
+            self.assertEqual(calls, [])
+            self.assertEqual(func("abc"), 3)
+            self.assertEqual(func("ab"), 2)
+        self.assertEqual(calls, ["builtins:len"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import response_cache, run_smoke
+from runner.response_cache import ResponseCache
+
+
+def _backend(calls):
+    async def complete(prompts, params):
+        calls.append(list(prompts))
+        return [f"{prompt}!" for prompt in prompts]
+
+    return {"id": "fake", "model": "m1", "batch_size": 4, "complete": complete}
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = str(Path(tmp.name) / "responses" / "index.sqlite")
+
+    def _cache(self, mode="readwrite", **limits):
+        responses = ResponseCache(self.path, mode, **limits)
+        self.addCleanup(responses.close)
+        return responses
+
+    def _blobs(self):
+        return sorted(name for _root, _dirs, files in os.walk(Path(self.path).parent / "blobs") for name in files)
+
+    def test_replays_hits_and_sends_only_misses(self):
+        calls = []
+        backend = _backend(calls)
+        cases = [{"id": f"c{index}", "prompt": f"p{index}", "expected": f"p{index}!"} for index in range(3)]
+        first = self._cache()
+        asyncio.run(run_smoke.run(cases[:2], backend, concurrency=1, responses=first))
+        result = asyncio.run(run_smoke.run(cases, backend, concurrency=1, responses=first))
+
+        self.assertEqual(result["pass_rate"], 1.0)
+        self.assertEqual(calls, [["p0", "p1"], ["p2"]])
+        self.assertEqual(first.stats(), {"mode": "readwrite", "hits": 2, "misses": 3, "write_errors": 0})
+
+        self.assertEqual(result["cached"], 2)
+        self.assertIsNotNone(result["latency_ms"]["p50"])
+
+        replay = self._cache("replay")
+        replayed = asyncio.run(run_smoke.run(cases, backend, responses=replay))
+        self.assertEqual((replayed["pass_rate"], replayed["cached"]), (1.0, 3))
+        # Nothing reached the backend, so there is no latency or throughput to report.
+        self.assertEqual(replayed["latency_ms"], {"p50": None, "p95": None, "p99": None})
+        self.assertIsNone(replayed["throughput_per_s"])
+        self.assertEqual(len(calls), 2)
+
+    def test_key_covers_model_params_and_case(self):
+        key = response_cache.cache_key("fake", "m1", "p", {"temperature": 0}, "c1")
+        self.assertEqual(key, response_cache.cache_key("fake", "m1", "p", {"temperature": 0}, "c1"))
+        self.assertNotEqual(key, response_cache.cache_key("fake", "m2", "p", {"temperature": 0}, "c1"))
+        self.assertNotEqual(key, response_cache.cache_key("fake", "m1", "p", {"temperature": 1}, "c1"))
+        self.assertNotEqual(key, response_cache.cache_key("fake", "m1", "p", {"temperature": 0}, "c2"))
+
+    def test_replay_miss_fails_and_record_overwrites(self):
+        calls = []
+        replay = self._cache("replay")
+        with self.assertRaisesRegex(RuntimeError, "no recorded response for c9"):
+            asyncio.run(replay.complete(_backend(calls), ["p"], {}, ["c9"]))
+        self.assertEqual(calls, [])
+
+        replay.put(response_cache.cache_key("fake", "m1", "p", {}, "c1"), "stale")
+        record = self._cache("record")
+        self.assertEqual(asyncio.run(record.complete(_backend(calls), ["p"], {}, ["c1"])), (["p!"], [False]))
+        self.assertEqual(replay.get(response_cache.cache_key("fake", "m1", "p", {}, "c1")), "p!")
+        self.assertEqual(len(self._blobs()), 1)  # the stale blob is no longer referenced
+
+    def test_content_addressed_with_lru_eviction(self):
+        responses = self._cache(max_entries=3, max_bytes=10)
+        responses.put("a", "same")
+        responses.put("b", "same")
+        self.assertEqual(len(self._blobs()), 1)
+        time.sleep(0.01)
+        responses.put("c", "other")
+        time.sleep(0.01)
+        responses.get("a")
+        time.sleep(0.01)
+        responses.put("d", "third")  # 14 bytes of blobs: evict least recently used until 10 fit
+
+        # "b" frees no bytes (its blob is shared with "a"), so "c" goes too.
+        self.assertEqual([responses.get(key) for key in "bc"], [None, None])
+        self.assertEqual([responses.get(key) for key in "ad"], ["same", "third"])
+        self.assertEqual(len(self._blobs()), 2)
+        time.sleep(0.01)
+        responses.put("e", "same")
+        time.sleep(0.01)
+        responses.put("f", "same")  # 4 entries: the least recently used ("a") goes, its blob stays
+        self.assertEqual(len(responses), 3)
+        self.assertIsNone(responses.get("a"))
+        self.assertEqual(len(self._blobs()), 2)
+        # The running totals the limits are checked against match a fresh count.
+        reopened = self._cache()
+        self.assertEqual((responses._count, responses._bytes), (reopened._count, reopened._bytes))
+        self.assertEqual((reopened._count, reopened._bytes), (3, 9))
+
+    def test_cache_write_failure_does_not_fail_the_run(self):
+        calls = []
+        responses = self._cache()
+        cases = [{"id": "c0", "prompt": "p0", "expected": "p0!"}]
+        with patch.object(ResponseCache, "put", side_effect=OSError("disk full")):
+            result = asyncio.run(run_smoke.run(cases, _backend(calls), responses=responses))
+        self.assertEqual(result["pass_rate"], 1.0)
+        self.assertEqual(responses.stats()["write_errors"], 1)
+        self.assertEqual(len(responses), 0)
+
+    def test_refresh_conflicts_with_replay(self):
+        parser = run_smoke.build_parser()
+        args = parser.parse_args(["--backend", "stub", "--refresh", "--response-cache", self.path])
+        responses = response_cache.from_args(args)
+        self.addCleanup(responses.close)
+        self.assertEqual(responses.mode, "record")
+        self.assertIsNone(response_cache.from_args(parser.parse_args([])))  # measured against the backend by default
+        with self.assertRaises(ValueError):
+            response_cache.from_args(parser.parse_args(["--refresh", "--cache-mode", "replay"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import asyncio
+import http.server
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from runner import backends, run_smoke
+
+
+def _cases(count):
+    return ({"id": f"c{index:02d}", "prompt": f"echo {index}", "expected": f"echo {index}"} for index in range(count))
+
+
+class _BatchHandler(http.server.BaseHTTPRequestHandler):
+    requests: list[dict] = []
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(payload)
+        body = {"outputs": [prompt.upper() for prompt in payload["prompts"]]} if "prompts" in payload else {
+            "output": payload["prompt"].upper()
+        }
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *_args):
+        pass
+
+
+class TestRunSmoke(unittest.TestCase):
+    def test_scores_exact_contains_regex_and_lists(self):
+        self.assertTrue(run_smoke.score({"expected": "OK"}, " OK\n"))
+        self.assertFalse(run_smoke.score({"expected": "OK"}, "OK, done"))
+        self.assertTrue(run_smoke.score({"expected": "OK", "match": "contains"}, "OK, done"))
+        self.assertTrue(run_smoke.score({"expected": r"^v\d+"}, "v12", match="regex"))
+        self.assertTrue(run_smoke.score({"expected": ["yes", "OK"]}, "OK"))
+
+    def test_cases_run_concurrently_and_report_percentiles(self):
+        backend = backends.create("stub", stub_latency_ms=50)
+        start = time.perf_counter()
+        result = asyncio.run(run_smoke.run(_cases(20), backend, concurrency=10))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual((result["total"], result["passed"], result["pass_rate"]), (20, 20, 1.0))
+        self.assertLess(elapsed, 0.5)  # serial would take 1s
+        self.assertGreaterEqual(result["latency_ms"]["p50"], 50)
+        self.assertLessEqual(result["latency_ms"]["p50"], result["latency_ms"]["p99"])
+        self.assertGreater(result["throughput_per_s"], 20)
+
+    def test_backend_failures_are_per_case(self):
+        calls = []
+
+        async def complete(prompts, params):
+            calls.append((prompts, params))
+            if "echo 3" in prompts:
+                raise RuntimeError("backend down")
+            return list(prompts)
+
+        backend = {"id": "fake", "model": "m", "batch_size": 1, "complete": complete}
+        result = asyncio.run(run_smoke.run(_cases(5), backend, {"temperature": 0}, concurrency=2))
+
+        self.assertEqual(result["pass_rate"], 0.8)
+        self.assertEqual(result["failures"], [{"id": "c03", "error": "backend down"}])
+        self.assertTrue(all(params == {"temperature": 0} for _prompts, params in calls))
+
+    def test_bad_cases_and_missing_command_fail_per_case(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", encoding="utf-8") as handle:
+            handle.write('{"id": "ok", "prompt": "hi", "expected": "hi"}\n{not json\n')
+            handle.write('{"id": "re", "prompt": "hi", "expected": "(", "match": "regex"}\n')
+            handle.flush()
+            result = asyncio.run(run_smoke.run(run_smoke.iter_cases(handle.name), backends.create("stub")))
+
+        self.assertEqual((result["total"], result["passed"]), (3, 1))
+        self.assertEqual([failure["id"] for failure in result["failures"]], ["line-2", "re"])
+        self.assertTrue(result["failures"][0]["error"].startswith("invalid JSON"))
+        self.assertTrue(result["failures"][1]["error"].startswith("invalid regex"))
+
+        missing = backends.create("cmd:aaa-evals-no-such-binary")
+        result = asyncio.run(run_smoke.run(_cases(2), missing))
+        self.assertEqual(result["pass_rate"], 0.0)
+        self.assertIn("aaa-evals-no-such-binary", result["failures"][0]["error"])
+
+    def test_default_invocation_passes_the_shipped_suite(self):
+        env = {key: value for key, value in os.environ.items() if key != "AAA_EVALS_BACKEND"}
+        with patch.dict(os.environ, env, clear=True):
+            args = run_smoke.build_parser().parse_args([])
+        backend = backends.create(args.backend, stub_responses=args.stub_responses)
+        result = asyncio.run(run_smoke.run(run_smoke.iter_cases(args.cases), backend))
+        self.assertEqual(result["pass_rate"], 1.0)
+
+    def test_http_backend_batches_prompts(self):
+        _BatchHandler.requests = []
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _BatchHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}/complete"
+        cases = [{"id": f"c{index}", "prompt": f"say {index}", "expected": f"SAY {index}"} for index in range(7)]
+
+        result = asyncio.run(run_smoke.run(cases, backends.create(f"http:{url}", "m1", batch_size=4), concurrency=1))
+
+        self.assertEqual(result["pass_rate"], 1.0)
+        self.assertEqual([len(request["prompts"]) for request in _BatchHandler.requests], [4, 3])
+        self.assertEqual(_BatchHandler.requests[0]["model"], "m1")
+
+
+if __name__ == "__main__":
+    unittest.main()
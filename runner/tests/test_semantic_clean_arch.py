@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from evals.semantic import check_clean_arch
+
+
+class TestIterPythonFiles(unittest.TestCase):
+    def test_prunes_hidden_and_venv_dirs_and_inherits_ui_layer(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for rel_path in [
+                "app/service.py",
+                "app/pages/home.py",
+                "app/pages/widgets/button.py",
+                "app/login_view.py",
+                "app/notes.txt",
+                "app/.hidden.py",
+                ".git/hooks/pre_commit.py",
+                ".venv/lib/site.py",
+                "my-venv/lib/site.py",
+                "node_modules/pkg/setup.py",
+                "app/__pycache__/service.py",
+            ]:
+                path = root / rel_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("", encoding="utf-8")
+
+            files = check_clean_arch.iter_python_files(str(root))
+            found = {path.relative_to(root).as_posix(): is_ui for path, is_ui in files}
+
+        self.assertEqual(
+            found,
+            {
+                "app/service.py": False,
+                "app/pages/home.py": True,
+                "app/pages/widgets/button.py": True,
+                "app/login_view.py": True,
+            },
+        )
+
+    def test_components_above_root_do_not_mark_files_as_ui(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "frontend-repo"
+            (root / "core").mkdir(parents=True)
+            (root / "core" / "db.py").write_text("", encoding="utf-8")
+
+            found = [(path.name, is_ui) for path, is_ui in check_clean_arch.iter_python_files(str(root))]
+
+        self.assertEqual(found, [("db.py", False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
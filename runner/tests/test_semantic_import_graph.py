@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from evals.semantic import import_graph
+
+FORBIDDEN = ["requests", "sqlalchemy"]
+
+
+class TestImportGraph(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name) / "repo"
+        self.store = str(Path(self._tmp.name) / "imports.json")
+        files = {
+            "app/__init__.py": "",
+            "app/services/__init__.py": "",
+            "app/services/db.py": "import sqlalchemy\n",
+            "app/ui/direct.py": "import requests.adapters\n",
+            "app/ui/via_service.py": "from ..services import db\n",
+            "app/ui/mentions.py": "# uses requests? no: 'requests' is only text here\nimport os\n",
+            "app/ui/dynamic.py": "import importlib\nmod = importlib.import_module('x')\n",
+            "app/ui/broken.py": "def (\n",
+        }
+        for rel_path, source in files.items():
+            path = self.root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source, encoding="utf-8")
+        self.rel_paths = sorted(files)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _graph(self):
+        graph = import_graph.ImportGraph(str(self.root), self.store)
+        graph.refresh(self.rel_paths)
+        return graph
+
+    def test_classifies_direct_transitive_and_clean_files(self):
+        graph = self._graph()
+        self.assertEqual(
+            graph.classify("app/ui/direct.py", FORBIDDEN),
+            (import_graph.DIRECT, ["app/ui/direct.py", "requests.adapters"]),
+        )
+        self.assertEqual(
+            graph.classify("app/ui/via_service.py", FORBIDDEN),
+            (import_graph.AMBIGUOUS, ["app/ui/via_service.py", "app/services/db.py", "sqlalchemy"]),
+        )
+        self.assertEqual(graph.classify("app/ui/mentions.py", FORBIDDEN), (import_graph.CLEAN, []))
+        self.assertEqual(graph.classify("app/ui/dynamic.py", FORBIDDEN)[0], import_graph.AMBIGUOUS)
+        self.assertEqual(graph.classify("app/ui/broken.py", FORBIDDEN)[0], import_graph.AMBIGUOUS)
+
+    def test_index_is_persisted_and_updated_incrementally(self):
+        self.assertEqual(self._graph().parsed, len(self.rel_paths))
+        (self.root / "app/services/db.py").write_text("import os\n", encoding="utf-8")
+        graph = self._graph()
+        self.assertEqual(graph.parsed, 1)
+        self.assertEqual(graph.classify("app/ui/via_service.py", FORBIDDEN), (import_graph.CLEAN, []))
+
+    def test_relative_imports_resolve_against_the_package(self):
+        parsed = import_graph.parse_imports("from . import a\nfrom ..b import c\n", "pkg.sub.mod", False)
+        self.assertEqual(parsed["imports"], ["pkg.b", "pkg.b.c", "pkg.sub", "pkg.sub.a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
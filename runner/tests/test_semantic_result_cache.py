@@ -0,0 +1,102 @@
+import itertools
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from evals.semantic.result_cache import CachedChecker, ResultCache, cache_key
+
+
+class _FakeChecker:
+    VERSION = "1"
+
+    def __init__(self):
+        self.calls = 0
+
+    def check(self, content, rule, keywords=None):
+        self.calls += 1
+        return SimpleNamespace(passed="requests" not in content, reason="imports requests", cost=0.25)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self._tmp.name) / "results.sqlite")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_hits_report_zero_cost_and_skip_the_checker(self):
+        results = ResultCache(self.path)
+        fake = _FakeChecker()
+        checker = CachedChecker(fake, results)
+        first = checker.check("import requests\n", "rule", ["requests"])
+        second = checker.check("import requests\n", "rule", ["requests"])
+        self.assertEqual((first.passed, first.cost), (False, 0.25))
+        self.assertEqual((second.passed, second.reason, second.cost), (False, "imports requests", 0))
+        self.assertEqual(fake.calls, 1)
+        checker.check("import requests\n", "other rule", ["requests"])
+        checker.check("import requests\n", "rule", ["boto3"])
+        self.assertEqual(fake.calls, 3)
+
+    def test_batches_send_only_misses_to_a_batching_backend(self):
+        class _Batching(_FakeChecker):
+            def check_batch(self, requests):
+                self.calls += 1
+                self.last = [content for content, _rule, _keywords in requests]
+                return [SimpleNamespace(passed=True, reason="", cost=1) for _ in requests]
+
+        fake = _Batching()
+        checker = CachedChecker(fake, ResultCache(self.path))
+        checker.check_batch([("a", "rule", []), ("b", "rule", [])])
+        results = checker.check_batch([("a", "rule", []), ("c", "rule", [])])
+        self.assertEqual(fake.last, ["c"])
+        self.assertEqual([result.cost for result in results], [0, 1])
+        self.assertTrue(checker.is_cached("c", "rule", []))
+
+    def test_key_includes_checker_version(self):
+        self.assertNotEqual(cache_key("x", "rule", ["a"], "v1"), cache_key("x", "rule", ["a"], "v2"))
+
+    def test_entries_expire_after_ttl(self):
+        results = ResultCache(self.path, ttl_seconds=60)
+        results.put("k", SimpleNamespace(passed=True, reason="", cost=1))
+        self.assertIsNotNone(results.get("k"))
+        with patch("evals.semantic.result_cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(results.get("k"))
+        self.assertEqual(len(results), 0)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        results = ResultCache(self.path, ttl_seconds=0, max_entries=2)
+        entry = SimpleNamespace(passed=True, reason="", cost=1)
+        with patch("evals.semantic.result_cache.time.time", side_effect=[1000.0, 1001.0, 1002.0, 1003.0]):
+            results.put("a", entry)
+            results.put("b", entry)
+            results.get("a")
+            results.put("c", entry)
+        self.assertIsNotNone(results.get("a"))
+        self.assertIsNone(results.get("b"))
+        self.assertEqual(len(results), 2)
+
+    def test_eviction_runs_only_past_the_cap_and_frees_a_batch(self):
+        results = ResultCache(self.path, ttl_seconds=0, max_entries=100)
+        entry = SimpleNamespace(passed=True, reason="", cost=1)
+        statements = []
+        results._db.set_trace_callback(statements.append)
+        with patch("evals.semantic.result_cache.time.time", side_effect=itertools.count(1000.0)):
+            for index in range(100):
+                results.put(f"k{index}", entry)
+            results.put("k0", entry)
+            self.assertFalse([sql for sql in statements if sql.startswith("DELETE")])
+            self.assertEqual(len(results), 100)
+
+            results.put("k100", entry)
+        self.assertEqual(len([sql for sql in statements if sql.startswith("DELETE")]), 1)
+        self.assertEqual(len(results), 90)
+        self.assertIsNone(results.get("k1"))
+        self.assertIsNotNone(results.get("k0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from types import SimpleNamespace
+
+from evals.semantic import scheduler
+
+PACK = {
+    "rules": [
+        {"id": "ui", "applies_to": "ui", "rule": "ui rule", "keywords": ["requests"]},
+        {"id": "all", "applies_to": "all", "rule": "global rule", "keywords": []},
+    ],
+    "path_risk": [{"pattern": "**/pages/**", "weight": 3}],
+}
+
+
+class _BatchingChecker:
+    def __init__(self):
+        self.batches = []
+
+    def check_batch(self, requests):
+        self.batches.append(len(requests))
+        return [SimpleNamespace(passed=True, reason="", cost=1.0) for _ in requests]
+
+
+class TestScheduler(unittest.TestCase):
+    def test_rules_follow_file_layer(self):
+        self.assertEqual([rule["id"] for rule in scheduler.rules_for(True, PACK)], ["ui", "all"])
+        self.assertEqual([rule["id"] for rule in scheduler.rules_for(False, PACK)], ["all"])
+
+    def test_plan_orders_changed_then_risky_paths(self):
+        rules = PACK["rules"][1:]
+        files = [("a.py", "same", rules), ("app/pages/p.py", "same", rules), ("z.py", "new", rules)]
+        items = scheduler.plan(files, PACK, lambda content, _rules: content == "new")
+        self.assertEqual([item["path"] for item in items], ["z.py", "app/pages/p.py", "a.py"])
+
+    def test_batches_share_one_checker_call(self):
+        checker = _BatchingChecker()
+        items = scheduler.plan([(f"f{i}.py", "x", PACK["rules"]) for i in range(5)], PACK, lambda *_: True)
+        seen = []
+        summary = scheduler.run(
+            items,
+            lambda requests: scheduler.evaluate_batch(checker, requests),
+            lambda item, rule, result: seen.append((item["path"], rule["id"])),
+            batch_size=2,
+            jobs=1,
+        )
+        self.assertEqual(checker.batches, [4, 4, 2])
+        self.assertEqual(len(seen), 10)
+        self.assertEqual(summary["skipped"], 0)
+
+    def test_budget_stops_new_work_but_keeps_free_cached_files(self):
+        files = [("changed-1.py", "new", PACK["rules"][1:]), ("changed-2.py", "new", PACK["rules"][1:])]
+        files += [("cached.py", "old", PACK["rules"][1:])]
+        items = scheduler.plan(files, PACK, lambda content, _rules: content == "new")
+
+        def evaluate(requests):
+            return [
+                SimpleNamespace(passed=True, reason="", cost=0 if content == "old" else 5)
+                for content, _r, _k in requests
+            ]
+
+        seen = []
+        summary = scheduler.run(items, evaluate, lambda item, rule, result: seen.append(item["path"]), 4, 1, 1)
+        self.assertEqual(seen, ["changed-1.py", "cached.py"])
+        self.assertEqual(summary["skipped"], 1)
+        self.assertTrue(summary["budget_exhausted"])
+
+    def test_budget_smaller_than_the_first_wave_is_not_overspent(self):
+        checker = _BatchingChecker()
+        items = scheduler.plan([(f"f{i:02d}.py", "x", PACK["rules"][1:]) for i in range(41)], PACK, lambda *_: True)
+        summary = scheduler.run(
+            items, lambda requests: scheduler.evaluate_batch(checker, requests), lambda *_: None, 2, 8, 8
+        )
+        self.assertEqual(checker.batches, [8])
+        self.assertEqual(summary["spent"], 8)
+        self.assertEqual(summary["skipped"], 33)
+        self.assertTrue(summary["budget_exhausted"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import run_repo_checks, shard
+
+
+class TestShard(unittest.TestCase):
+    def test_parse_rejects_out_of_range_specs(self):
+        self.assertEqual(shard.parse("2/4"), (2, 4))
+        for spec in ("0/2", "3/2", "1", "a/b"):
+            with self.assertRaises(ValueError):
+                shard.parse(spec)
+
+    def test_assign_packs_longest_first(self):
+        timings = {"a": 10.0, "b": 7.0, "c": 5.0, "d": 3.0, "e": 2.0}
+        shards = shard.assign(["a", "b", "c", "d", "e", "new"], 2, timings)
+
+        # "new" has no history and weighs the mean (5.4).
+        self.assertEqual(shards, [["a", "c", "e"], ["b", "d", "new"]])
+        self.assertEqual(shard.select(["a", "b", "c", "d", "e", "new"], "2/2", timings), ["b", "d", "new"])
+
+    def test_case_driven_check_runs_only_its_shard(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            cases_dir = root / "evals" / "cases"
+            cases_dir.mkdir(parents=True)
+            (cases_dir / "gate_a_smoke.jsonl").write_text(
+                "".join(json.dumps({"id": f"case-{index}"}) + "\n" for index in range(4)) + "not json\n",
+                encoding="utf-8",
+            )
+            timings_path = str(root / "timings.json")
+            shard.save_timings(timings_path, {"gate_a_smoke:case-0": 30.0, "gate_a_smoke:case-1": 20.0})
+            seen = []
+
+            def impl(case, _repo_root):
+                seen.append(case["id"])
+                return {"pass": case["id"] != "case-1", "details": ["stale tag"]}
+
+            outputs = []
+            with patch("runner.run_repo_checks.check_gate_a_smoke_impl", side_effect=impl):
+                for spec in ("1/2", "2/2"):
+                    passed, details = run_repo_checks.check_gate_a_smoke(str(root), spec, timings_path)
+                    outputs.append({"check": "gate_a_smoke", "repo": tmp, "pass": passed, "details": details,
+                                    "shard": spec})
+
+        self.assertEqual(sorted(seen), ["case-0", "case-1", "case-2", "case-3"])
+        self.assertEqual([len(output["details"]) for output in outputs], [1, 1])
+        merged = shard.merge(outputs[::-1])
+        self.assertFalse(merged["pass"])
+        self.assertEqual(merged["details"], [
+            "case 5: invalid JSON: Expecting value: line 1 column 1 (char 0)",
+            {"case": "case-1", "details": ["stale tag"]},
+        ])
+
+    def test_multi_check_shards_merge_into_one_report(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            outputs = []
+            env = {"AAA_EVALS_CACHE_DIR": str(Path(tmp) / "cache")}
+            with patch.dict(os.environ, env):
+                for spec in ("1/2", "2/2"):
+                    argv = ["run_repo_checks.py", "--check", "readme,post_init_audit_required,workflow",
+                            "--repo", tmp, "--shard", spec]
+                    with patch("sys.argv", argv), patch("builtins.print") as printed:
+                        run_repo_checks.main()
+                    outputs.append(json.loads(printed.call_args[0][0]))
+                merged = shard.merge(outputs)
+                shard.save_timings("", merged["timings"])
+                timings = shard.load_timings()
+
+        self.assertEqual(sorted(check for output in outputs for check in output["checks"]),
+                         ["post_init_audit_required", "readme", "workflow"])
+        self.assertEqual(sorted(timings), ["post_init_audit_required", "readme", "workflow"])
+        self.assertEqual(merged["checks"], ["post_init_audit_required", "readme", "workflow"])
+        self.assertEqual(merged["summary"]["total"], 3)
+        self.assertEqual(merged, shard.merge(outputs[::-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
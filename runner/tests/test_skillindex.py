@@ -0,0 +1,46 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from runner import cache
+from runner.run_repo_checks import SKILL_REQUIRED_SECTIONS, check_skill_structure_v2, check_skills
+
+
+def _write_skill(root, bucket, name, body=None):
+    skill = root / "skills" / bucket / name
+    skill.mkdir(parents=True)
+    if body is not None:
+        (skill / "SKILL.md").write_text(body, encoding="utf-8")
+
+
+class TestSkillIndex(unittest.TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_structure_check_covers_every_bucket(self):
+        complete = "\n".join(SKILL_REQUIRED_SECTIONS) + "\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_skill(root, "common", "aaa-ok", complete)
+            _write_skill(root, "codex", "aaa-partial", "## Routing Logic\nmentions ## Fallback inline\n")
+            _write_skill(root, "agent", "local-notes", "no headings\n")
+            ok, details = check_skill_structure_v2(tmp, "skills")
+            self.assertFalse(ok)
+            self.assertEqual(len(details), 1)
+            self.assertTrue(details[0].startswith("skills/codex/aaa-partial: missing ## Execution Steps"))
+            self.assertIn("## Fallback", details[0])
+
+    def test_presence_check_reports_missing_skill_files_and_buckets(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "agent.yaml").write_text("name: x\n", encoding="utf-8")
+            _write_skill(root, "common", "aaa-ok", "# ok\n")
+            _write_skill(root, "common", "aaa-empty")
+            _write_skill(root, "codex", "aaa-ok", "# ok\n")
+            ok, details = check_skills(tmp, "skills")
+            self.assertFalse(ok)
+            self.assertEqual(details, ["skills/common/aaa-empty/SKILL.md missing", "skills/agent missing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
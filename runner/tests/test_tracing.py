@@ -0,0 +1,53 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from runner import tracing
+
+
+class TestTracing(unittest.TestCase):
+    def tearDown(self):
+        tracing.configure()
+
+    def test_spans_are_noop_when_disabled(self):
+        tracing.configure()
+        with tracing.span("readme"):
+            pass
+        self.assertFalse(tracing.enabled())
+        self.assertEqual(tracing.events(), [])
+
+    def test_nested_spans_written_as_trace_events(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            trace_path = Path(tmp) / "trace.json"
+            tracing.configure(str(trace_path), process_name="test")
+            with tracing.span("gate_a_smoke", cat="check"):
+                with tracing.span("case-1", cat="case"):
+                    with tracing.span("git ls-remote", cat="subprocess", repo="org/repo"):
+                        pass
+            tracing.flush()
+
+            payload = json.loads(trace_path.read_text(encoding="utf-8"))
+            spans = {event["name"]: event for event in payload["traceEvents"] if event["ph"] == "X"}
+            self.assertEqual(set(spans), {"gate_a_smoke", "case-1", "git ls-remote"})
+            outer, inner = spans["gate_a_smoke"], spans["git ls-remote"]
+            self.assertLessEqual(outer["ts"], inner["ts"])
+            self.assertGreaterEqual(outer["ts"] + outer["dur"], inner["ts"] + inner["dur"])
+            self.assertEqual(inner["args"], {"repo": "org/repo"})
+
+    def test_profile_dumps_pstats_per_check(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tracing.configure(profile_out=tmp)
+            with tracing.profile("readme"):
+                sum(range(100))
+            with tracing.profile("workflow"):
+                with tracing.profile("nested"):
+                    sum(range(100))
+            tracing.flush()
+
+            dumped = sorted(path.name for path in Path(tmp).iterdir())
+            self.assertEqual(dumped, ["readme.pstats", "workflow.pstats"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import errno
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import registry, run_repo_checks, watch
+
+
+class TestWatch(unittest.TestCase):
+    def test_changed_paths_map_to_affected_checks(self):
+        args = run_repo_checks.request_args({"repo": "/ws"})
+        cases = {
+            "/ws/aaa-tpl-docs/docs/new-project-sop.md": {"cli_contract_sync", "onboarding_command_integrity"},
+            "/ws/runbooks/ops/sample.yaml": {"runbook_checksums"},
+            "/ws/aaa-tools/runbooks/repo/init.yaml": {"runbook_schema_validate"},
+            "/ws/skills/codex/aaa-x/SKILL.md": {"skills", "skill_structure_v2"},
+            "/ws/aaa-tools/docs/adrs/001.md": {"orphaned_assets"},
+        }
+        for path, expected in cases.items():
+            affected = set(registry.affected_checks([path], args))
+            self.assertTrue(expected <= affected, (path, affected))
+        self.assertEqual(registry.affected_checks(["/ws/src/main.py"], args), [])
+
+    def test_selection_restricts_affected_checks(self):
+        args = run_repo_checks.request_args({"repo": "/ws"})
+        affected = registry.affected_checks(
+            ["/ws/aaa-tpl-docs/docs/new-project-sop.md"], args, ["cli_contract_sync", "readme"]
+        )
+        self.assertEqual(affected, ["cli_contract_sync"])
+
+    def test_watch_limit_after_startup_falls_back_to_polling(self):
+        class _Exhausted:
+            closed = False
+
+            def __init__(self, events):
+                self.events = events
+
+            def read(self, timeout):
+                return self.events.pop(0) if self.events else []
+
+            def add(self, directory):
+                raise OSError(errno.ENOSPC, "inotify_add_watch failed")
+
+            def close(self):
+                self.closed = True
+
+        with tempfile.TemporaryDirectory() as tmp:
+            new_dir = Path(tmp) / "docs"
+            new_dir.mkdir()
+            (new_dir / "guide.md").write_text("x", encoding="utf-8")
+            watcher = _Exhausted([[(str(new_dir), watch.IN_CREATE | watch.IN_ISDIR)]])
+            with patch.object(watch, "poll_changes", return_value=iter([{"polled"}])) as poll:
+                changes = watch.inotify_changes(tmp, watcher, interval=0.01)
+                self.assertEqual(next(changes), {str(new_dir), str(new_dir / "guide.md")})
+                self.assertEqual(next(changes), {"polled"})
+            poll.assert_called_once_with(tmp, 0.01)
+            self.assertTrue(watcher.closed)
+
+    def test_poll_changes_reports_modified_and_new_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "README.md").write_text("a", encoding="utf-8")
+            (root / ".git").mkdir()
+            changes = watch.poll_changes(tmp, interval=0.01)
+            result = {}
+
+            def _consume():
+                result["changed"] = next(changes)
+
+            thread = threading.Thread(target=_consume)
+            thread.start()
+            time.sleep(0.2)
+            (root / ".git" / "HEAD").write_text("ref", encoding="utf-8")
+            (root / "CODEOWNERS").write_text("* @aaa/qa", encoding="utf-8")
+            thread.join(timeout=5)
+            self.assertEqual(result["changed"], {os.path.join(tmp, "CODEOWNERS")})
+
+
+if __name__ == "__main__":
+    unittest.main()
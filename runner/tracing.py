@@ -0,0 +1,103 @@
+"""Chrome trace-event spans and per-check cProfile dumps for runner executions."""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+_lock = threading.Lock()
+_origin = time.perf_counter()
+_trace_path: Path | None = None
+_events: list[dict[str, Any]] | None = None
+_profile_dir: Path | None = None
+_profilers: dict[str, cProfile.Profile] = {}
+_profiling = False
+
+
+def configure(trace_out: str = "", profile_out: str = "", process_name: str = "") -> None:
+    global _trace_path, _events, _profile_dir
+    _trace_path = Path(trace_out) if trace_out else None
+    _events = [] if trace_out else None
+    _profile_dir = Path(profile_out) if profile_out else None
+    _profilers.clear()
+    if _events is not None and process_name:
+        _events.append(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": {"name": process_name},
+            }
+        )
+
+
+def enabled() -> bool:
+    return _events is not None
+
+
+def events() -> list[dict[str, Any]]:
+    with _lock:
+        return list(_events or [])
+
+
+@contextmanager
+def span(name: str, cat: str = "check", **args: Any) -> Iterator[None]:
+    if _events is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": round((start - _origin) * 1_000_000, 3),
+            "dur": round((end - start) * 1_000_000, 3),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {key: str(value) for key, value in args.items()},
+        }
+        with _lock:
+            if _events is not None:
+                _events.append(event)
+
+
+@contextmanager
+def profile(name: str) -> Iterator[None]:
+    # cProfile allows a single active profiler per process, so nested or
+    # concurrent checks are accounted to the outermost profiled check.
+    global _profiling
+    with _lock:
+        active = _profile_dir is not None and not _profiling
+        if active:
+            _profiling = True
+            profiler = _profilers.setdefault(name, cProfile.Profile())
+    if not active:
+        yield
+        return
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        with _lock:
+            _profiling = False
+
+
+def flush() -> None:
+    if _trace_path is not None and _events is not None:
+        _trace_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"traceEvents": events(), "displayTimeUnit": "ms"}
+        _trace_path.write_text(json.dumps(payload, ensure_ascii=True), encoding="utf-8")
+    if _profile_dir is not None:
+        _profile_dir.mkdir(parents=True, exist_ok=True)
+        for name, profiler in sorted(_profilers.items()):
+            profiler.dump_stats(str(_profile_dir / f"{name}.pstats"))
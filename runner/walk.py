@@ -0,0 +1,70 @@
+"""Workspace traversal that skips VCS metadata, virtualenvs and tool scratch directories."""
+
+import os
+import re
+from functools import lru_cache
+from typing import Iterator
+
+PRUNED_DIRS = {
+    ".git",
+    ".venv",
+    ".venv-aaa",
+    ".aaa-tmp",
+    ".worktrees",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    "__pycache__",
+    "node_modules",
+    "venv",
+}
+
+
+def walk_dirs(root: str) -> Iterator[str]:
+    for current, dirs, _files in os.walk(root):
+        dirs[:] = sorted(name for name in dirs if name not in PRUNED_DIRS)
+        yield current
+
+
+def iter_files(root: str, suffixes: tuple[str, ...] = ()) -> Iterator[os.DirEntry]:
+    for current in walk_dirs(root):
+        try:
+            entries = sorted(os.scandir(current), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if suffixes and not entry.name.endswith(suffixes):
+                continue
+            try:
+                if entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+
+
+@lru_cache(maxsize=256)
+def _glob_regex(pattern: str) -> re.Pattern[str]:
+    parts = []
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+        elif pattern[index] == "*":
+            parts.append("[^/]*")
+            index += 1
+        elif pattern[index] == "?":
+            parts.append("[^/]")
+            index += 1
+        else:
+            parts.append(re.escape(pattern[index]))
+            index += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+def glob_match(pattern: str, path: str) -> bool:
+    """Match a POSIX path against a glob where ``**`` spans directories and ``*`` does not."""
+    return _glob_regex(pattern).match(path) is not None
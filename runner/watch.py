@@ -0,0 +1,175 @@
+"""Watch mode: re-run only the checks whose declared inputs changed.
+
+Uses inotify on Linux (through libc, no extra dependency) and falls back to
+stat polling elsewhere or when inotify watches are exhausted, at startup or
+while watching directories created later.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import json
+import os
+import select
+import struct
+import sys
+import time
+from argparse import Namespace
+from typing import Any, Iterator
+
+from runner import registry
+from runner.walk import PRUNED_DIRS, iter_files, walk_dirs
+
+DEBOUNCE_SECONDS = 0.1
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def snapshot(root: str) -> dict[str, tuple[int, int]]:
+    state = {}
+    for entry in iter_files(root):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        state[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def poll_changes(root: str, interval: float = 0.5) -> Iterator[set[str]]:
+    previous = snapshot(root)
+    while True:
+        time.sleep(interval)
+        current = snapshot(root)
+        changed = {path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)}
+        previous = current
+        if changed:
+            yield changed
+
+
+class _Inotify:
+    def __init__(self, root: str):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError(errno.ENOSYS, "inotify not available")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths: dict[int, str] = {}
+        try:
+            for directory in walk_dirs(root):
+                self.add(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def add(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            code = ctypes.get_errno()
+            if code in (errno.ENOENT, errno.EACCES):
+                return
+            raise OSError(code, f"inotify_add_watch failed for {directory}")
+        self.paths[wd] = directory
+
+    def read(self, timeout: float | None) -> list[tuple[str, int]]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                events.append(("", IN_Q_OVERFLOW))
+                continue
+            directory = self.paths.get(wd)
+            if directory is None:
+                continue
+            events.append((os.path.join(directory, os.fsdecode(name)) if name else directory, mask))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def inotify_changes(root: str, watcher: _Inotify, interval: float = 0.5) -> Iterator[set[str]]:
+    exhausted = None
+    try:
+        while exhausted is None:
+            changed: set[str] = set()
+            timeout = None
+            while exhausted is None:
+                events = watcher.read(timeout)
+                if not events:
+                    break
+                for path, mask in events:
+                    if mask & IN_Q_OVERFLOW:
+                        # Events were dropped; fall back to treating every file as changed.
+                        changed.update(snapshot(root))
+                        continue
+                    name = os.path.basename(path)
+                    if mask & IN_ISDIR:
+                        if mask & (IN_CREATE | IN_MOVED_TO) and name not in PRUNED_DIRS:
+                            try:
+                                for directory in walk_dirs(path):
+                                    watcher.add(directory)
+                            except OSError as exc:  # e.g. ENOSPC once the inotify watch limit is reached
+                                exhausted = exc
+                                changed.update(snapshot(path))
+                        changed.add(path)
+                        continue
+                    if mask & IN_DELETE_SELF:
+                        continue
+                    changed.add(path)
+                timeout = DEBOUNCE_SECONDS
+            if changed:
+                yield changed
+    finally:
+        watcher.close()
+    print(f"watch: inotify unavailable ({exhausted}); polling every {interval}s", file=sys.stderr)
+    yield from poll_changes(root, interval)
+
+
+def iter_changes(root: str, interval: float = 0.5) -> Iterator[set[str]]:
+    try:
+        watcher = _Inotify(root)
+    except OSError as exc:
+        print(f"watch: inotify unavailable ({exc}); polling every {interval}s", file=sys.stderr)
+        return poll_changes(root, interval)
+    return inotify_changes(root, watcher, interval)
+
+
+def watch(args: Namespace, selected: list[str] | None, execute: Any) -> None:
+    root = os.path.abspath(args.repo)
+    print(f"watch: monitoring {root}", file=sys.stderr, flush=True)
+    for changed in iter_changes(root, args.watch_interval):
+        for name in registry.affected_checks(changed, args, selected):
+            request = Namespace(**{**vars(args), "check": name})
+            try:
+                output = execute(request)
+            except Exception as exc:  # keep watching after a crashing check
+                output = {"check": name, "repo": root, "error": f"{type(exc).__name__}: {exc}"}
+            print(json.dumps(output, ensure_ascii=True), flush=True)
@@ -0,0 +1,212 @@
+"""Parsed GitHub Actions workflow model shared by workflow checks.
+
+Each workflow file is parsed once into jobs and steps with their ``uses``
+references, ``if`` conditions and ``run`` commands. Models are cached by the
+SHA-256 of the file content, so unchanged workflows are never re-parsed and
+checks query the model instead of scanning raw text.
+
+The parser covers the block-style YAML subset workflows are written in
+(mappings, sequences, plain/quoted scalars, ``|``/``>`` block scalars);
+flow collections are kept as raw strings. It needs no YAML dependency.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Iterator
+
+from runner import cache
+
+MAX_MODELS = 256
+STEP_KEYS = ("name", "id", "uses", "if", "run")
+
+_KEY_RE = re.compile(r"""^("[^"]*"|'[^']*'|[^\s"'#][^:#]*?)\s*:(?:\s+(.*))?$""")
+_BLOCK_SCALARS = {"|", "|-", "|+", ">", ">-", ">+"}
+
+_lock = threading.Lock()
+_models: "OrderedDict[str, dict[str, Any]]" = OrderedDict()
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def _strip_comment(raw: str) -> str:
+    """Drop a trailing `` #`` comment; a ``#`` inside quotes is part of the value."""
+    quote = ""
+    for index, char in enumerate(raw):
+        if quote:
+            if char == quote:
+                quote = ""
+        elif char in "\"'":
+            quote = char
+        elif char == "#" and index and raw[index - 1] in " \t":
+            return raw[:index].rstrip()
+    return raw
+
+
+def _scalar(raw: str) -> str:
+    raw = _strip_comment(raw.strip())
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in "\"'":
+        return raw[1:-1]
+    return raw
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.lines = text.expandtabs(2).splitlines()
+
+    def _next(self, pos: int) -> int:
+        while pos < len(self.lines):
+            stripped = self.lines[pos].strip()
+            if stripped and not stripped.startswith("#") and stripped != "---":
+                return pos
+            pos += 1
+        return pos
+
+    def node(self, pos: int) -> tuple[Any, int]:
+        pos = self._next(pos)
+        if pos >= len(self.lines):
+            return None, pos
+        line = self.lines[pos]
+        stripped = line.strip()
+        if stripped == "-" or stripped.startswith("- "):
+            return self._sequence(pos, _indent(line))
+        return self._mapping(pos, _indent(line))
+
+    def _value(self, rest: str, pos: int, indent: int) -> tuple[Any, int]:
+        rest = _scalar(rest) if rest else ""
+        if rest in _BLOCK_SCALARS:
+            return self._block_scalar(pos + 1, indent, rest.startswith(">"))
+        if rest:
+            return rest, pos + 1
+        nxt = self._next(pos + 1)
+        if nxt < len(self.lines):
+            line = self.lines[nxt]
+            if _indent(line) > indent or (_indent(line) == indent and line.strip().startswith("-")):
+                return self.node(nxt)
+        return None, pos + 1
+
+    def _mapping(self, pos: int, indent: int) -> tuple[dict[str, Any], int]:
+        result: dict[str, Any] = {}
+        while True:
+            pos = self._next(pos)
+            if pos >= len(self.lines):
+                break
+            line = self.lines[pos]
+            current = _indent(line)
+            stripped = line.strip()
+            if current < indent or (current == indent and stripped.startswith("-")):
+                break
+            match = _KEY_RE.match(stripped) if current == indent else None
+            if match is None:
+                pos += 1
+                continue
+            key = _scalar(match.group(1))
+            result[key], pos = self._value(match.group(2) or "", pos, indent)
+        return result, pos
+
+    def _sequence(self, pos: int, indent: int) -> tuple[list[Any], int]:
+        items: list[Any] = []
+        while True:
+            pos = self._next(pos)
+            if pos >= len(self.lines):
+                break
+            line = self.lines[pos]
+            stripped = line.strip()
+            if _indent(line) != indent or not (stripped == "-" or stripped.startswith("- ")):
+                break
+            rest = stripped[1:].strip()
+            if not rest:
+                item, pos = self._value("", pos, indent)
+            elif _KEY_RE.match(rest):
+                # "- key: value" opens a mapping aligned with its first key.
+                column = indent + len(stripped) - len(rest)
+                self.lines[pos] = " " * column + rest
+                item, pos = self._mapping(pos, column)
+            else:
+                item, pos = _scalar(rest), pos + 1
+            items.append(item)
+        return items, pos
+
+    def _block_scalar(self, pos: int, indent: int, folded: bool) -> tuple[str, int]:
+        collected = []
+        block_indent = None
+        while pos < len(self.lines):
+            line = self.lines[pos]
+            if line.strip():
+                if _indent(line) <= indent:
+                    break
+                if block_indent is None:
+                    block_indent = _indent(line)
+                collected.append(line[block_indent:])
+            else:
+                collected.append("")
+            pos += 1
+        while collected and not collected[-1]:
+            collected.pop()
+        return (" " if folded else "\n").join(collected), pos
+
+
+def parse_yaml(text: str) -> Any:
+    return _Parser(text).node(0)[0]
+
+
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def build_model(text: str) -> dict[str, Any]:
+    tree = parse_yaml(text)
+    tree = tree if isinstance(tree, dict) else {}
+    jobs = []
+    raw_jobs = tree.get("jobs")
+    for job_id, job in (raw_jobs.items() if isinstance(raw_jobs, dict) else ()):
+        job = job if isinstance(job, dict) else {}
+        raw_steps = job.get("steps")
+        steps = [
+            {key: _text(step.get(key)) for key in STEP_KEYS}
+            for step in (raw_steps if isinstance(raw_steps, list) else ())
+            if isinstance(step, dict)
+        ]
+        jobs.append(
+            {
+                "id": job_id,
+                "name": _text(job.get("name")),
+                "uses": _text(job.get("uses")),
+                "if": _text(job.get("if")),
+                "steps": steps,
+            }
+        )
+    return {"name": _text(tree.get("name")), "jobs": jobs}
+
+
+def load(path: Any) -> dict[str, Any]:
+    """Workflow model for ``path``, parsed at most once per distinct file content."""
+    text = cache.read_text(path)
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    with _lock:
+        model = _models.get(digest)
+        if model is not None:
+            _models.move_to_end(digest)
+            return model
+    model = build_model(text)
+    with _lock:
+        _models[digest] = model
+        while len(_models) > MAX_MODELS:
+            _models.popitem(last=False)
+    return model
+
+
+def iter_steps(model: dict[str, Any]) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    for job in model["jobs"]:
+        for step in job["steps"]:
+            yield job, step
+
+
+def uses_refs(model: dict[str, Any]) -> list[str]:
+    """Every reusable-workflow and action reference, job-level first."""
+    refs = [job["uses"] for job in model["jobs"] if job["uses"]]
+    refs.extend(step["uses"] for _job, step in iter_steps(model) if step["uses"])
+    return refs